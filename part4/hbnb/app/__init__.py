@@ -4,11 +4,11 @@ Flask application factory for HBnB API.
 Initializes Flask extensions (SQLAlchemy, JWT, Bcrypt), registers API namespaces, and configures error handlers.
 """
 
-from flask import Flask, jsonify
+from flask import Flask, jsonify, current_app
 from flask_restx import Api
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
-from flask_jwt_extended.exceptions import NoAuthorizationError
+from flask_jwt_extended.exceptions import JWTExtendedException, NoAuthorizationError
 from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
@@ -21,8 +21,145 @@ bcrypt = Bcrypt()  # Password hashing (bcrypt algorithm)
 jwt = JWTManager()  # JWT token management (authentication)
 db = SQLAlchemy()  # ORM for database operations
 
-# Facade will be imported after db is initialized to avoid circular imports
-facade = None
+# ========================================
+# Facade (shared business layer, app-independent)
+# ========================================
+# Created after db/bcrypt so that models and repositories can import them
+from app.services.facade import HBnBFacade  # noqa: E402
+from app.services.json_provider import OrjsonProvider, output_json  # noqa: E402
+from app.services.redis_client import init_redis  # noqa: E402
+from app.services.token_blocklist import is_token_revoked  # noqa: E402
+facade = HBnBFacade()
+
+
+# ========================================
+# Configure JWT authorization in Swagger UI (module-level constant)
+# ========================================
+_AUTHORIZATIONS = {
+    'Bearer': {
+        'type': 'apiKey',
+        'in': 'header',
+        'name': 'Authorization',
+        'description': "Type in the *'Value'* input box below: **'Bearer &lt;JWT&gt;'**, where JWT is the token"
+    }
+}
+
+# ========================================
+# Flask-RESTX API with Swagger documentation (built once, bound in create_app)
+# ========================================
+# Named rest_api: 'api' would be shadowed by the app.api subpackage import
+rest_api = Api(
+    version='1.0',
+    title='HBnB API',
+    description='A simple API for HBnB by Loic & Val',
+    doc='/',  # Swagger UI available at root path
+    authorizations=_AUTHORIZATIONS,  # Enable JWT auth in Swagger UI
+    security='Bearer',  # Apply Bearer auth globally
+    # Marshal into plain dicts (insertion-ordered since Python 3.7);
+    # ordered=True would build an OrderedDict for every marshalled object
+    ordered=False
+)
+
+# Serialize every Resource response with orjson instead of the json module
+rest_api.representations['application/json'] = output_json
+
+# ========================================
+# GLOBAL ERROR HANDLERS (Flask-RESTX + PyJWT)
+# ========================================
+
+
+@rest_api.errorhandler(ExpiredSignatureError)
+def handle_expired_signature(_error):
+    """
+    Handle expired JWT tokens from PyJWT library (401 Unauthorized).
+    Catches errors raised by jwt.decode() when token exp has passed.
+    """
+    return {
+        'error': 'Expired token',
+        'message': 'The token has expired. Please login again.'
+    }, 401
+
+
+@rest_api.errorhandler(InvalidTokenError)
+def handle_invalid_token(_error):
+    """
+    Handle invalid JWT tokens from PyJWT library (401 Unauthorized).
+    Catches errors raised by jwt.decode() when signature verification fails.
+    """
+    return {
+        'error': 'Invalid token',
+        'message': 'Signature verification failed or token is malformed.'
+    }, 401
+
+
+@rest_api.errorhandler(NoAuthorizationError)
+def handle_no_authorization(_error):
+    """
+    Handle missing authorization header (401 Unauthorized).
+    Catches errors raised by @jwt_required decorator when header is missing.
+    """
+    return {
+        'error': 'Missing Authorization Header',
+        'message': 'Request does not contain a valid access token.'
+    }, 401
+
+
+@rest_api.errorhandler
+def handle_unexpected_error(error):
+    """
+    Default handler for exceptions no other handler matched (500 Internal Server Error).
+    Endpoints no longer wrap their body in `except Exception`: unexpected errors
+    end up here once. Flask-RESTX logs the traceback for every 5xx response.
+    JWT errors are re-raised so Flask-JWT-Extended's loaders build the 401.
+    """
+    if isinstance(error, JWTExtendedException):
+        raise error
+    return {
+        'error': 'Internal server error',
+        'message': 'An unexpected error occurred.'
+    }, 500
+
+
+# ========================================
+# Register API namespaces (once, at import time)
+# ========================================
+# Namespaces import the facade above, so they are imported after it
+# restx_patches first: models must drop their cached resolution if mutated
+from .api import restx_patches  # noqa: E402,F401
+from .api.v1.users import users_ns  # noqa: E402
+from .api.v1.places import places_ns  # noqa: E402
+from .api.v1.reviews import reviews_ns  # noqa: E402
+from .api.v1.amenities import amenities_ns  # noqa: E402
+from .api.v1.auth import auth_ns  # noqa: E402
+
+# (namespace, URL prefix) pairs
+NAMESPACES = (
+    (users_ns, '/api/v1/users'),
+    (places_ns, '/api/v1/places'),
+    (reviews_ns, '/api/v1'),
+    (amenities_ns, '/api/v1/amenities'),
+    (auth_ns, '/api/v1/auth'),
+)
+
+# Add namespaces to API with URL prefixes
+for namespace, path in NAMESPACES:
+    rest_api.add_namespace(namespace, path=path)
+    # Resolve marshalling models now (Model.resolved deep-copies the field
+    # tree once and caches it) and build their validation schemas (cached
+    # by restx_patches): the first request no longer pays for either
+    for model in namespace.models.values():
+        getattr(model, 'resolved', None)
+        getattr(model, '__schema__', None)
+
+
+def hash_token(token):
+    """
+    Hash a short-lived token (not a password) with a cheaper bcrypt work factor.
+    Args: token (str): Token to hash
+    Returns: str: Bcrypt hash using BCRYPT_TOKEN_LOG_ROUNDS
+    """
+    rounds = current_app.config.get('BCRYPT_TOKEN_LOG_ROUNDS', 6)
+    return bcrypt.generate_password_hash(token, rounds=rounds).decode('utf-8')
 
 
 def create_app(config_class=DevelopmentConfig):
@@ -33,6 +170,9 @@ def create_app(config_class=DevelopmentConfig):
     """
     app = Flask(__name__)
     app.config.from_object(config_class)
+    
+    # orjson for jsonify() / request.get_json()
+    app.json = OrjsonProvider(app)
 
     # ========================================
     # ⭐ CONFIGURE CORS - AJOUTEZ CES LIGNES ICI ⭐
@@ -42,30 +182,72 @@ def create_app(config_class=DevelopmentConfig):
     # ========================================
     # Initialize extensions with app context
     # ========================================
+    app.config.setdefault('BCRYPT_LOG_ROUNDS', 12)
+    app.config.setdefault('BCRYPT_TOKEN_LOG_ROUNDS', 6)
     bcrypt.init_app(app)
     jwt.init_app(app)
     db.init_app(app)
+    init_redis(app)  # Optional Redis (JWT revocation list, response cache)
+
+    # ========================================
+    # Warm up bcrypt (one-time setup cost paid at boot)
+    # ========================================
+    # Hash a dummy password once so the first login of each worker
+    # does not pay the one-time setup cost
+    bcrypt.generate_password_hash('warmup', rounds=app.config['BCRYPT_LOG_ROUNDS'])
 
     # ========================================
-    # Create database tables (development only)
+    # Database schema CLI command (flask init-db)
     # ========================================
-    with app.app_context():
+    # Tables are NOT created at startup anymore: workers boot without
+    # the CREATE TABLE IF NOT EXISTS probes. Run once per deployment
+    # (also upgrades the tables of an existing database to the models):
+    #     flask --app run init-db
+    @app.cli.command('init-db')
+    def init_db_command():
+        """Create missing tables and upgrade existing ones to the models."""
         # Import models so SQLAlchemy knows about them
         from app.models.user import User
         from app.models.place import Place
         from app.models.amenity import Amenity
         from app.models.review import Review
         
-        # Create all tables if they don't exist
+        from app.persistence.schema import upgrade_schema
+        
         db.create_all()
-    
+        print('Database tables created.')
+        for change in upgrade_schema():
+            print(f'Upgraded {change}')
+
     # ========================================
-    # Initialize facade after app context is created
+    # Review write queue flusher (flask flush-review-queue)
     # ========================================
-    global facade
-    from app.services.facade import HBnBFacade
-    facade = HBnBFacade()
-
+    # Background process of the review write queue (REVIEW_WRITE_QUEUE):
+    #     flask --app run flush-review-queue
+    @app.cli.command('flush-review-queue')
+    def flush_review_queue_command():
+        """Insert queued reviews in batches until interrupted."""
+        from app.api.v1.reviews import invalidate_review_lists
+        from app.services import review_queue
+        from app.services.redis_client import get_redis
+        
+        if get_redis() is None:
+            print('Redis is not configured (REDIS_URL): nothing to flush.')
+            return
+        while True:
+            rows = review_queue.pop_review_batch()
+            if not rows:
+                continue
+            try:
+                inserted = facade.insert_queued_reviews(rows)
+            except Exception:
+                # Database unavailable: keep the batch for the next attempt
+                review_queue.requeue_reviews(rows)
+                raise
+            review_queue.release_pending(rows)
+            for place_id in {row['place_id'] for row in inserted}:
+                invalidate_review_lists(place_id)
+    
     # ========================================
     # JWT ERROR HANDLERS (Flask-JWT-Extended)
     # ========================================
@@ -103,11 +285,19 @@ def create_app(config_class=DevelopmentConfig):
             'message': 'Request does not contain a valid access token.'
         }), 401
 
+    @jwt.token_in_blocklist_loader
+    def check_if_token_revoked(_jwt_header, jwt_payload):
+        """
+        Check the JWT revocation list (Redis EXISTS or in-process dict, no SQL).
+        Triggered on every protected request; a revoked token gets a 401.
+        """
+        return is_token_revoked(jwt_payload['jti'])
+
     @jwt.revoked_token_loader
     def revoked_token_callback(_jwt_header, _jwt_payload):
         """
         Handle revoked JWT tokens (401 Unauthorized).
-        Triggered when token is in revocation list (if implemented).
+        Triggered when token is in revocation list (see /auth/logout).
         """
         return jsonify({
             'error': 'Revoked token',
@@ -115,81 +305,8 @@ def create_app(config_class=DevelopmentConfig):
         }), 401
 
     # ========================================
-    # Configure JWT authorization in Swagger UI
-    # ========================================
-    authorizations = {
-        'Bearer': {
-            'type': 'apiKey',
-            'in': 'header',
-            'name': 'Authorization',
-            'description': "Type in the *'Value'* input box below: **'Bearer &lt;JWT&gt;'**, where JWT is the token"
-        }
-    }
-
-    # ========================================
-    # Initialize Flask-RESTX API with Swagger documentation
-    # ========================================
-    api = Api(
-        app,
-        version='1.0',
-        title='HBnB API',
-        description='A simple API for HBnB by Loic & Val',
-        doc='/',  # Swagger UI available at root path
-        authorizations=authorizations,  # Enable JWT auth in Swagger UI
-        security='Bearer'  # Apply Bearer auth globally
-    )
-
-    # ========================================
-    # GLOBAL ERROR HANDLERS (Flask-RESTX + PyJWT)
+    # Bind the API (namespaces already registered at import time)
     # ========================================
-    
-    @api.errorhandler(ExpiredSignatureError)
-    def handle_expired_signature(_error):
-        """
-        Handle expired JWT tokens from PyJWT library (401 Unauthorized).
-        Catches errors raised by jwt.decode() when token exp has passed.
-        """
-        return {
-            'error': 'Expired token',
-            'message': 'The token has expired. Please login again.'
-        }, 401
+    rest_api.init_app(app)
 
-    @api.errorhandler(InvalidTokenError)
-    def handle_invalid_token(_error):
-        """
-        Handle invalid JWT tokens from PyJWT library (401 Unauthorized).
-        Catches errors raised by jwt.decode() when signature verification fails.
-        """
-        return {
-            'error': 'Invalid token',
-            'message': 'Signature verification failed or token is malformed.'
-        }, 401
-
-    @api.errorhandler(NoAuthorizationError)
-    def handle_no_authorization(_error):
-        """
-        Handle missing authorization header (401 Unauthorized).
-        Catches errors raised by @jwt_required decorator when header is missing.
-        """
-        return {
-            'error': 'Missing Authorization Header',
-            'message': 'Request does not contain a valid access token.'
-        }, 401
-
-    # ========================================
-    # Register API namespaces (route blueprints)
-    # ========================================
-    from .api.v1.users import users_ns
-    from .api.v1.places import places_ns
-    from .api.v1.reviews import reviews_ns
-    from .api.v1.amenities import amenities_ns
-    from .api.v1.auth import auth_ns
-
-    # Add namespaces to API with URL prefixes
-    api.add_namespace(users_ns, path='/api/v1/users')
-    api.add_namespace(places_ns, path='/api/v1/places')
-    api.add_namespace(reviews_ns, path='/api/v1')
-    api.add_namespace(amenities_ns, path='/api/v1/amenities')
-    api.add_namespace(auth_ns, path='/api/v1/auth')
-
-    return app
+    return app
\ No newline at end of file
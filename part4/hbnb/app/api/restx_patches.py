@@ -0,0 +1,219 @@
+#!/usr/bin/python3
+"""
+Flask-RESTX model resolution cache invalidation.
+
+Model.resolved (the deep copy of a model's fields used by marshal()) is a
+cached_property: it is built once per model, then reused by every
+marshal_with / marshal_list_with call and by every Nested field pointing
+to the model. app/__init__.py resolves all models when the namespaces are
+registered, so no request ever pays for the deep copy.
+
+A cached_property is never recomputed, though: a field added to a model
+after its first resolution would silently be missing from responses.
+This module drops the cached resolution whenever a model is mutated in
+place, so the next marshal() call resolves it again.
+
+Model.__schema__ (the JSON schema used by @expect(..., validate=True)),
+on the other hand, is a plain property: restx rebuilds it from the
+fields two or three times per validated request. This module caches it
+the same way (built once, dropped when the model is mutated).
+
+Model.validate() also builds a new jsonschema validator on every call
+(serializing the schema to look for $ref along the way). The validator is
+now compiled once per model and reused, with the same invalidation; the
+400 response (message + per-field errors) is unchanged.
+
+On top of it, flat input schemas (the request models: typed properties,
+required keys, simple constraints) are compiled into a plain Python
+check that accepts exactly the payloads jsonschema accepts. Valid payloads
+(the common case) only run that check; a payload it rejects, or a schema
+using any other keyword, goes through jsonschema, which also builds the
+error messages.
+
+Import it before the namespaces are defined.
+"""
+
+import re
+from http import HTTPStatus
+from flask_restx import Model, abort
+from jsonschema.validators import validator_for
+
+
+def _invalidating(method):
+    """Wrap a dict mutator so it drops the model's cached resolution"""
+    def wrapper(self, *args, **kwargs):
+        self.__dict__.pop('resolved', None)
+        self.__dict__.pop('_cached_schema', None)
+        self.__dict__.pop('_cached_validator', None)
+        return method(self, *args, **kwargs)
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in ('__setitem__', '__delitem__', 'update', 'pop', 'setdefault', 'clear'):
+    setattr(Model, _name, _invalidating(getattr(Model, _name)))
+
+
+# Uncached implementation (ModelBase.__schema__ property)
+_build_schema = Model.__schema__.fget
+
+
+def _cached_schema(self):
+    """JSON schema of the model, built once then reused until the model is mutated"""
+    schema = self.__dict__.get('_cached_schema')
+    if schema is None:
+        schema = self.__dict__['_cached_schema'] = _build_schema(self)
+    return schema
+
+
+Model.__schema__ = property(_cached_schema)
+
+
+def _build_validator(model, resolver, format_checker):
+    """
+    Compile the jsonschema validator of a model, as ModelBase.validate() does
+    (a schema with $ref gets the definitions of the API's registry inlined).
+    """
+    schema = model.__schema__
+    if resolver is None:
+        return validator_for(schema)(schema, format_checker=format_checker)
+    if _has_ref(schema):
+        definitions = {}
+        for uri in resolver:
+            resource = resolver[uri]
+            if isinstance(resource, dict) and 'definitions' in resource:
+                definitions.update(resource['definitions'])
+        if definitions:
+            schema = {
+                '$id': 'http://localhost/schema.json',
+                'definitions': definitions,
+                **schema,
+            }
+    return validator_for(schema)(schema, registry=resolver, format_checker=format_checker)
+
+
+def _has_ref(value):
+    """True if a schema (nested dicts/lists) contains a '$ref' key"""
+    if isinstance(value, dict):
+        return '$ref' in value or any(_has_ref(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_ref(v) for v in value)
+    return False
+
+
+# -----------------------
+# Fast path for flat schemas
+# -----------------------
+
+# Keywords without effect on validation
+_ANNOTATIONS = frozenset(('description', 'example', 'default', 'title', 'readOnly'))
+
+# Types as checked by the validator restx builds (validator_for(): the
+# schemas declare no $schema, so the latest draft): bool is not a number,
+# and a float with no fractional part (1.0) is an integer
+_TYPE_CHECKS = {
+    'string': lambda v: isinstance(v, str),
+    'number': lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    'integer': lambda v: (isinstance(v, int) and not isinstance(v, bool)
+                          or isinstance(v, float) and v.is_integer()),
+    'boolean': lambda v: isinstance(v, bool),
+    'array': lambda v: isinstance(v, list),
+    'object': lambda v: isinstance(v, dict),
+    'null': lambda v: v is None,
+}
+
+
+def _is_number(value):
+    """Numeric instance for minimum/maximum (bool excluded)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _compile_value_check(schema):
+    """
+    Compile the schema of one property into a predicate.
+    Returns: callable: value -> bool, or None if the schema uses a keyword
+             this fast path does not implement exactly
+    """
+    checks = []
+    for keyword, arg in schema.items():
+        if keyword in _ANNOTATIONS:
+            continue
+        if keyword == 'type' and arg in _TYPE_CHECKS:
+            checks.append(_TYPE_CHECKS[arg])
+        elif keyword == 'minLength':
+            checks.append(lambda v, n=arg: not isinstance(v, str) or len(v) >= n)
+        elif keyword == 'minimum':
+            checks.append(lambda v, n=arg: not _is_number(v) or v >= n)
+        elif keyword == 'maximum':
+            checks.append(lambda v, n=arg: not _is_number(v) or v <= n)
+        elif keyword == 'pattern':
+            search = re.compile(arg).search
+            checks.append(lambda v, search=search: not isinstance(v, str) or bool(search(v)))
+        elif keyword == 'items' and isinstance(arg, dict):
+            item_check = _compile_value_check(arg)
+            if item_check is None:
+                return None
+            checks.append(lambda v, ok=item_check: not isinstance(v, list) or all(map(ok, v)))
+        else:
+            return None
+    return lambda v: all(check(v) for check in checks)
+
+
+def _compile_fast_check(schema):
+    """
+    Compile a flat object schema (typed properties, required keys) into
+    a predicate telling whether a payload is valid.
+    Returns: callable: data -> bool, or None for any other kind of schema
+    """
+    if set(schema) - {'type', 'properties', 'required'} or schema.get('type') != 'object':
+        return None
+    required = tuple(schema.get('required', ()))
+    properties = []
+    for name, prop_schema in schema.get('properties', {}).items():
+        check = _compile_value_check(prop_schema)
+        if check is None:
+            return None
+        properties.append((name, check))
+
+    def fast_check(data):
+        if not isinstance(data, dict):
+            return False
+        for name in required:
+            if name not in data:
+                return False
+        for name, check in properties:
+            if name in data and not check(data[name]):
+                return False
+        return True
+    return fast_check
+
+
+def _cached_validate(self, data, resolver=None, format_checker=None):
+    """
+    Validate a payload with the model's compiled validator (built on first use
+    for a given registry/format checker, dropped when the model is mutated).
+    Valid payloads of flat schemas are accepted by the compiled fast check
+    alone (see _compile_fast_check()).
+    Raises: HTTPException: 400 with the per-field errors, as restx does
+    """
+    cached = self.__dict__.get('_cached_validator')
+    if cached is None or cached[0] is not resolver or cached[1] is not format_checker:
+        validator = _build_validator(self, resolver, format_checker)
+        fast_check = _compile_fast_check(self.__schema__)
+        cached = self.__dict__['_cached_validator'] = (
+            resolver, format_checker, validator, fast_check
+        )
+    if cached[3] is not None and cached[3](data):
+        return
+    # Single pass: an empty error list means the payload is valid
+    errors = dict(self.format_error(e) for e in cached[2].iter_errors(data))
+    if errors:
+        abort(
+            HTTPStatus.BAD_REQUEST,
+            message='Input payload validation failed',
+            errors=errors,
+        )
+
+
+Model.validate = _cached_validate
\ No newline at end of file
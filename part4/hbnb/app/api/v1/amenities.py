@@ -14,9 +14,14 @@ Routes:
 """
 
 from flask_restx import Namespace, Resource, fields
-from flask import request
+from flask import request, Response, stream_with_context
 from app import facade as facade_instance
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from app.services.facade import AmenityValidationError, DuplicateAmenityError
+from app.services.jwt_cache import current_is_admin, verify_jwt_in_request_cached
+from app.services.redis_client import get_redis
+from app.services.response_cache import (
+    cached_response, conditional_json_response, invalidate_responses
+)
 
 # Create a namespace for amenity-related operations
 amenities_ns = Namespace('amenities', description='Amenity operations')
@@ -30,6 +35,8 @@ amenities_ns = Namespace('amenities', description='Amenity operations')
 amenity_model = amenities_ns.model('AmenityInput', {
     'name': fields.String(
         required=True, 
+        min_length=1,     # Empty names are rejected by schema validation
+        pattern=r'\S',    # ...as well as whitespace-only names
         description='Name of the amenity (e.g., WiFi, Parking, Pool)'
     )
 })
@@ -43,12 +50,69 @@ amenity_response_model = amenities_ns.model('AmenityResponse', {
 })
 
 
+# -----------------------
+# Error handlers
+# -----------------------
+
+# Domain errors raised by the facade/model are mapped to HTTP responses here,
+# once, instead of by a try/except in every endpoint.
+# Note: flask-restx registers namespace error handlers on the whole API,
+# so only the amenity-specific exceptions are handled here: any other
+# ValueError (e.g. a bug elsewhere) still reaches the default 500 handler.
+
+@amenities_ns.errorhandler(DuplicateAmenityError)
+def handle_duplicate_amenity(error):
+    """Name already taken by another amenity (case-insensitive): 409"""
+    return {'message': f'Amenity "{error}" already exists'}, 409
+
+
+@amenities_ns.errorhandler(AmenityValidationError)
+def handle_amenity_validation_error(error):
+    """Invalid amenity input reported by the facade (name, protected field): 400"""
+    return {'message': str(error)}, 400
+
+
+# -----------------------
+# Authorization helpers
+# -----------------------
+
+class AdminWriteResource(Resource):
+    """
+    Resource whose write methods (POST/PUT/DELETE) are restricted to administrators.
+    
+    The JWT and the caller's admin role are checked in dispatch_request(), i.e.
+    BEFORE Flask-RESTX parses and validates the request body
+    (@expect(..., validate=True)), so rejected requests never pay for
+    JSON parsing and schema validation.
+    
+    The JWT claims are stored on flask.g (g.jwt_claims) so the handler
+    does not need to read them again.
+    """
+    
+    # HTTP method -> 403 error message
+    admin_methods = {
+        'POST': 'Only administrators can create amenities',
+        'PUT': 'Only administrators can update amenities',
+        'DELETE': 'Only administrators can delete amenities',
+    }
+    
+    def dispatch_request(self, *args, **kwargs):
+        message = self.admin_methods.get(request.method)
+        if message:
+            # Requires valid JWT token (verified claims are cached)
+            verify_jwt_in_request_cached()
+            # Requires admin role (resolved server-side, cached)
+            if not current_is_admin():
+                amenities_ns.abort(403, message)
+        return super().dispatch_request(*args, **kwargs)
+
+
 # -----------------------
 # API Routes
 # -----------------------
 
 @amenities_ns.route('/')
-class AmenityList(Resource):
+class AmenityList(AdminWriteResource):
     """
     Handles operations on the collection of amenities.
     
@@ -57,7 +121,6 @@ class AmenityList(Resource):
     - Listing all existing amenities (GET - PUBLIC)
     """
     
-    @jwt_required()  # Requires valid JWT token
     @amenities_ns.expect(amenity_model, validate=True)
     @amenities_ns.response(201, 'Amenity successfully created', amenity_response_model)
     @amenities_ns.response(400, 'Invalid input data')
@@ -80,43 +143,22 @@ class AmenityList(Resource):
             403: User is not an administrator
             409: Amenity with this name already exists
         """
-        # Get the current authenticated user's ID from the JWT token
-        current_user_id = get_jwt_identity()
-        
-        # Get additional claims from the JWT (e.g., admin status)
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
+        # Extract amenity data from request body (already validated by expect())
+        # Validation and duplicate errors are mapped by the namespace error handlers
+        amenity_data = request.get_json(cache=True)
         
-        # Check if user is admin
-        if not is_admin:
-            amenities_ns.abort(403, 'Only administrators can create amenities')
+        # Create the amenity in the database (single INSERT: duplicates
+        # are rejected by the unique index, no check-then-insert race)
+        new_amenity = facade_instance.create_amenity(amenity_data)
+        invalidate_responses('amenities:all')
         
-        try:
-            # Extract amenity data from request body
-            amenity_data = amenities_ns.payload
-            amenity_name = amenity_data.get('name', '').strip()
-            
-            # Check if amenity with this name already exists (case-insensitive)
-            existing_amenities = facade_instance.get_all_amenities()
-            for amenity in existing_amenities:
-                if amenity.name.lower() == amenity_name.lower():
-                    amenities_ns.abort(409, f'Amenity "{amenity_name}" already exists')
-            
-            # Create the amenity in the database
-            new_amenity = facade_instance.create_amenity(amenity_data)
-            
-            # Return the created amenity with 201 Created status
-            return new_amenity.to_dict(), 201
-            
-        except ValueError as e:
-            # Handle validation errors (e.g., missing required fields)
-            amenities_ns.abort(400, str(e))
-        except Exception as e:
-            # Handle unexpected errors
-            amenities_ns.abort(500, f"Internal error: {str(e)}")
+        # Return the created amenity with 201 Created status
+        # (payload serialized once by the model, no marshalling)
+        return Response(new_amenity.to_json(), status=201, mimetype='application/json')
 
-    @amenities_ns.marshal_list_with(amenity_response_model)
-    @amenities_ns.response(200, 'List of amenities retrieved successfully')
+    @cached_response('amenities:all')  # Public: served from Redis when available
+    @amenities_ns.response(200, 'List of amenities retrieved successfully', [amenity_response_model])
+    @amenities_ns.response(304, 'Not modified (If-None-Match matches the ETag)')
     def get(self):
         """
         Retrieve a list of all amenities.
@@ -124,19 +166,40 @@ class AmenityList(Resource):
         This is a PUBLIC endpoint - no authentication required.
         Returns all amenities in the system that can be selected when creating/updating places.
         
+        Performance:
+        - Amenities only change through admin writes, so the list is cached:
+          in Redis when configured (dropped by a write in any worker),
+          otherwise in the facade's memory (no SQL query on a cache hit),
+          rebuilt after a write in this worker and at least every 60 seconds
+        - Each amenity is serialized once on write (json_cache column), so the
+          cache is rebuilt by joining stored JSON strings, not by re-serializing
+        - On a cache miss the array is streamed while rows are read from the
+          database cursor (first bytes sent before the last row is fetched);
+          with Redis it is built whole instead, so it can be stored there
+        - Cached responses carry an ETag: a client sending a matching
+          If-None-Match gets an empty 304 Not Modified
+        
         Returns:
             200: List of all amenities with their details
         """
-        # Fetch all amenities from the database
-        amenities = facade_instance.get_all_amenities()
-        
-        # Convert each amenity object to a dictionary for JSON serialization
-        return [amenity.to_dict() for amenity in amenities]
+        cached, etag = facade_instance.get_cached_amenities_json()
+        if cached is not None:
+            return conditional_json_response(cached, etag)
+        if get_redis() is not None:
+            # Complete body: @cached_response stores it for every worker
+            # (streamed bodies are not cached)
+            return conditional_json_response(''.join(facade_instance.iter_all_amenities_json()))
+        # stream_with_context keeps the request (and DB session) alive while
+        # the generator runs, after this method has returned
+        return Response(
+            stream_with_context(facade_instance.iter_all_amenities_json()),
+            mimetype='application/json'
+        )
 
 
 @amenities_ns.route('/<string:amenity_id>')
 @amenities_ns.param('amenity_id', 'The Amenity identifier (UUID)')
-class AmenityResource(Resource):
+class AmenityResource(AdminWriteResource):
     """
     Handles operations on a single amenity resource.
     
@@ -146,8 +209,9 @@ class AmenityResource(Resource):
     - Deleting an amenity (DELETE - ADMIN ONLY)
     """
     
-    @amenities_ns.marshal_with(amenity_response_model)
-    @amenities_ns.response(200, 'Amenity details retrieved successfully')
+    @cached_response('amenities:{amenity_id}')  # Public: served from Redis when available
+    @amenities_ns.response(200, 'Amenity details retrieved successfully', amenity_response_model)
+    @amenities_ns.response(304, 'Not modified (If-None-Match matches the ETag)')
     @amenities_ns.response(404, 'Amenity not found')
     def get(self, amenity_id):
         """
@@ -159,7 +223,8 @@ class AmenityResource(Resource):
             amenity_id (str): UUID of the amenity to retrieve
             
         Returns:
-            200: Amenity details
+            200: Amenity details (with ETag)
+            304: Not modified (If-None-Match matches the current ETag)
             404: Amenity with the given ID does not exist
         """
         # Fetch the amenity from the database
@@ -169,13 +234,12 @@ class AmenityResource(Resource):
         if not amenity:
             amenities_ns.abort(404, 'Amenity not found')
         
-        # Return the amenity details
-        return amenity.to_dict()
+        # Return the payload serialized at write time (no per-request serialization)
+        # 304 without body if the client already has this version
+        return conditional_json_response(amenity.to_json())
 
-    @jwt_required()  # Requires valid JWT token
     @amenities_ns.expect(amenity_model, validate=True)
-    @amenities_ns.marshal_with(amenity_response_model)
-    @amenities_ns.response(200, 'Amenity updated successfully')
+    @amenities_ns.response(200, 'Amenity updated successfully', amenity_response_model)
     @amenities_ns.response(400, 'Invalid input data')
     @amenities_ns.response(403, 'Forbidden - Only administrators can update amenities')
     @amenities_ns.response(404, 'Amenity not found')
@@ -198,51 +262,21 @@ class AmenityResource(Resource):
             404: Amenity not found
             409: Amenity with this name already exists
         """
-        # Get the current authenticated user's ID from the JWT token
-        current_user_id = get_jwt_identity()
-        
-        # Get additional claims from the JWT (e.g., admin status)
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
+        # Extract update data from request body (already validated by expect())
+        # Validation and duplicate errors are mapped by the namespace error handlers
+        amenity_data = request.get_json(cache=True)
         
-        # Check if user is admin
-        if not is_admin:
-            amenities_ns.abort(403, 'Only administrators can update amenities')
+        # Update the amenity in the database (None if it doesn't exist)
+        # A name taken by another amenity is rejected by the unique index
+        updated_amenity = facade_instance.update_amenity(amenity_id, amenity_data)
         
-        # Fetch the amenity to verify it exists
-        amenity = facade_instance.get_amenity(amenity_id)
-        if not amenity:
+        if not updated_amenity:
             amenities_ns.abort(404, 'Amenity not found')
+        invalidate_responses('amenities:all', f'amenities:{amenity_id}')
         
-        try:
-            # Extract update data from request body
-            amenity_data = amenities_ns.payload
-            new_name = amenity_data.get('name', '').strip()
-            
-            # Check if new name conflicts with existing amenities (except itself)
-            if new_name:
-                existing_amenities = facade_instance.get_all_amenities()
-                for existing in existing_amenities:
-                    if existing.id != amenity_id and existing.name.lower() == new_name.lower():
-                        amenities_ns.abort(409, f'Amenity "{new_name}" already exists')
-            
-            # Update the amenity in the database
-            updated_amenity = facade_instance.update_amenity(amenity_id, amenity_data)
-            
-            if not updated_amenity:
-                amenities_ns.abort(404, 'Amenity not found')
-            
-            # Return the updated amenity data
-            return updated_amenity.to_dict()
-            
-        except ValueError as e:
-            # Handle validation errors
-            amenities_ns.abort(400, str(e))
-        except Exception as e:
-            # Handle unexpected errors
-            amenities_ns.abort(500, f"Internal error: {str(e)}")
+        # Return the updated amenity data (payload serialized once by the model)
+        return Response(updated_amenity.to_json(), mimetype='application/json')
 
-    @jwt_required()  # Requires valid JWT token
     @amenities_ns.response(204, 'Amenity deleted successfully')
     @amenities_ns.response(403, 'Forbidden - Only administrators can delete amenities')
     @amenities_ns.response(404, 'Amenity not found')
@@ -264,26 +298,10 @@ class AmenityResource(Resource):
             403: User is not an administrator
             404: Amenity not found
         """
-        # Get the current authenticated user's ID from the JWT token
-        current_user_id = get_jwt_identity()
-        
-        # Get additional claims from the JWT (e.g., admin status)
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
-        
-        # Check if user is admin
-        if not is_admin:
-            amenities_ns.abort(403, 'Only administrators can delete amenities')
-        
-        # Fetch the amenity to verify it exists
-        amenity = facade_instance.get_amenity(amenity_id)
-        if not amenity:
+        # Delete the amenity (one DELETE, row count tells if it existed)
+        if not facade_instance.delete_amenity(amenity_id):
             amenities_ns.abort(404, 'Amenity not found')
+        invalidate_responses('amenities:all', f'amenities:{amenity_id}')
         
-        # Delete the amenity from the database
-        if facade_instance.delete_amenity(amenity_id):
-            # Return 204 No Content on successful deletion
-            return {}, 204
-        
-        # This shouldn't happen (we already checked), but handle it just in case
-        amenities_ns.abort(404, 'Amenity not found')
\ No newline at end of file
+        # Return 204 No Content (empty body, nothing to serialize)
+        return Response(status=204)
\ No newline at end of file
@@ -5,17 +5,25 @@ Authentication API endpoints for the HBnB application.
 This module handles user authentication using JWT (JSON Web Tokens).
 It provides endpoints for:
 - User login with email/password
-- Token generation with user identity and admin claims
+- Token generation with the user identity
+- Logout (token revocation)
 - Protected route demonstration
 
 The JWT tokens include:
 - User ID as the identity claim
-- is_admin flag as an additional claim for authorization
+The admin role is not embedded in the token: it is resolved server-side
+(facade.is_user_admin), which keeps tokens small and lets a role change
+apply to tokens already issued. With Redis the cached role is shared and
+dropped on every change, so the change applies at once on all workers;
+without Redis each worker caches roles for up to 60 seconds.
 """
 
+from flask import g
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from flask_jwt_extended import create_access_token
 from app import facade as facade_instance
+from app.services.jwt_cache import cached_jwt_required, current_claims
+from app.services.token_blocklist import revoke_token
 
 
 # Create a namespace for authentication-related operations
@@ -75,7 +83,6 @@ class Login(Resource):
         2. Verify the password using bcrypt hashing
         3. Generate a JWT token containing:
            - User ID (as identity claim)
-           - Admin status (as additional claim)
         4. Return the token to the client
         
         The client should include this token in the Authorization header
@@ -88,28 +95,56 @@ class Login(Resource):
         # Extract credentials from the request body
         credentials = auth_ns.payload
         
-        # Step 1: Retrieve the user from database using their email
-        user = facade_instance.get_user_by_email(credentials['email'])
-        
-        # Step 2: Verify user exists and password is correct
-        # - If user doesn't exist, user will be None
-        # - verify_password() uses bcrypt to compare hashed password
-        if not user or not user.verify_password(credentials['password']):
+        # Steps 1-2: Retrieve the user by email and verify the password
+        # - None if the user doesn't exist or the password is wrong
+        # - bcrypt is skipped when the same credentials succeeded seconds ago
+        user_id = facade_instance.authenticate(credentials['email'], credentials['password'])
+        if user_id is None:
             return {'error': 'Invalid credentials'}, 401
 
         # Step 3: Create a JWT token containing user information
         # - identity: User's UUID (used to identify the user in protected routes)
-        # - additional_claims: Extra data embedded in the token (e.g., admin status)
-        access_token = create_access_token(
-            identity=str(user.id),
-            additional_claims={"is_admin": user.is_admin}
-        )
+        # - No additional claims: the admin role is looked up server-side
+        access_token = create_access_token(identity=str(user_id))
         
         # Step 4: Return the JWT token to the client
         # Client should store this token and include it in future requests
         return {'access_token': access_token}, 200
 
 
+@auth_ns.route('/logout')
+class Logout(Resource):
+    """
+    Handles JWT token revocation.
+    
+    The token used for this request is added to the revocation list
+    until it expires, so it can no longer access protected endpoints.
+    """
+    
+    @cached_jwt_required  # Requires valid JWT token (verified claims are cached)
+    @auth_ns.response(200, 'Logout successful - Token revoked')
+    @auth_ns.response(401, 'Unauthorized - Invalid, expired, or missing token')
+    @auth_ns.response(503, 'Revocation list unavailable - Retry the logout')
+    def post(self):
+        """
+        Revoke the current JWT access token.
+        
+        The token's unique identifier (jti claim) is stored in the
+        revocation list until the token's own expiration (exp claim).
+        
+        Returns:
+            200: Token revoked
+            401: Invalid/missing token
+            503: Redis unavailable, the token is only revoked in this worker
+        """
+        # Claims decoded once for this request (kept on g)
+        claims = current_claims()
+        if not revoke_token(claims['jti'], claims['exp']):
+            # Returned, not aborted: Flask-RESTX logs 5xx aborts as server errors
+            return {'message': 'Logout could not be recorded, please retry'}, 503
+        return {'message': 'Successfully logged out'}, 200
+
+
 @auth_ns.route('/protected')
 class ProtectedResource(Resource):
     """
@@ -119,7 +154,7 @@ class ProtectedResource(Resource):
     It shows how to extract the user identity from the token.
     """
     
-    @jwt_required()  # Decorator that enforces JWT authentication
+    @cached_jwt_required  # Enforces JWT authentication (verified claims are cached)
     @auth_ns.response(200, 'Access granted - Valid token provided')
     @auth_ns.response(401, 'Unauthorized - Invalid, expired, or missing token')
     def get(self):
@@ -127,8 +162,8 @@ class ProtectedResource(Resource):
         Example of a protected endpoint requiring authentication.
         
         This endpoint demonstrates:
-        - How to require JWT authentication using @jwt_required()
-        - How to extract the user ID from the token using get_jwt_identity()
+        - How to require JWT authentication using @cached_jwt_required
+        - How to read the user ID of the verified token from g.jwt_identity
         
         To access this endpoint, clients must include the JWT token
         in the Authorization header:
@@ -138,9 +173,9 @@ class ProtectedResource(Resource):
             200: Access granted with user identity
             401: Access denied (invalid/missing token)
         """
-        # Extract the user ID from the JWT token
-        # This ID matches the 'identity' claim set during login
-        current_user = get_jwt_identity()
+        # User ID of the verified token ('sub' claim, set on g by
+        # @cached_jwt_required); matches the identity set during login
+        current_user = g.jwt_identity
         
         # Return a personalized message with the authenticated user's ID
         return {'message': f'Hello, user {current_user}'}, 200
\ No newline at end of file
@@ -7,7 +7,7 @@ Places represent accommodations that can be rented, such as apartments, houses,
 
 Routes:
     POST   /places/              - Create a new place (owner only)
-    GET    /places/              - List all places (public)
+    GET    /places/              - List place summaries (no reviews), newest first, paginated (public)
     GET    /places/<id>          - Get place details (public)
     PUT    /places/<id>          - Update a place (owner/admin only)
     DELETE /places/<id>          - Delete a place (owner/admin only)
@@ -17,17 +17,61 @@ Each place includes:
 - Owner information (user who created the place)
 - Amenities (features like WiFi, Parking, Pool) - selected from global amenities
 - Reviews (ratings and comments from users)
+
+Serialization:
+- Payloads come from Place.to_dict() (no marshalling pass): to_dict()
+  already produces the response shape, place_response only documents it
+  in Swagger. The list builds the same summaries from plain rows
+  (Place.summaries_from_rows(), no ORM objects)
+- Every route encodes with orjson itself and returns a Response
+  (json_response(), cached bytes or the streamed list), bypassing Flask-RESTX's
+  representation layer
+- The place list is streamed: each place is encoded and sent on its own,
+  the whole page is never held as one serialized document in memory
+- created_at/updated_at are converted by to_dict() (isoformat(), no UTC
+  offset) rather than by orjson's native datetime support, which would
+  add '+00:00' and change the API format
+
+Conditional GET:
+- GET responses carry an ETag derived from a change fingerprint of the
+  place(s) and everything embedded in them (one aggregate query)
+- A matching If-None-Match is answered 304 before any place is loaded
+  or serialized
+- Cache-Control lets browsers and shared caches store the responses but
+  makes them revalidate every time (no-cache): a revalidation is one
+  fingerprint query and an empty 304, and a stale list is never shown
+  after a write (a max-age would hide new places for its duration)
 """
 
-from flask_restx import Namespace, Resource, fields
-from flask import request
-from app import facade as facade_instance
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from flask_restx import Namespace, Resource, fields, inputs
+from flask import g, request, Response, stream_with_context
+from werkzeug.http import quote_etag
+from sqlalchemy.exc import SQLAlchemyError
+from app import db, facade as facade_instance
+from app.api.v1.reviews import invalidate_review_lists
+from app.services.json_provider import dumps_bytes, json_response
+from app.services.jwt_cache import cached_jwt_required, current_is_admin
+from app.services.query_counter import query_budget
+from app.services.response_cache import not_modified
 
 
 # Create a namespace for place-related operations
 places_ns = Namespace('places', description='Place operations')
 
+# Facade methods used by the handlers, bound once at import
+# (the facade is a process-wide singleton): each call is a single global
+# lookup instead of a global lookup plus a bound-method creation
+_get_existing_amenity_ids = facade_instance.get_existing_amenity_ids
+_create_place = facade_instance.create_place
+_parse_places_cursor = facade_instance.parse_places_cursor
+_get_places_page = facade_instance.get_places_page
+_get_places_list_etag = facade_instance.get_places_list_etag
+_get_place_json = facade_instance.get_place_json
+_get_place_etag = facade_instance.get_place_etag
+_check_place_owner = facade_instance.check_place_owner
+_update_place_checked = facade_instance.update_place_checked
+_delete_place_checked = facade_instance.delete_place_checked
+
 
 # -----------------------
 # Swagger API Models
@@ -93,8 +137,9 @@ place_model = places_ns.model('PlaceInput', {
     )
 })
 
-# Response model for place data (includes all relationships)
-place_response = places_ns.model('PlaceResponse', {
+# Response model for place summaries (place list: owner and amenities,
+# no reviews; reviews are served by GET /places/<id>/reviews)
+place_summary_response = places_ns.model('PlaceSummaryResponse', {
     'id': fields.String(description='Unique place identifier (UUID)'),
     'title': fields.String(description='Title/name of the place'),
     'description': fields.String(description='Detailed description'),
@@ -102,12 +147,16 @@ place_response = places_ns.model('PlaceResponse', {
     'latitude': fields.Float(description='Geographic latitude'),
     'longitude': fields.Float(description='Geographic longitude'),
     'owner': fields.Nested(user_model, description='Owner information'),
-    'created_at': fields.String(description='ISO 8601 timestamp of creation'),
-    'updated_at': fields.String(description='ISO 8601 timestamp of last update'),
+    'created_at': fields.DateTime(dt_format='iso8601', description='ISO 8601 timestamp of creation'),
+    'updated_at': fields.DateTime(dt_format='iso8601', description='ISO 8601 timestamp of last update'),
     'amenities': fields.List(
         fields.Nested(amenity_model), 
         description='List of amenities associated with this place'
-    ),
+    )
+})
+
+# Response model for place data (includes all relationships)
+place_response = places_ns.clone('PlaceResponse', place_summary_response, {
     'reviews': fields.List(
         fields.Nested(review_display_model), 
         description='List of reviews for this place'
@@ -128,6 +177,102 @@ place_update_model = places_ns.model('PlaceUpdateInput', {
     )
 })
 
+# Response model for one page of the place list
+place_page_model = places_ns.model('PlacePage', {
+    'items': fields.List(
+        fields.Nested(place_summary_response),
+        description='Places of this page, newest first (without reviews)'
+    ),
+    'next_cursor': fields.String(
+        description='Cursor of the next page (pass as ?cursor=), null on the last page'
+    )
+})
+
+
+# -----------------------
+# Query String Parsers
+# -----------------------
+
+# Page size of GET /places/ (default and upper bound)
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Query string of GET /places/ (keyset pagination)
+place_list_parser = places_ns.parser()
+place_list_parser.add_argument(
+    'limit', type=inputs.int_range(1, MAX_PAGE_SIZE), location='args',
+    default=DEFAULT_PAGE_SIZE,
+    help=f'Number of places per page (1-{MAX_PAGE_SIZE}, default {DEFAULT_PAGE_SIZE})'
+)
+place_list_parser.add_argument(
+    'cursor', type=str, location='args',
+    help='next_cursor returned by the previous page (omit for the first page)'
+)
+
+
+# -----------------------
+# Streaming helpers
+# -----------------------
+
+def _iter_page_json(places, next_cursor):
+    """
+    Generate the JSON document of a place list page chunk by chunk.
+    Each place summary is encoded on its own, so the page is never held
+    as one full serialized copy.
+    Args: places (list): Place summary dicts of the page,
+          next_cursor (str): Cursor of the next page, or None
+    Yields: bytes: '{"items":[', one place per chunk, then the closing part
+    """
+    yield b'{"items":['
+    for index, place in enumerate(places):
+        chunk = dumps_bytes(place)
+        yield b',' + chunk if index else chunk
+    yield b'],"next_cursor":' + dumps_bytes(next_cursor) + b'}'
+
+
+# Cache-Control of the GET responses (and of their 304s)
+CACHE_CONTROL = 'public, no-cache'
+
+
+# -----------------------
+# Prefer: return=minimal
+# -----------------------
+
+def _prefers_minimal():
+    """
+    Whether the client asked for no response body (RFC 7240 'Prefer:
+    return=minimal'), so writes can skip building and encoding the place.
+    Returns: bool: True if one of the Prefer preferences is return=minimal
+    """
+    prefer = request.headers.get('Prefer', '')
+    return any(
+        token.split(';', 1)[0].strip().lower() == 'return=minimal'
+        for token in prefer.split(',')
+    )
+
+
+# Headers of a minimal response: the preference was honored
+MINIMAL_HEADERS = {'Preference-Applied': 'return=minimal'}
+
+
+# -----------------------
+# Error Handlers
+# -----------------------
+
+@places_ns.errorhandler(SQLAlchemyError)
+def handle_database_error(error):
+    """
+    Database error during a request: roll the session back and answer 500.
+    Replaces per-route catch-all try/except blocks: validation errors are
+    still handled by the routes (400), anything else unexpected goes to
+    the API's default handler (handle_unexpected_error() in app/__init__.py).
+    Flask-RESTX registers namespace error handlers on the whole API: a
+    SQLAlchemyError raised in any namespace (users, reviews, amenities,
+    auth) is answered here too.
+    """
+    db.session.rollback()
+    return {'message': 'Internal database error'}, 500
+
 
 # -----------------------
 # API Routes
@@ -143,11 +288,12 @@ class PlaceList(Resource):
     - Listing all places (GET - public access)
     """
     
-    @jwt_required()  # Requires valid JWT token
+    @cached_jwt_required  # Requires valid JWT token (verified claims are cached)
     @places_ns.expect(place_model, validate=True)
     @places_ns.response(201, 'Place registered successfully', place_response)
     @places_ns.response(400, 'Invalid input data or amenity does not exist')
     @places_ns.response(403, 'Unauthorized - owner_id must match authenticated user')
+    @places_ns.param('Prefer', 'return=minimal: empty 201 with a Location header', _in='header')
     def post(self):
         """
         Create a new place listing.
@@ -163,17 +309,20 @@ class PlaceList(Resource):
         - Empty reviews list (reviews added by other users)
         - Automatic timestamps (created_at, updated_at)
         
+        With 'Prefer: return=minimal' (RFC 7240), the 201 has no body, only
+        a Location header: the place payload is never built.
+        
         Returns:
             201: Place created successfully with full place data
             400: Invalid input (validation errors or non-existent amenity)
             403: owner_id doesn't match authenticated user
         """
-        # Get the authenticated user's ID from the JWT token
-        current_user_id = get_jwt_identity()
+        # Authenticated user's ID ('sub' claim, set on g by @cached_jwt_required)
+        current_user_id = g.jwt_identity
         
         try:
-            # Extract place data from request body
-            place_data = request.get_json()
+            # Request body, already parsed and validated by @expect (cached on the request)
+            place_data = places_ns.payload
             
             # Security check: Verify that owner_id matches the authenticated user
             # This prevents users from creating places in someone else's name
@@ -182,57 +331,97 @@ class PlaceList(Resource):
             
             # Validate amenities if provided
             if 'amenities' in place_data and place_data['amenities']:
-                # Get all existing amenities from the database
-                existing_amenities = facade_instance.get_all_amenities()
-                existing_amenity_ids = [a.id for a in existing_amenities]
-                
-                # Check each amenity ID
-                for amenity_id in place_data['amenities']:
-                    if amenity_id not in existing_amenity_ids:
-                        places_ns.abort(
-                            400, 
-                            f'Amenity with ID {amenity_id} does not exist. '
-                            f'Please select from existing amenities or contact an admin to create new ones.'
-                        )
+                # Requested IDs minus the ones that exist (cached set of all
+                # amenity IDs, set difference instead of a lookup loop)
+                requested = set(place_data['amenities'])
+                missing = requested - _get_existing_amenity_ids(requested)
+                if missing:
+                    places_ns.abort(
+                        400, 
+                        f'Amenity with ID {", ".join(sorted(missing))} does not exist. '
+                        f'Please select from existing amenities or contact an admin to create new ones.'
+                    )
             
-            # Create the place in the database
-            place = facade_instance.create_place(place_data)
+            # Create the place in the database; the facade also returns its
+            # to_dict() payload, built before the commit from the owner and
+            # amenities already loaded (no reload after the INSERT)
+            minimal = _prefers_minimal()
+            place, payload = _create_place(place_data, with_payload=not minimal)
             
-            # SQLAlchemy automatically loads related data (owner, amenities, reviews)
-            # via the configured relationships in the Place model
-            return place.to_dict(), 201
+            if minimal:
+                return Response(status=201, headers={
+                    'Location': self.api.url_for(PlaceResource, place_id=place.id),
+                    **MINIMAL_HEADERS
+                })
+            return json_response(payload, 201)
             
         except ValueError as e:
             # Handle validation errors from the facade/model
             places_ns.abort(400, str(e))
-        except Exception as e:
-            # Handle unexpected errors
-            places_ns.abort(500, f"Internal error: {str(e)}")
 
-    @places_ns.marshal_list_with(place_response)
-    @places_ns.response(200, 'List of places retrieved successfully')
+    # ETag fingerprint + page (owner joined) + amenities
+    @query_budget(3)
+    @places_ns.expect(place_list_parser)
+    @places_ns.response(200, 'Page of places retrieved successfully', place_page_model)
+    @places_ns.response(304, 'Not modified (If-None-Match matches the current ETag)')
+    @places_ns.response(400, 'Invalid limit or cursor')
     def get(self):
         """
-        Retrieve a list of all places.
+        Retrieve a page of places, newest first.
         
         This is a public endpoint - no authentication required.
-        Returns all places with their full details including:
+        Returns place summaries including:
         - Owner information
         - Associated amenities
-        - User reviews
+        Reviews are not included: they are fetched per place, when a
+        place is opened (GET /places/<id> or GET /places/<id>/reviews).
         
-        SQLAlchemy eager loads all relationships automatically,
-        so no additional queries are needed for nested data.
+        Pagination (keyset on created_at, id):
+        - ?limit=N: page size (default 50, max 200)
+        - ?cursor=...: next_cursor of the previous page
+        - Response: {"items": [...], "next_cursor": "..." or null}
+        Each request serializes at most 'limit' places, whatever the
+        size of the table.
+        
+        Owners and amenities are read for the whole page at once as plain
+        rows (2 queries in total, whatever the page size, plus the ETag
+        query; the budget is enforced in debug mode by @query_budget).
+        No ORM objects are built: summaries come straight from the rows.
+        
+        Conditional GET: the weak ETag covers the whole list (any place,
+        amenity or owner change updates it), so a client that
+        sends it back in If-None-Match gets a 304 without any page query.
         
         Returns:
-            200: List of all places with complete information
+            200: One page of place summaries
+            304: Nothing changed since the client's copy
+            400: limit out of range or malformed cursor
         """
-        # Fetch all places from the database
-        places = facade_instance.get_all_places()
+        args = place_list_parser.parse_args()
         
-        # Convert each place object to a dictionary for JSON serialization
-        # SQLAlchemy relationships (owner, amenities, reviews) are automatically loaded
-        return [p.to_dict() for p in places]
+        # Input first: a malformed cursor is a 400 even if the list is unchanged
+        try:
+            after = _parse_places_cursor(args['cursor'])
+        except ValueError as e:
+            places_ns.abort(400, str(e))
+        
+        # Short-circuit unchanged data before loading/serializing the page
+        etag = _get_places_list_etag()
+        response = not_modified(etag, weak=True, cache_control=CACHE_CONTROL)
+        if response is not None:
+            return response
+        
+        places, next_cursor = _get_places_page(args['limit'], after)
+        
+        # Streamed place by place (summaries built from rows by the facade,
+        # no marshalling pass); reviews are served by GET /places/<id>/reviews
+        # stream_with_context keeps the request context alive while the
+        # body is generated
+        return Response(
+            stream_with_context(_iter_page_json(places, next_cursor)),
+            mimetype='application/json',
+            headers={'ETag': quote_etag(etag, weak=True), 'Cache-Control': CACHE_CONTROL}
+        )
 
 
 @places_ns.route('/<string:place_id>')
@@ -247,8 +436,8 @@ class PlaceResource(Resource):
     - Deleting a place (DELETE - owner/admin only)
     """
     
-    @places_ns.marshal_with(place_response)
-    @places_ns.response(200, 'Place details retrieved successfully')
+    @places_ns.response(200, 'Place details retrieved successfully', place_response)
+    @places_ns.response(304, 'Not modified (If-None-Match matches the current ETag)')
     @places_ns.response(404, 'Place not found')
     def get(self, place_id):
         """
@@ -264,27 +453,51 @@ class PlaceResource(Resource):
         Args:
             place_id (str): UUID of the place to retrieve
             
+        Conditional GET: the ETag covers the place, its owner, amenities
+        and reviews; a matching If-None-Match gets a 304 without loading
+        the place.
+        
+        The serialized body is cached per place under that same ETag: while
+        nothing changed, a 200 is served without loading or encoding the
+        place (only the fingerprint query runs).
+        
         Returns:
             200: Place details with all relationships loaded
+            304: Nothing changed since the client's copy
             404: Place with the given ID does not exist
         """
-        # Fetch the place from the database
-        place = facade_instance.get_place(place_id)
+        # Change fingerprint first (one aggregate query): answers 404 and
+        # 304 without loading the place
+        etag = _get_place_etag(place_id)
+        if etag is None:
+            places_ns.abort(404, 'Place not found')
+        response = not_modified(etag, cache_control=CACHE_CONTROL)
+        if response is not None:
+            return response
+        
+        # Serialized to_dict() output for this version (cached by the facade;
+        # on a miss the place is loaded with its relationships and encoded)
+        body = _get_place_json(place_id, etag)
         
-        # Return 404 if place doesn't exist
-        if not place:
+        # Return 404 if place doesn't exist (deleted since the ETag query)
+        if body is None:
             places_ns.abort(404, 'Place not found')
 
-        # SQLAlchemy automatically loads owner, amenities, and reviews
-        # via the configured relationships in the Place model
-        return place.to_dict()
+        # Ready bytes: no marshalling pass and no representation lookup
+        # (place_response is docs only)
+        return Response(body, mimetype='application/json', headers={
+            'ETag': quote_etag(etag), 'Cache-Control': CACHE_CONTROL
+        })
 
-    @jwt_required()  # Requires valid JWT token
-    @places_ns.expect(place_update_model, validate=True)
+    @cached_jwt_required  # Requires valid JWT token (verified claims are cached)
+    # Docs only: the body is validated in the handler, after authorization
+    @places_ns.expect(place_update_model, validate=False)
     @places_ns.response(200, 'Place updated successfully', place_response)
+    @places_ns.response(204, "Place updated ('Prefer: return=minimal')")
     @places_ns.response(400, 'Invalid input data or amenity does not exist')
     @places_ns.response(403, 'Unauthorized - Only owner or admin can update')
     @places_ns.response(404, 'Place not found')
+    @places_ns.param('Prefer', 'return=minimal: empty 204 instead of the updated place', _in='header')
     def put(self, place_id):
         """
         Update an existing place.
@@ -295,6 +508,8 @@ class PlaceResource(Resource):
           * The owner of the place
           * An admin user
         - Amenities must exist in the system (if updating amenities)
+        - Checks run cheapest first: token, then ownership (404/403), and
+          only then body validation (400)
         
         Restricted fields (cannot be updated):
         - id (immutable)
@@ -310,62 +525,60 @@ class PlaceResource(Resource):
         Args:
             place_id (str): UUID of the place to update
             
+        With 'Prefer: return=minimal' (RFC 7240), a 204 without body is
+        returned and the place is not reloaded after the update.
+        
         Returns:
             200: Place updated successfully with updated data
+            204: Place updated (Prefer: return=minimal)
             400: Invalid input data or non-existent amenity
             403: User is not authorized to update this place
             404: Place not found
         """
-        # Get the authenticated user's ID from the JWT token
-        current_user_id = get_jwt_identity()
-        
-        # Get additional claims from the JWT (e.g., admin status)
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
+        # Caller ('sub' claim, set on g by @cached_jwt_required) and
+        # admin role (resolved server-side once per request, kept on g)
+        current_user_id = g.jwt_identity
+        is_admin = current_is_admin()
         
-        # Fetch the place to verify it exists and check ownership
-        place = facade_instance.get_place(place_id)
-        if not place:
-            places_ns.abort(404, "Place not found")
+        # Authorization first (only owner or admin, cached owner_id lookup):
+        # a rejected request never gets its body parsed or validated
+        try:
+            if _check_place_owner(place_id, current_user_id, is_admin, 'update') is None:
+                places_ns.abort(404, "Place not found")
+        except PermissionError as e:
+            places_ns.abort(403, str(e))
         
-        # Authorization check: Only owner or admin can update
-        if place.owner_id != current_user_id and not is_admin:
-            places_ns.abort(403, 'You can only update your own places')
+        # Request body, parsed and validated against place_update_model only now
+        place_data = places_ns.payload
+        place_update_model.validate(place_data, self.api.refresolver, self.api.format_checker)
         
         try:
-            # Extract update data from request body
-            place_data = request.get_json()
-            
-            # Validate amenities if provided in the update
-            if 'amenities' in place_data:
-                # Get all existing amenities from the database
-                existing_amenities = facade_instance.get_all_amenities()
-                existing_amenity_ids = [a.id for a in existing_amenities]
-                
-                # Check each amenity ID
-                for amenity_id in place_data['amenities']:
-                    if amenity_id not in existing_amenity_ids:
-                        places_ns.abort(
-                            400, 
-                            f'Amenity with ID {amenity_id} does not exist. '
-                            f'Please select from existing amenities or contact an admin.'
-                        )
-            
-            # Update the place in the database
-            # The facade will handle validation and prevent updating restricted fields
-            updated_place = facade_instance.update_place(place_id, place_data)
-            
-            # SQLAlchemy automatically reloads relationships
-            return updated_place.to_dict()
-            
+            # Update in one facade call: the owner check is repeated from the
+            # cache (no query), the place itself is loaded and locked only now.
+            # Non-existent amenity IDs are rejected by the facade.
+            # The facade will also prevent updating restricted fields
+            minimal = _prefers_minimal()
+            updated_place = _update_place_checked(
+                place_id, place_data, current_user_id, is_admin, reload=not minimal
+            )
+        except PermissionError as e:
+            # Caller is neither the owner nor an admin
+            places_ns.abort(403, str(e))
         except ValueError as e:
             # Handle validation errors from the facade/model
             places_ns.abort(400, str(e))
-        except Exception as e:
-            # Handle unexpected errors
-            places_ns.abort(500, f"Internal error: {str(e)}")
+        
+        if not updated_place:
+            places_ns.abort(404, "Place not found")
+        # Cached review lists embed the place title
+        invalidate_review_lists(place_id)
+        
+        if minimal:
+            return Response(status=204, headers=MINIMAL_HEADERS)
+        # Relationships were eager-loaded by the facade after the update
+        return json_response(updated_place.to_dict())
 
-    @jwt_required()  # Requires valid JWT token
+    @cached_jwt_required  # Requires valid JWT token (verified claims are cached)
     @places_ns.response(204, 'Place successfully deleted')
     @places_ns.response(403, 'Unauthorized - Only owner or admin can delete')
     @places_ns.response(404, 'Place not found')
@@ -380,7 +593,7 @@ class PlaceResource(Resource):
           * An admin user
         
         Cascade behavior:
-        - SQLAlchemy will automatically delete all associated reviews
+        - All associated reviews are deleted with the place
         - Amenities are NOT deleted (they are global resources shared across places)
         - The relationship entries in place_amenity table are removed
         
@@ -392,25 +605,23 @@ class PlaceResource(Resource):
             403: User is not authorized to delete this place
             404: Place not found
         """
-        # Get the authenticated user's ID from the JWT token
-        current_user_id = get_jwt_identity()
+        # Caller ('sub' claim, set on g by @cached_jwt_required) and
+        # admin role (resolved server-side once per request, kept on g)
+        current_user_id = g.jwt_identity
+        is_admin = current_is_admin()
         
-        # Get additional claims from the JWT (e.g., admin status)
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
-        
-        # Fetch the place to verify it exists and check ownership
-        place = facade_instance.get_place(place_id)
-        if not place:
+        # Authorization check (only owner or admin) and deletion in one
+        # facade call: authorization reads only the owner_id column and the
+        # place is removed by a single guarded DELETE (never loaded)
+        # Related reviews and amenity links are deleted in the same transaction
+        try:
+            deleted = _delete_place_checked(place_id, current_user_id, is_admin)
+        except PermissionError as e:
+            places_ns.abort(403, str(e))
+        if not deleted:
             places_ns.abort(404, 'Place not found')
-        
-        # Authorization check: Only owner or admin can delete
-        if place.owner_id != current_user_id and not is_admin:
-            places_ns.abort(403, 'You can only delete your own places')
-        
-        # Delete the place from the database
-        # SQLAlchemy cascade will handle related reviews
-        facade_instance.delete_place(place_id)
+        # Its reviews were deleted with it
+        invalidate_review_lists(place_id)
 
-        # Return 204 No Content on successful deletion
-        return {"message": "Place successfully deleted"}, 204
\ No newline at end of file
+        # Return 204 No Content (empty body, nothing to serialize)
+        return Response(status=204)
\ No newline at end of file
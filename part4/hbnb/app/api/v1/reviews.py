@@ -13,6 +13,18 @@ Routes:
     DELETE /reviews/<id>                  - Delete a review (author/admin only)
     GET    /reviews/places/<place_id>/reviews - Get all reviews for a place (public)
 
+Caching: both review lists are public, so their JSON bodies are cached
+in Redis when it is configured (see app.services.response_cache), under
+'reviews:list:all' and 'reviews:list:<place_id>'. Every review write
+drops the lists it changes (invalidate_review_lists()). Review responses
+embed place titles and author names: place writes drop that place's list
+too, user writes the list of all reviews (per-place lists expire by TTL).
+
+Write queue: with REVIEW_WRITE_QUEUE on (and Redis configured), review
+creations are queued in Redis and answered 202 with the review id; the
+flush-review-queue command inserts them in batches and drops the lists
+then (see app.services.review_queue).
+
 Business rules:
 - Users can only review places they don't own
 - Users can only leave one review per place
@@ -21,10 +33,15 @@ Business rules:
 """
 
 from flask_restx import Namespace, Resource, fields
-from flask import request
+from flask import g, request, Response
 from app import facade as facade_instance
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
-from werkzeug.exceptions import HTTPException
+from app.services.facade import DuplicateReviewError
+from app.services.json_provider import ISO_DATETIME_OPTIONS, dumps_bytes, json_response
+from app.services.jwt_cache import cached_jwt_required, current_is_admin
+from app.services.response_cache import (
+    REDIS_ERRORS, cached_response, conditional_json_response, invalidate_responses
+)
+from app.services.review_queue import queue_enabled
 
 
 # Create a namespace for review-related operations
@@ -96,6 +113,114 @@ review_update_model = reviews_ns.model('ReviewUpdate', {
 })
 
 
+# -----------------------
+# Response cache
+# -----------------------
+
+def invalidate_review_lists(place_id=None):
+    """
+    Drop the cached review lists after a write.
+    Args: place_id (str): Place whose review list changed (None: only the
+          list of all reviews is dropped, per-place lists expire by TTL)
+    """
+    if place_id is None:
+        invalidate_responses('reviews:list:all')
+    else:
+        invalidate_responses('reviews:list:all', f'reviews:list:{place_id}')
+
+
+# -----------------------
+# Input checks
+# -----------------------
+
+# Fields a review update can never change
+PROTECTED_FIELDS = ('id', 'user_id', 'place_id', 'created_at')
+
+
+def _review_input_error(review_data, partial=False):
+    """
+    Check the review fields with plain comparisons, before any database call
+    (same rules as the Review model validators, which stay the last line
+    of defense).
+    Args: review_data (dict): Request payload,
+          partial (bool): Update: only the fields present are checked
+    Returns: str: Message of the first invalid field, or None if valid
+    """
+    if not partial or 'text' in review_data:
+        text = review_data.get('text')
+        if not isinstance(text, str) or not text.strip():
+            return 'text must be a non-empty string'
+    if not partial or 'rating' in review_data:
+        rating = review_data.get('rating')
+        if not isinstance(rating, int):
+            return 'rating must be an integer between 1 and 5'
+        if rating < 1 or rating > 5:
+            return 'rating must be between 1 and 5'
+    if partial:
+        for field in PROTECTED_FIELDS:
+            if field in review_data:
+                return f"Cannot update '{field}'"
+    return None
+
+
+# -----------------------
+# Review creation
+# -----------------------
+
+def _create_checked_review(review_data, place_id, user_id):
+    """
+    Apply the review creation rules, then insert (or queue) the review.
+    The rules are checked from one query (place owner, author existence,
+    previous review); the INSERT is the only other round-trip. A duplicate
+    created concurrently after the check is rejected by the unique
+    (user_id, place_id) constraint, reported as the same 409.
+    With the review write queue enabled (app.services.review_queue), the
+    review is pushed to Redis instead and inserted later in a batch; the
+    request answers 202 with the generated id. If Redis fails, the review
+    is inserted synchronously.
+    Args: review_data (dict): Validated payload (user_id/place_id set),
+          place_id (str): Place UUID, user_id (str): Authenticated user UUID
+    Returns: tuple: (response body, status): created review (201)
+             or {'id': ...} of the queued review (202)
+    Raises: HTTPException: 400 invalid input or unknown author, 404 place not found,
+            403 own place, 409 already reviewed
+    """
+    error = _review_input_error(review_data)
+    if error:
+        reviews_ns.abort(400, error)
+    
+    context = facade_instance.prepare_review_create(place_id, user_id)
+    if context is None:
+        reviews_ns.abort(404, 'Place not found')
+    owner_id, user_exists, already_reviewed = context
+    
+    # Business rule: Users cannot review their own places
+    # This prevents fake reviews and maintains review integrity
+    if owner_id == user_id:
+        reviews_ns.abort(403, 'You cannot review your own place')
+    
+    # Business rule: One review per user per place
+    if already_reviewed:
+        reviews_ns.abort(409, 'You have already reviewed this place')
+    if not user_exists:
+        reviews_ns.abort(400, 'Invalid or missing user_id')
+    
+    try:
+        if queue_enabled():
+            try:
+                return {'id': facade_instance.queue_review(review_data)}, 202
+            except REDIS_ERRORS:
+                pass  # Redis unavailable: insert synchronously
+        review = facade_instance.create_review(review_data, checked=True)
+    except DuplicateReviewError:
+        reviews_ns.abort(409, 'You have already reviewed this place')
+    invalidate_review_lists(place_id)
+    
+    # SQLAlchemy automatically loads related user and place data
+    # via the configured relationships in the Review model
+    return review.to_dict(), 201
+
+
 # -----------------------
 # API Routes
 # -----------------------
@@ -110,9 +235,10 @@ class ReviewList(Resource):
     - Listing all reviews (GET - public access)
     """
     
-    @jwt_required()  # Requires valid JWT token
+    @cached_jwt_required  # Requires valid JWT token (verified claims are cached)
     @reviews_ns.expect(review_model, validate=True)
     @reviews_ns.response(201, 'Review successfully created', review_response_model)
+    @reviews_ns.response(202, 'Review accepted, inserted asynchronously (review write queue)')
     @reviews_ns.response(400, 'Invalid input data')
     @reviews_ns.response(403, 'Unauthorized - Cannot review own place or user_id mismatch')
     @reviews_ns.response(404, 'Place not found')
@@ -133,68 +259,32 @@ class ReviewList(Resource):
         
         Returns:
             201: Review created successfully
+            202: Review queued, inserted asynchronously (review write queue on)
             400: Invalid input (validation errors)
             403: Forbidden (trying to review own place or user_id mismatch)
             404: Place does not exist
             409: User has already reviewed this place
         """
-        # Get the authenticated user's ID from the JWT token
-        current_user_id = get_jwt_identity()
+        # Authenticated user's ID ('sub' claim, set on g by @cached_jwt_required)
+        current_user_id = g.jwt_identity
         
-        try:
-            # Extract review data from request body
-            review_data = reviews_ns.payload
-            
-            # Security check: Verify user_id matches authenticated user
-            # This prevents users from creating reviews in someone else's name
-            if review_data.get('user_id') != current_user_id:
-                reviews_ns.abort(403, 'You can only create reviews for yourself')
-            
-            place_id = review_data.get('place_id')
-            
-            # Verify the place exists and get its details
-            place = facade_instance.get_place(place_id)
-            if not place:
-                reviews_ns.abort(404, 'Place not found')
-            
-            # Business rule: Users cannot review their own places
-            # This prevents fake reviews and maintains review integrity
-            if place.owner_id == current_user_id:
-                reviews_ns.abort(403, 'You cannot review your own place')
-            
-            # Business rule: One review per user per place
-            # Check if user has already reviewed this place
-            if facade_instance.user_has_reviewed_place(current_user_id, place_id):
-                reviews_ns.abort(409, 'You have already reviewed this place')
-            
-            # Create the review in the database
-            review = facade_instance.create_review(review_data)
-            
-            # SQLAlchemy automatically loads related user and place data
-            # via the configured relationships in the Review model
-            return review.to_dict(), 201
-        
-        except HTTPException:
-            # Re-raise HTTP exceptions (403, 404, 409, etc.)
-            # These are expected errors that should be returned to the client
-            raise
-        except ValueError as e:
-            # Handle validation errors (e.g., rating out of range)
-            reviews_ns.abort(400, str(e))
-        except Exception as e:
-            # Handle unexpected errors
-            import traceback
-            print("=" * 80)
-            print("ERROR in POST /reviews:")
-            print(f"Exception type: {type(e).__name__}")
-            print(f"Exception message: {str(e)}")
-            print("Full traceback:")
-            traceback.print_exc()
-            print("=" * 80)
-            reviews_ns.abort(500, f"Internal error: {str(e)}")
-
-    @reviews_ns.marshal_list_with(review_response_model)
-    @reviews_ns.response(200, 'List of reviews retrieved successfully')
+        # Extract review data from request body
+        review_data = reviews_ns.payload
+        
+        # Security check: Verify user_id matches authenticated user
+        # This prevents users from creating reviews in someone else's name
+        if review_data.get('user_id') != current_user_id:
+            reviews_ns.abort(403, 'You can only create reviews for yourself')
+        
+        place_id = review_data.get('place_id')
+        
+        # Input checks, then place owner, author existence and previous
+        # review in one query (invalid input: 400 before any database call)
+        return _create_checked_review(review_data, place_id, current_user_id)
+
+    @cached_response('reviews:list:all')  # Public: served from Redis when available
+    @reviews_ns.response(200, 'List of reviews retrieved successfully', [review_response_model])
+    @reviews_ns.response(304, 'Not modified (If-None-Match matches the ETag)')
     def get(self):
         """
         Retrieve a list of all reviews in the system.
@@ -202,18 +292,17 @@ class ReviewList(Resource):
         This is a public endpoint - no authentication required.
         Returns all reviews with their associated user and place information.
         
-        SQLAlchemy automatically loads relationships (user, place) for each review,
-        so no additional queries are needed.
+        The response is built from one projection query (review, author
+        and place columns joined in) without loading ORM objects.
         
         Returns:
             200: List of all reviews with complete information
         """
-        # Fetch all reviews from the database
-        reviews = facade_instance.get_all_reviews()
+        # Response dicts of all reviews, straight from the result rows
+        reviews = facade_instance.list_reviews_projection()
         
-        # Convert each review object to a dictionary for JSON serialization
-        # SQLAlchemy relationships (user, place) are automatically loaded
-        return [r.to_dict() for r in reviews]
+        # ETag from the body: 304 if the client already has this version
+        return conditional_json_response(dumps_bytes(reviews, option=ISO_DATETIME_OPTIONS))
 
 
 @reviews_ns.route('/<string:review_id>')
@@ -228,8 +317,7 @@ class ReviewResource(Resource):
     - Deleting a review (DELETE - author/admin only)
     """
     
-    @reviews_ns.marshal_with(review_response_model)
-    @reviews_ns.response(200, 'Review details retrieved successfully')
+    @reviews_ns.response(200, 'Review details retrieved successfully', review_response_model)
     @reviews_ns.response(404, 'Review not found')
     def get(self, review_id):
         """
@@ -248,17 +336,17 @@ class ReviewResource(Resource):
             200: Review details with all relationships loaded
             404: Review with the given ID does not exist
         """
-        # Fetch the review from the database
-        review = facade_instance.get_review(review_id)
+        # Fetch the review from the database (user and place joined in)
+        review = facade_instance.get_review_details(review_id)
         
         # Return 404 if review doesn't exist
         if not review:
             reviews_ns.abort(404, 'Review not found')
         
-        # SQLAlchemy automatically loads user and place relationships
-        return review.to_dict()
+        # User and place are already loaded: serialize once
+        return json_response(review.to_response_dict())
 
-    @jwt_required()  # Requires valid JWT token
+    @cached_jwt_required  # Requires valid JWT token (verified claims are cached)
     @reviews_ns.expect(review_update_model, validate=True)
     @reviews_ns.response(200, 'Review updated successfully', review_response_model)
     @reviews_ns.response(400, 'Invalid input data')
@@ -293,51 +381,40 @@ class ReviewResource(Resource):
             403: User is not authorized to update this review
             404: Review not found
         """
-        # Get the authenticated user's ID from the JWT token
-        current_user_id = get_jwt_identity()
-        
-        # Get additional claims from the JWT (e.g., admin status)
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
-        
-        # Fetch the review to verify it exists and check authorship
-        review = facade_instance.get_review(review_id)
-        if not review:
-            reviews_ns.abort(404, 'Review not found')
-        
-        # Authorization check: Only the review author or admin can update
-        if review.user_id != current_user_id and not is_admin:
-            reviews_ns.abort(403, 'You can only update your own reviews')
-        
+        # Caller ('sub' claim, set on g by @cached_jwt_required) and
+        # admin role (resolved server-side once per request, kept on g)
+        current_user_id = g.jwt_identity
+        is_admin = current_is_admin()
+        
+        review_data = reviews_ns.payload
+        error = _review_input_error(review_data, partial=True)
+        if error:
+            # Invalid or restricted fields (rare path): authorization still
+            # decides first (404/403 before 400), as for any other caller
+            if not is_admin:
+                review = facade_instance.get_review(review_id)
+                if not review:
+                    reviews_ns.abort(404, 'Review not found')
+                if review.user_id != current_user_id:
+                    reviews_ns.abort(403, 'You can only update your own reviews')
+            reviews_ns.abort(400, error)
+        
+        # Authorization (author or admin), existence check and update in one
+        # guarded UPDATE: the review is not fetched first
         try:
-            # Update the review in the database
-            # The facade will handle validation and prevent updating restricted fields
-            updated_review = facade_instance.update_review(review_id, reviews_ns.payload)
-            if not updated_review:
-                reviews_ns.abort(404, 'Review not found')
-
-            # SQLAlchemy automatically reloads relationships
-            return updated_review.to_dict()
-        
-        except HTTPException:
-            # Re-raise HTTP exceptions (403, 404, etc.)
-            raise
-        except ValueError as e:
-            # Handle validation errors (e.g., invalid rating)
-            reviews_ns.abort(400, str(e))
-        except Exception as e:
-            # Handle unexpected errors
-            import traceback
-            print("=" * 80)
-            print("ERROR in PUT /reviews:")
-            print(f"Exception type: {type(e).__name__}")
-            print(f"Exception message: {str(e)}")
-            print("Full traceback:")
-            traceback.print_exc()
-            print("=" * 80)
-            reviews_ns.abort(500, f"Internal error: {str(e)}")
-
-    @jwt_required()  # Requires valid JWT token
+            updated_review = facade_instance.update_review_checked(
+                review_id, review_data, current_user_id, is_admin
+            )
+        except PermissionError as e:
+            reviews_ns.abort(403, str(e))
+        if not updated_review:
+            reviews_ns.abort(404, 'Review not found')
+        invalidate_review_lists(updated_review.place_id)
+
+        # Reloaded with its user and place joined in
+        return updated_review.to_dict()
+
+    @cached_jwt_required  # Requires valid JWT token (verified claims are cached)
     @reviews_ns.response(204, 'Review deleted successfully')
     @reviews_ns.response(403, 'Unauthorized - Only author or admin can delete')
     @reviews_ns.response(404, 'Review not found')
@@ -359,28 +436,26 @@ class ReviewResource(Resource):
             403: User is not authorized to delete this review
             404: Review not found
         """
-        # Get the authenticated user's ID from the JWT token
-        current_user_id = get_jwt_identity()
-        
-        # Get additional claims from the JWT (e.g., admin status)
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
-        
-        # Fetch the review to verify it exists and check authorship
-        review = facade_instance.get_review(review_id)
-        if not review:
-            reviews_ns.abort(404, 'Review not found')
-        
-        # Authorization check: Only the review author or admin can delete
-        if review.user_id != current_user_id and not is_admin:
-            reviews_ns.abort(403, 'You can only delete your own reviews')
+        # Caller ('sub' claim, set on g by @cached_jwt_required) and
+        # admin role (resolved server-side once per request, kept on g)
+        current_user_id = g.jwt_identity
+        is_admin = current_is_admin()
+        
+        # Authorization (author or admin), existence check and deletion in
+        # one guarded DELETE, no pre-fetch (the returned place_id tells
+        # whether a review was deleted)
+        try:
+            deleted_place_id = facade_instance.delete_review_checked(
+                review_id, current_user_id, is_admin
+            )
+        except PermissionError as e:
+            reviews_ns.abort(403, str(e))
         
-        # Delete the review from the database
-        if facade_instance.delete_review(review_id):
-            # Return 204 No Content on successful deletion
-            return {}, 204
+        if deleted_place_id is not None:
+            invalidate_review_lists(deleted_place_id)
+            # Return 204 No Content (empty body, nothing to serialize)
+            return Response(status=204)
         
-        # This shouldn't happen (we already checked), but handle it just in case
         reviews_ns.abort(404, 'Review not found')
 
 
@@ -394,8 +469,9 @@ class PlaceReviewList(Resource):
     Useful for displaying all reviews on a place's detail page.
     """
     
-    @reviews_ns.marshal_list_with(review_response_model)
-    @reviews_ns.response(200, 'List of reviews for the place retrieved successfully')
+    @cached_response('reviews:list:{place_id}')  # Public: served from Redis when available
+    @reviews_ns.response(200, 'List of reviews for the place retrieved successfully', [review_response_model])
+    @reviews_ns.response(304, 'Not modified (If-None-Match matches the ETag)')
     @reviews_ns.response(404, 'Place not found')
     def get(self, place_id):
         """
@@ -419,24 +495,19 @@ class PlaceReviewList(Resource):
             200: List of reviews for the place
             404: Place with the given ID does not exist
         """
-        # Fetch all reviews for the specified place
-        # The facade will return None if the place doesn't exist
-        reviews_data = facade_instance.get_reviews_by_place(place_id)
-
-        # Return 404 if place doesn't exist
-        if reviews_data is None:
+        # Response dicts of the place's reviews, straight from the result rows
+        # (a list, possibly empty; None if the place doesn't exist)
+        reviews = facade_instance.list_reviews_projection(place_id)
+        if reviews is None:
             reviews_ns.abort(404, 'Place not found')
 
-        # Ensure we always return a list (even if there's only one review)
-        # The facade might return a single object in some cases
-        reviews = reviews_data if isinstance(reviews_data, list) else [reviews_data]
-
-        # SQLAlchemy automatically loads user and place for each review
-        return [r.to_dict() for r in reviews]
+        # ETag from the body: 304 if the client already has this version
+        return conditional_json_response(dumps_bytes(reviews, option=ISO_DATETIME_OPTIONS))
     
-    @jwt_required()
+    @cached_jwt_required  # Requires valid JWT token (verified claims are cached)
     @reviews_ns.expect(review_create_model, validate=True)
     @reviews_ns.response(201, 'Review successfully created', review_response_model)
+    @reviews_ns.response(202, 'Review accepted, inserted asynchronously (review write queue)')
     @reviews_ns.response(400, 'Invalid input data')
     @reviews_ns.response(403, 'Unauthorized - Cannot review own place')
     @reviews_ns.response(404, 'Place not found')
@@ -458,53 +529,24 @@ class PlaceReviewList(Resource):
             
         Returns:
             201: Review created successfully
+            202: Review queued, inserted asynchronously (review write queue on)
             400: Invalid input (validation errors)
             403: Forbidden (trying to review own place)
             404: Place does not exist
             409: User has already reviewed this place
         """
-        # Get the authenticated user's ID from the JWT token
-        current_user_id = get_jwt_identity()
+        # Authenticated user's ID ('sub' claim, set on g by @cached_jwt_required)
+        current_user_id = g.jwt_identity
         
-        try:
-            # Extract review data from request body
-            review_data = reviews_ns.payload
-            
-            # Override place_id with the one from the URL
-            review_data['place_id'] = place_id
-            
-            # Set user_id to the authenticated user
-            review_data['user_id'] = current_user_id
-            
-            # Verify the place exists and get its details
-            place = facade_instance.get_place(place_id)
-            if not place:
-                reviews_ns.abort(404, 'Place not found')
-            
-            # Business rule: Users cannot review their own places
-            if place.owner_id == current_user_id:
-                reviews_ns.abort(403, 'You cannot review your own place')
-            
-            # Business rule: One review per user per place
-            if facade_instance.user_has_reviewed_place(current_user_id, place_id):
-                reviews_ns.abort(409, 'You have already reviewed this place')
-            
-            # Create the review in the database
-            review = facade_instance.create_review(review_data)
-            
-            return review.to_dict(), 201
-        
-        except HTTPException:
-            raise
-        except ValueError as e:
-            reviews_ns.abort(400, str(e))
-        except Exception as e:
-            import traceback
-            print("=" * 80)
-            print("ERROR in POST /places/<place_id>/reviews:")
-            print(f"Exception type: {type(e).__name__}")
-            print(f"Exception message: {str(e)}")
-            print("Full traceback:")
-            traceback.print_exc()
-            print("=" * 80)
-            reviews_ns.abort(500, f"Internal error: {str(e)}")
+        # Extract review data from request body
+        review_data = reviews_ns.payload
+        
+        # Override place_id with the one from the URL
+        review_data['place_id'] = place_id
+        
+        # Set user_id to the authenticated user
+        review_data['user_id'] = current_user_id
+        
+        # Input checks, then place owner, author existence and previous
+        # review in one query (invalid input: 400 before any database call)
+        return _create_checked_review(review_data, place_id, current_user_id)
@@ -20,9 +20,11 @@ Authorization model:
 """
 
 from flask_restx import Namespace, Resource, fields
-from flask import request
+from flask import g, request, Response
 from app import facade as facade_instance
-from flask_jwt_extended import jwt_required, get_jwt_identity, get_jwt
+from app.api.v1.reviews import invalidate_review_lists
+from app.services.json_provider import json_response
+from app.services.jwt_cache import cached_jwt_required, current_is_admin
 
 
 # Create a namespace for user-related operations
@@ -166,15 +168,11 @@ class UserList(Resource):
         except (ValueError, TypeError) as e:
             # Handle validation errors (invalid email, missing fields, etc.)
             users_ns.abort(400, message=str(e))
-        except Exception:
-            # Handle unexpected errors
-            users_ns.abort(500, message='Internal server error')
 
         # Return the created user (password is excluded by to_dict())
         return new_user.to_dict(), 201
 
-    @users_ns.marshal_list_with(user_response_model)
-    @users_ns.response(200, 'List of users retrieved successfully')
+    @users_ns.response(200, 'List of users retrieved successfully', [user_response_model])
     def get(self):
         """
         Retrieve a list of all registered users.
@@ -193,8 +191,9 @@ class UserList(Resource):
         # Fetch all users from the database
         users = facade_instance.get_all_user()
         
-        # Convert each user object to a dictionary (excludes password)
-        return [u.to_dict() for u in users]
+        # Straight-line serializer per user (excludes password): serialized
+        # directly, no marshalling pass over the list
+        return json_response([u.to_response_dict() for u in users])
 
 
 @users_ns.route('/<string:user_id>')
@@ -209,8 +208,7 @@ class UserResource(Resource):
     - Deleting a user (DELETE - admin only)
     """
 
-    @users_ns.marshal_with(user_response_model)
-    @users_ns.response(200, 'User details retrieved successfully')
+    @users_ns.response(200, 'User details retrieved successfully', user_response_model)
     @users_ns.response(404, 'User not found')
     def get(self, user_id):
         """
@@ -233,10 +231,10 @@ class UserResource(Resource):
         if not user:
             users_ns.abort(404, 'User not found')
         
-        # Return user data (password excluded by to_dict())
-        return user.to_dict()
+        # Return user data (password excluded), serialized directly
+        return json_response(user.to_response_dict())
 
-    @jwt_required()  # Requires valid JWT token
+    @cached_jwt_required  # Requires valid JWT token (verified claims are cached)
     @users_ns.expect(user_update_model, validate=True)
     @users_ns.marshal_with(user_response_model) 
     @users_ns.response(200, 'User successfully updated')
@@ -276,12 +274,10 @@ class UserResource(Resource):
             403: Trying to update another user's profile
             404: User not found
         """
-        # Get the authenticated user's ID from the JWT token
-        current_user_id = get_jwt_identity()
-        
-        # Get additional claims from the JWT
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
+        # Caller ('sub' claim, set on g by @cached_jwt_required) and
+        # admin role (resolved server-side once per request, kept on g)
+        current_user_id = g.jwt_identity
+        is_admin = current_is_admin()
         
         # Authorization check: User can only update their own profile
         if current_user_id != user_id:
@@ -321,12 +317,14 @@ class UserResource(Resource):
         # This shouldn't happen (we already checked), but handle it just in case
         if not updated_user:
             users_ns.abort(404, 'User not found')
+        # Cached review lists embed author names
+        invalidate_review_lists()
 
         # Return the updated user data
         return updated_user.to_dict()
 
-    @jwt_required()  # Requires valid JWT token
-    @users_ns.response(200, 'User successfully deleted')
+    @cached_jwt_required  # Requires valid JWT token (verified claims are cached)
+    @users_ns.response(204, 'User successfully deleted')
     @users_ns.response(403, 'Admin privileges required')
     @users_ns.response(404, 'User not found')
     def delete(self, user_id):
@@ -347,13 +345,12 @@ class UserResource(Resource):
             user_id (str): UUID of the user to delete
             
         Returns:
-            200: User deleted successfully
+            204: User deleted successfully (no content)
             403: Non-admin user attempting deletion
             404: User not found
         """
-        # Get additional claims from the JWT
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
+        # Caller's admin role (resolved server-side once per request, kept on g)
+        is_admin = current_is_admin()
         
         # Authorization check: Only admins can delete users
         if not is_admin:
@@ -366,9 +363,11 @@ class UserResource(Resource):
         # Return 404 if user doesn't exist
         if not deleted:
             users_ns.abort(404, 'User not found')
+        # Their reviews were deleted with them
+        invalidate_review_lists()
         
-        # Return success message
-        return {"message": "User successfully deleted"}, 200
+        # Return 204 No Content (empty body, nothing to serialize)
+        return Response(status=204)
 
 
 @users_ns.route('/admin/<string:user_id>')
@@ -381,7 +380,7 @@ class AdminUserResource(Resource):
     including sensitive fields like email and password.
     """
 
-    @jwt_required()  # Requires valid JWT token
+    @cached_jwt_required  # Requires valid JWT token (verified claims are cached)
     @users_ns.expect(admin_update_model, validate=True)
     @users_ns.marshal_with(user_response_model) 
     @users_ns.response(200, 'User successfully updated by admin')
@@ -416,9 +415,8 @@ class AdminUserResource(Resource):
             403: Non-admin user attempting admin operation
             404: User not found
         """
-        # Get additional claims from the JWT
-        claims = get_jwt()
-        is_admin = claims.get('is_admin', False)
+        # Caller's admin role (resolved server-side once per request, kept on g)
+        is_admin = current_is_admin()
         
         # Authorization check: Only admins can use this endpoint
         if not is_admin:
@@ -454,6 +452,8 @@ class AdminUserResource(Resource):
         # This shouldn't happen (we already checked), but handle it just in case
         if not updated_user:
             users_ns.abort(404, 'User not found')
+        # Cached review lists embed author names
+        invalidate_review_lists()
 
         # Return the updated user data
         return updated_user.to_dict()
\ No newline at end of file
@@ -9,6 +9,8 @@ such as WiFi, Pool, Parking, Air Conditioning, etc.
 Database schema:
 - Primary key: id (inherited from BaseModel, UUID)
 - Unique constraint: name (to avoid duplicates)
+- Unique column: name_ci = casefolded name (case-insensitive duplicate detection)
+- json_cache: API payload serialized on write, returned verbatim on read
 - Foreign keys: None (amenities are global resources)
 - Relationships: places (Many-to-Many via place_amenity table)
 
@@ -18,9 +20,13 @@ Business rules:
 - Owners select from existing amenities when creating places
 """
 
+import orjson
+import uuid
+from datetime import datetime
 from app import db
 from app.models.BaseModel import BaseModel
 from sqlalchemy.orm import validates
+from sqlalchemy.orm.attributes import flag_modified
 
 
 class Amenity(BaseModel):
@@ -34,6 +40,8 @@ class Amenity(BaseModel):
     
     Attributes:
         name (str): Unique name of the amenity (e.g., "WiFi", "Pool", "Parking")
+        name_ci (str): Casefolded name used for case-insensitive uniqueness
+        json_cache (str): Pre-serialized API payload (refreshed on every write)
         
     Relationships:
         places (List[Place]): Many-to-Many relationship with places via place_amenity table
@@ -41,6 +49,12 @@ class Amenity(BaseModel):
     
     __tablename__ = 'amenities'
     
+    # Amenity names are embedded in the place list: max(updated_at) is part
+    # of its fingerprint (PlaceRepository.get_list_version()), one index lookup
+    __table_args__ = (
+        db.Index('ix_amenities_updated_at', 'updated_at'),
+    )
+    
     # -----------------------
     # Database Columns
     # -----------------------
@@ -53,6 +67,21 @@ class Amenity(BaseModel):
         index=True       # Index for fast lookups
     )
     
+    # API payload serialized once per write ("serialize once, read many")
+    # Nullable: rows created before this column existed are serialized on read
+    json_cache = db.Column(db.Text, nullable=True)
+    
+    # Casefolded name, precomputed once at write time (set by validate_name)
+    # "WiFi", "wifi" and "WIFI" all map to "wifi": the unique index rejects
+    # duplicates (IntegrityError, answered 409), no lower() per row.
+    # casefold() also matches Unicode variants (e.g. "ß" and "ss")
+    name_ci = db.Column(
+        db.String(255),
+        nullable=False,
+        unique=True,
+        index=True
+    )
+    
     # -----------------------
     # Relationships
     # -----------------------
@@ -126,6 +155,9 @@ class Amenity(BaseModel):
         if len(value) > 255:
             raise ValueError("Amenity name must be less than 255 characters")
         
+        # Keep the case-insensitive form in sync with the name
+        self.name_ci = value.strip().casefold()
+        
         # Return cleaned value with leading/trailing whitespace removed
         return value.strip()
 
@@ -164,6 +196,10 @@ class Amenity(BaseModel):
         # Call parent to_dict() to get base fields (id, created_at, updated_at)
         data = super().to_dict(**kwargs)
         
+        # Internal columns (lookup key and pre-serialized payload) are not amenity fields
+        data.pop('name_ci', None)
+        data.pop('json_cache', None)
+        
         # The 'places' relationship is NOT included to avoid:
         # 1. Circular references (Place -> Amenity -> Place -> ...)
         # 2. Performance issues (loading entire object graphs)
@@ -171,6 +207,46 @@ class Amenity(BaseModel):
         
         return data
 
+    def refresh_json_cache(self):
+        """
+        Serialize the API payload of the amenity into json_cache.
+        
+        Must be called after every change to the amenity (the caller commits).
+        Missing id/timestamps (new, not yet flushed instance) are filled in
+        first so the cached payload matches what will be stored.
+        
+        The API payload is to_dict() without the '__class__' field
+        (same fields as the amenity response model).
+        """
+        now = datetime.utcnow()
+        if self.id is None:
+            self.id = str(uuid.uuid4())
+        if self.created_at is None:
+            self.created_at = now
+        if self.updated_at is None:
+            self.updated_at = now
+        
+        data = self.to_dict()
+        data.pop('__class__', None)
+        self.json_cache = orjson.dumps(data).decode('utf-8')
+        
+        # Keep updated_at in the UPDATE statement so its onupdate default
+        # does not fire and make the cached payload stale
+        flag_modified(self, 'updated_at')
+
+    def to_json(self):
+        """
+        Return the API payload of the amenity as a JSON string.
+        
+        Returns:
+            str: json_cache if available, otherwise a freshly serialized payload
+        """
+        if self.json_cache:
+            return self.json_cache
+        data = self.to_dict()
+        data.pop('__class__', None)
+        return orjson.dumps(data).decode('utf-8')
+
     def __repr__(self):
         """
         Return a string representation of the Amenity for debugging.
@@ -23,7 +23,9 @@ Business rules:
 from app import db
 from app.models.BaseModel import BaseModel
 from sqlalchemy.orm import validates
+from datetime import datetime
 from decimal import Decimal
+from operator import attrgetter
 
 
 # Many-to-Many association table between Place and Amenity
@@ -35,6 +37,41 @@ place_amenity = db.Table('place_amenity',
 )
 
 
+# Precompiled field projections used by Place.to_dict()
+# attrgetter fetches every field in a single C-level call instead of one
+# Python-level getattr per field (to_dict() runs once per serialized place)
+_PLACE_KEYS = ('title', 'description', 'price', 'latitude', 'longitude',
+               'id', 'created_at', 'updated_at')
+_place_fields = attrgetter(*_PLACE_KEYS)
+_OWNER_KEYS = ('id', 'first_name', 'last_name', 'email')
+_owner_fields = attrgetter(*_OWNER_KEYS)
+_AMENITY_KEYS = ('id', 'name')
+_amenity_fields = attrgetter(*_AMENITY_KEYS)
+_REVIEW_KEYS = ('id', 'text', 'rating', 'user_id')
+_review_fields = attrgetter(*_REVIEW_KEYS)
+
+
+def _format_place_fields(place_dict):
+    """
+    Add the class marker and convert the base place fields to API formats
+    (Place.to_dict(); Place.summaries_from_rows() inlines the same steps).
+    Args: place_dict (dict): _PLACE_KEYS values of a place
+    Returns: dict: The same dict, JSON-ready
+    """
+    place_dict['__class__'] = 'Place'
+    
+    # Timestamps as ISO 8601 strings (API format, no UTC offset)
+    for key in ('created_at', 'updated_at'):
+        if isinstance(place_dict[key], datetime):
+            place_dict[key] = place_dict[key].isoformat()
+    
+    # Convert Decimal price to float for JSON compatibility
+    # JSON doesn't support Decimal type, only float
+    if isinstance(place_dict['price'], Decimal):
+        place_dict['price'] = float(place_dict['price'])
+    return place_dict
+
+
 class Place(BaseModel):
     """
     Place model representing rental properties/accommodations.
@@ -60,6 +97,15 @@ class Place(BaseModel):
     
     __tablename__ = 'places'
     
+    # Composite index for the keyset-paginated list (newest first):
+    # ORDER BY created_at DESC, id DESC / WHERE (created_at, id) < (...)
+    # updated_at index: max(updated_at) of the list fingerprint (ETag) is
+    # one index lookup instead of a table scan
+    __table_args__ = (
+        db.Index('ix_places_created_at_id', 'created_at', 'id'),
+        db.Index('ix_places_updated_at', 'updated_at'),
+    )
+    
     # -----------------------
     # Database Columns
     # -----------------------
@@ -91,9 +137,10 @@ class Place(BaseModel):
     owner = db.relationship('User', back_populates='places')
     
     # One-to-Many: One place has many reviews
+    # back_populates='place' creates bidirectional relationship with Review.place
     # cascade='all, delete-orphan' deletes all reviews when place is deleted
     # lazy=True loads reviews only when accessed (on-demand loading)
-    reviews = db.relationship('Review', backref='place', lazy=True, cascade='all, delete-orphan')
+    reviews = db.relationship('Review', back_populates='place', lazy=True, cascade='all, delete-orphan')
     
     # Many-to-Many: Place has many amenities, Amenity has many places
     # secondary='place_amenity' specifies the association table
@@ -290,7 +337,7 @@ class Place(BaseModel):
         if amenity not in self.amenities:
             self.amenities.append(amenity)
 
-    def to_dict(self, **kwargs):
+    def to_dict(self, include_reviews=True, **kwargs):
         """
         Convert the Place instance to a dictionary for JSON serialization.
         
@@ -309,7 +356,9 @@ class Place(BaseModel):
         - reviews are loaded via lazy=True (on-demand)
         
         Args:
-            **kwargs: Additional arguments passed to BaseModel.to_dict()
+            include_reviews (bool): Embed the reviews list (False for the
+                                    place list, which only shows summaries)
+            **kwargs: Reserved for future extensions (currently unused)
             
         Returns:
             dict: Complete place data with all relationships
@@ -336,58 +385,84 @@ class Place(BaseModel):
                 ]
             }
         """
-        # Get base dictionary from BaseModel (id, created_at, updated_at, etc.)
-        place_dict = super().to_dict(**kwargs)
-        
-        # Convert Decimal price to float for JSON compatibility
-        # JSON doesn't support Decimal type, only float
-        if 'price' in place_dict and isinstance(place_dict['price'], Decimal):
-            place_dict['price'] = float(place_dict['price'])
+        # Base fields in one projection (same keys as BaseModel.to_dict(),
+        # owner_id excluded: replaced by the owner object below)
+        place_dict = _format_place_fields(dict(zip(_PLACE_KEYS, _place_fields(self))))
 
         # ----- OWNER ----- (SQLAlchemy relationship loaded automatically)
-        if hasattr(self, 'owner') and self.owner:
-            # Owner is loaded, create nested dictionary
-            place_dict['owner'] = {
-                'id': self.owner.id,
-                'first_name': self.owner.first_name,
-                'last_name': self.owner.last_name,
-                'email': self.owner.email
-            }
+        owner = self.owner
+        if owner:
+            place_dict['owner'] = dict(zip(_OWNER_KEYS, _owner_fields(owner)))
         else:
             # Fallback if owner relationship is not loaded (shouldn't happen with eager loading)
             place_dict['owner'] = {
-                'id': place_dict.get('owner_id'),
+                'id': self.owner_id,
                 'first_name': None,
                 'last_name': None,
                 'email': None
             }
-        # Remove raw owner_id from output (replaced by owner object)
-        place_dict.pop('owner_id', None)
 
         # ----- AMENITIES ----- (SQLAlchemy relationship loaded via lazy='subquery')
-        place_dict['amenities'] = []
-        if hasattr(self, 'amenities') and self.amenities:
-            # Iterate through loaded amenities and create minimal dictionaries
-            for amenity in self.amenities:
-                place_dict['amenities'].append({
-                    'id': amenity.id,
-                    'name': amenity.name
-                })
+        place_dict['amenities'] = [
+            dict(zip(_AMENITY_KEYS, _amenity_fields(amenity)))
+            for amenity in self.amenities
+        ]
 
         # ----- REVIEWS ----- (SQLAlchemy relationship loaded via lazy=True)
-        place_dict['reviews'] = []
-        if hasattr(self, 'reviews') and self.reviews:
-            # Iterate through loaded reviews and create minimal dictionaries
-            for review in self.reviews:
-                place_dict['reviews'].append({
-                    'id': review.id,
-                    'text': review.text,
-                    'rating': review.rating,
-                    'user_id': review.user_id
-                })
+        if include_reviews:
+            place_dict['reviews'] = [
+                dict(zip(_REVIEW_KEYS, _review_fields(review)))
+                for review in self.reviews
+            ]
 
         return place_dict
 
+    @staticmethod
+    def summaries_from_rows(rows, amenities_by_place):
+        """
+        Build the summary payloads of a page of places (to_dict(include_reviews=False))
+        from plain result rows, without loading Place objects.
+        
+        One comprehension over the whole page: each row is unpacked by
+        position (no per-field getattr, no method call per place), and the
+        conversions are applied inline.
+        
+        Args:
+            rows (list): Rows of PlaceRepository.get_page(), columns in this
+                         order: id, title, description, price, latitude,
+                         longitude, owner_id, created_at, updated_at,
+                         owner_first_name, owner_last_name, owner_email,
+                         key_created_at
+            amenities_by_place (dict): place_id -> list of {'id', 'name'} dicts
+            
+        Returns:
+            list: Dicts with the same keys, order and formats as
+                  to_dict(include_reviews=False)
+        """
+        return [
+            {
+                'title': title,
+                'description': description,
+                # Numeric column: Decimal -> float for JSON
+                'price': float(price) if isinstance(price, Decimal) else price,
+                'latitude': latitude,
+                'longitude': longitude,
+                'id': place_id,
+                'created_at': created_at.isoformat(),
+                'updated_at': updated_at.isoformat(),
+                '__class__': 'Place',
+                'owner': {
+                    'id': owner_id,
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'email': email
+                },
+                'amenities': amenities_by_place.get(place_id, [])
+            }
+            for (place_id, title, description, price, latitude, longitude, owner_id,
+                 created_at, updated_at, first_name, last_name, email, _key) in rows
+        ]
+
     def __repr__(self):
         """
         Return a string representation of the Place for debugging.
@@ -8,7 +8,7 @@ Reviews are ratings and comments that users leave about places they've visited.
 Database schema:
 - Primary key: id (inherited from BaseModel, UUID)
 - Foreign keys: user_id (references users.id), place_id (references places.id)
-- Unique constraint: (user_id, place_id) - One review per user per place
+- Unique constraint: (place_id, user_id) - One review per user per place
 - Relationships: user (User), place (Place)
 
 Business rules:
@@ -43,15 +43,17 @@ class Review(BaseModel):
         place (Place): The place being reviewed (Many-to-One)
         
     Database constraints:
-        - UNIQUE(user_id, place_id): Prevents duplicate reviews
+        - UNIQUE(place_id, user_id): Prevents duplicate reviews
     """
     
     __tablename__ = 'reviews'
 
     # Unique constraint: One user can only review each place once
     # This is enforced at the database level for data integrity
+    # place_id leads: its index also serves every "reviews of a place"
+    # query (list by place, version fingerprints, creation checks)
     __table_args__ = (
-        db.UniqueConstraint('user_id', 'place_id', name='unique_user_place_review'),
+        db.UniqueConstraint('place_id', 'user_id', name='uq_reviews_place_user'),
     )
     
     # -----------------------
@@ -70,16 +72,21 @@ class Review(BaseModel):
     user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False, index=True)
     
     # Foreign key to Place (being reviewed)
-    # index=True for faster queries like "find all reviews for a place"
-    place_id = db.Column(db.String(36), db.ForeignKey('places.id'), nullable=False, index=True)
+    # No separate index: "find all reviews for a place" queries use the
+    # (place_id, user_id) unique index (see __table_args__)
+    place_id = db.Column(db.String(36), db.ForeignKey('places.id'), nullable=False)
     
     # -----------------------
     # Relationships
     # -----------------------
-    # Relationships are defined via backref in User and Place models
-    # - User model has: reviews = relationship('Review', backref='user')
-    # - Place model has: reviews = relationship('Review', backref='place')
-    # This creates bidirectional relationships automatically
+    
+    # Many-to-One: Many reviews are written by one user
+    # back_populates='reviews' creates bidirectional relationship with User.reviews
+    user = db.relationship('User', back_populates='reviews')
+    
+    # Many-to-One: Many reviews are about one place
+    # back_populates='reviews' creates bidirectional relationship with Place.reviews
+    place = db.relationship('Place', back_populates='reviews')
 
     def __init__(self, place_id=None, user_id=None, text=None, rating=None, **kwargs):
         """
@@ -180,7 +187,7 @@ class Review(BaseModel):
         - Place information (nested object with id, title)
         
         Relationship loading:
-        - user and place relationships are loaded via backref
+        - user and place relationships are declared with back_populates
         - SQLAlchemy automatically loads these relationships when accessed
         
         Args:
@@ -210,7 +217,7 @@ class Review(BaseModel):
         # Get base dictionary from BaseModel (id, created_at, updated_at, etc.)
         review_dict = super().to_dict(**kwargs)
 
-        # ----- USER ----- (SQLAlchemy relationship loaded via backref)
+        # ----- USER ----- (SQLAlchemy relationship, loaded on access)
         if hasattr(self, 'user') and self.user:
             # User relationship is loaded, create nested dictionary
             review_dict['user'] = {
@@ -228,7 +235,7 @@ class Review(BaseModel):
         # Remove raw user_id from output (replaced by user object)
         review_dict.pop('user_id', None)
 
-        # ----- PLACE ----- (SQLAlchemy relationship loaded via backref)
+        # ----- PLACE ----- (SQLAlchemy relationship, loaded on access)
         if hasattr(self, 'place') and self.place:
             # Place relationship is loaded, create nested dictionary
             review_dict['place'] = {
@@ -246,6 +253,74 @@ class Review(BaseModel):
 
         return review_dict
 
+    def to_response_dict(self):
+        """
+        Build the API representation of the review in a single pass.
+        
+        Produces exactly what marshalling to_dict() with the ReviewResponse
+        model used to return (same keys and order, rating as float, no
+        '__class__' nor raw foreign keys), without first building the full
+        column dictionary and then re-walking it field by field.
+        The read endpoints serialize the result directly (json_response()).
+        
+        Returns:
+            dict: id, text, rating, user {id, first_name, last_name},
+                  place {id, title}, created_at, updated_at
+        """
+        user = self.user
+        place = self.place
+        return {
+            'id': self.id,
+            'text': self.text,
+            'rating': float(self.rating) if self.rating is not None else None,
+            'user': {
+                'id': user.id,
+                'first_name': user.first_name,
+                'last_name': user.last_name
+            } if user else {'id': self.user_id, 'first_name': None, 'last_name': None},
+            'place': {
+                'id': place.id,
+                'title': place.title
+            } if place else {'id': self.place_id, 'title': None},
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+        }
+
+    @staticmethod
+    def responses_from_rows(rows):
+        """
+        Build the API representations of a review list (to_response_dict())
+        from plain result rows, without loading Review objects.
+        
+        One comprehension over the whole list: each row is unpacked by
+        position and the conversions are applied inline.
+        The timestamps are left as datetime objects: serialized with
+        dumps_bytes(..., option=ISO_DATETIME_OPTIONS), they come out as
+        the same isoformat() strings, without a Python call per value.
+        
+        Args:
+            rows (list): Rows of ReviewRepository.get_list_rows(), columns in
+                         this order: id, text, rating, created_at, updated_at,
+                         user_id, first_name, last_name, place_id, title
+        
+        Returns:
+            list: Dicts with the same keys and order as to_response_dict()
+                  (datetimes not yet converted to strings)
+        """
+        return [
+            {
+                'id': review_id,
+                'text': text,
+                'rating': float(rating) if rating is not None else None,
+                'user': {'id': user_id, 'first_name': first_name, 'last_name': last_name},
+                'place': {'id': place_id, 'title': title},
+                'created_at': created_at,
+                'updated_at': updated_at,
+            }
+            for (review_id, text, rating, created_at, updated_at,
+                 user_id, first_name, last_name, place_id, title) in rows
+        ]
+
     def __repr__(self):
         """
         Return a string representation of the Review for debugging.
@@ -28,6 +28,7 @@ Business rules:
 from app import db, bcrypt
 from app.models.BaseModel import BaseModel
 from sqlalchemy.orm import validates
+from app.services.bcrypt_pool import run_in_pool
 from email_validator import validate_email, EmailNotValidError
 
 
@@ -55,6 +56,12 @@ class User(BaseModel):
     
     __tablename__ = 'users'
     
+    # Owners are embedded in the place list: max(updated_at) is part of
+    # its fingerprint (PlaceRepository.get_list_version()), one index lookup
+    __table_args__ = (
+        db.Index('ix_users_updated_at', 'updated_at'),
+    )
+    
     # -----------------------
     # Database Columns
     # -----------------------
@@ -88,9 +95,9 @@ class User(BaseModel):
     places = db.relationship('Place', back_populates='owner', lazy=True, cascade='all, delete-orphan')
     
     # One-to-Many: User can write multiple reviews
-    # backref='user' creates User.reviews attribute and Review.user attribute
+    # back_populates='user' creates bidirectional relationship with Review.user
     # cascade='all, delete-orphan' deletes all reviews when user is deleted
-    reviews = db.relationship('Review', backref='user', lazy=True, cascade='all, delete-orphan')
+    reviews = db.relationship('Review', back_populates='user', lazy=True, cascade='all, delete-orphan')
 
     def __init__(self, first_name=None, last_name=None, email=None, password=None, is_admin=False, **kwargs):
         """
@@ -175,13 +182,16 @@ class User(BaseModel):
         Security:
             - Constant-time comparison (prevents timing attacks)
             - Automatically handles salt extraction from hash
+            - Runs on gevent's thread pool under gevent (bcrypt is CPU-bound)
             
         Usage:
             >>> user = User.query.filter_by(email='john@example.com').first()
             >>> if user.verify_password('userPassword123'):
             >>>     print("Login successful")
         """
-        return bcrypt.check_password_hash(self.password, password)
+        # Under gevent, computed on a pool thread so the worker's event loop
+        # keeps serving other requests meanwhile (see app.services.bcrypt_pool)
+        return run_in_pool(bcrypt.check_password_hash, self.password, password)
 
     # -----------------------
     # SQLAlchemy Validators
@@ -335,6 +345,30 @@ class User(BaseModel):
         
         return data
 
+    def to_response_dict(self):
+        """
+        Build the API representation of the user in a single pass.
+        
+        Produces exactly what marshalling to_dict() with the UserResponse
+        model returns (same keys and order, no '__class__' nor password),
+        without first building the full column dictionary and then
+        re-walking it field by field.
+        The read endpoints serialize the result directly (json_response()).
+        
+        Returns:
+            dict: id, first_name, last_name, email, is_admin,
+                  created_at, updated_at
+        """
+        return {
+            'id': self.id,
+            'first_name': self.first_name,
+            'last_name': self.last_name,
+            'email': self.email,
+            'is_admin': bool(self.is_admin),
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
+        }
+
     def __repr__(self):
         """
         Return a string representation of the User for debugging.
@@ -13,12 +13,28 @@ The repository pattern provides:
 
 Amenity-specific queries:
 - get_amenity_by_name(): Find amenity by name (not unique, returns first match)
+- list_amenity_rows(): Read the listing columns of all amenities (no ORM objects)
+- get_all_ids(): IDs of every amenity (id column only)
+- get_by_ids(): Load several amenities in one query
+- delete_by_id(): Delete an amenity without loading it first
 """
 
+from datetime import datetime
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.orm import lazyload
+from app import db
 from app.models.amenity import Amenity
+from app.models.place import Place, place_amenity
 from app.persistence.repository import SQLAlchemyRepository
 
 
+# ID lookup built once at import time, with an expanding IN parameter:
+# every call reuses the same statement object (and its compiled form from
+# SQLAlchemy's cache) whatever the number of IDs, instead of building and
+# cache-keying a new select() per request
+_BY_IDS_STMT = select(Amenity).where(Amenity.id.in_(bindparam('ids', expanding=True)))
+
+
 class AmenityRepository(SQLAlchemyRepository):
     """
     Repository for Amenity-specific database operations.
@@ -32,6 +48,8 @@ class AmenityRepository(SQLAlchemyRepository):
     
     Amenity-specific methods:
     - get_amenity_by_name(name): Find amenity by name
+    - list_amenity_rows(batch): Plain rows for the amenity listing, batch by batch
+    - delete_by_id(amenity_id): Delete amenity, reporting whether it existed
     """
     
     def __init__(self):
@@ -69,4 +87,117 @@ class AmenityRepository(SQLAlchemyRepository):
             - Returns FIRST match only (names are not unique)
             - Returns None if no match found
         """
-        return self.model.query.filter_by(name=name).first()
\ No newline at end of file
+        return self.model.query.filter_by(name=name).first()
+
+    def list_amenity_rows(self, batch=500):
+        """
+        Read the columns needed by the amenity listing, as plain rows.
+        
+        Uses a Core column SELECT instead of loading Amenity objects:
+        no ORM instance, no identity-map entry, no relationship loading.
+        Rows are fetched from the database cursor `batch` at a time
+        (yield_per), so only one batch is held in memory at once.
+        
+        Args:
+            batch (int): Number of rows fetched per round-trip (default: 500)
+            
+        Returns:
+            Iterator[Row]: Rows with id, name, created_at, updated_at, json_cache
+        
+        SQL equivalent:
+            SELECT id, name, created_at, updated_at, json_cache FROM amenities
+        
+        Note:
+            The iterator must be consumed while the session is still open
+            (e.g. inside the request context).
+        """
+        query = select(
+            self.model.id,
+            self.model.name,
+            self.model.created_at,
+            self.model.updated_at,
+            self.model.json_cache
+        ).execution_options(yield_per=batch)
+        return db.session.execute(query)
+    
+    def get_all_ids(self):
+        """
+        Read the IDs of all amenities.
+        
+        Only the id column is selected (plain values, no Amenity objects);
+        the amenity table is small and admin-managed, so the whole set can
+        be cached by the caller.
+        
+        Returns:
+            set: Every amenity ID
+        
+        SQL equivalent:
+            SELECT id FROM amenities
+        """
+        return set(db.session.execute(select(self.model.id)).scalars())
+
+    def get_by_ids(self, amenity_ids):
+        """
+        Load the amenities with the given IDs in a single query.
+        
+        Args:
+            amenity_ids (list): Amenity UUIDs (duplicates allowed)
+            
+        Returns:
+            dict: {amenity_id: Amenity} for the IDs that exist
+        
+        SQL equivalent:
+            SELECT * FROM amenities WHERE id IN (:id1, :id2, ...)
+        """
+        if not amenity_ids:
+            return {}
+        # Amenity.places is eager (lazy='subquery'): callers only attach these
+        # amenities to a place, so the places of each amenity are not loaded
+        # (option added per call: it needs the mappers configured)
+        query = _BY_IDS_STMT.options(lazyload(self.model.places))
+        amenities = db.session.scalars(query, {'ids': list(set(amenity_ids))})
+        return {amenity.id: amenity for amenity in amenities}
+    
+    def delete_by_id(self, amenity_id):
+        """
+        Delete an amenity by ID without loading it first.
+        
+        The affected row count of the DELETE tells whether the amenity
+        existed, so no preliminary SELECT is needed.
+        
+        Args:
+            amenity_id (str): UUID of the amenity to delete
+            
+        Returns:
+            bool: True if an amenity was deleted, False if not found
+        
+        SQL equivalent:
+            UPDATE places SET updated_at = :now WHERE id IN
+                (SELECT place_id FROM place_amenity WHERE amenity_id = :id)
+            DELETE FROM place_amenity WHERE amenity_id = :id
+            DELETE FROM amenities WHERE id = :id
+        
+        Note:
+            Links in place_amenity are removed explicitly: bulk DELETE
+            bypasses ORM relationship handling and SQLite does not enforce
+            ON DELETE CASCADE unless foreign keys are enabled.
+            The places that lose the amenity are touched (updated_at) first,
+            so the place list fingerprint changes (see
+            PlaceRepository.get_list_version()).
+        """
+        linked_places = select(place_amenity.c.place_id).where(
+            place_amenity.c.amenity_id == amenity_id
+        )
+        db.session.execute(
+            update(Place).where(Place.id.in_(linked_places))
+            .values(updated_at=datetime.utcnow()),
+            execution_options={'synchronize_session': False}
+        )
+        db.session.execute(
+            delete(place_amenity).where(place_amenity.c.amenity_id == amenity_id)
+        )
+        result = db.session.execute(
+            delete(self.model).where(self.model.id == amenity_id)
+        )
+        db.session.commit()
+        return result.rowcount > 0
\ No newline at end of file
@@ -13,12 +13,34 @@ The repository pattern provides:
 
 Place-specific queries:
 - get_places_by_owner(): Find all places owned by a specific user
+- get_owner_id(): Read only the owner_id of a place
+- get_for_update(): Load a place and lock its row until commit
+- get_page(): One keyset-paginated page of place summary rows (no ORM objects)
+- get_with_relations(): One place with owner/amenities/reviews preloaded
+- delete_if_owner(): Delete a place (and its reviews/links) without loading it
+- get_version() / get_list_version(): Change fingerprints for conditional GETs
 """
 
-from app.models.place import Place
+from flask import current_app
+from sqlalchemy import String, bindparam, delete, func, select, tuple_, type_coerce
+from sqlalchemy.orm import joinedload, lazyload, raiseload, selectinload
+from app import db
+from app.models.amenity import Amenity
+from app.models.place import Place, place_amenity
+from app.models.review import Review
+from app.models.user import User
 from app.persistence.repository import SQLAlchemyRepository
 
 
+# Amenities of a list page, built once at import time: the expanding IN
+# parameter lets every page reuse the same statement whatever its size
+_PAGE_AMENITIES_STMT = (
+    select(place_amenity.c.place_id, Amenity.id, Amenity.name)
+    .join(Amenity, Amenity.id == place_amenity.c.amenity_id)
+    .where(place_amenity.c.place_id.in_(bindparam('place_ids', expanding=True)))
+)
+
+
 class PlaceRepository(SQLAlchemyRepository):
     """
     Repository for Place-specific database operations.
@@ -32,6 +54,13 @@ class PlaceRepository(SQLAlchemyRepository):
     
     Place-specific methods:
     - get_places_by_owner(owner_id): Find all places owned by a user
+    - get_owner_id(place_id): Owner UUID of a place (single column)
+    - get_for_update(place_id): Place with its row locked (SELECT ... FOR UPDATE)
+    - get_page(limit, after): Newest places first, keyset pagination
+    - get_with_relations(place_id): One place, relationships loaded in 3 queries
+    - delete_if_owner(place_id, owner_id): Guarded DELETE, no SELECT first
+    - get_version(place_id): Fingerprint of everything a place response shows
+    - get_list_version(): Same fingerprint for the whole place list
     """
     
     def __init__(self):
@@ -73,4 +102,292 @@ class PlaceRepository(SQLAlchemyRepository):
             - Results are NOT ordered (add .order_by() if needed)
             - Includes places even if they have no reviews/amenities
         """
-        return self.model.query.filter_by(owner_id=owner_id).all()
\ No newline at end of file
+        return self.model.query.filter_by(owner_id=owner_id).all()
+    
+    def get_owner_id(self, place_id):
+        """
+        Get the owner UUID of a place without loading the Place object.
+        
+        Authorization checks (owner or admin) only need owner_id, so this
+        selects that single column: no Place instance, no eager loading of
+        amenities/reviews/owner relationships.
+        
+        Args:
+            place_id (str): UUID of the place
+            
+        Returns:
+            str: owner_id of the place, or None if the place doesn't exist
+        
+        SQL equivalent:
+            SELECT owner_id FROM places WHERE id = :place_id
+        """
+        return db.session.query(self.model.owner_id).filter_by(id=place_id).scalar()
+    
+    def get_for_update(self, place_id):
+        """
+        Load a place and lock its row for the rest of the transaction.
+        
+        Used by checked mutations (authorization check + update/delete)
+        so ownership is read and acted upon in one transaction, without
+        a separate owner lookup. Relationships are not eager-loaded
+        (row locks cannot be combined with outer joins on some backends).
+        
+        Args:
+            place_id (str): UUID of the place
+            
+        Returns:
+            Place: Locked place object, or None if the place doesn't exist
+        
+        SQL equivalent:
+            SELECT * FROM places WHERE id = :place_id FOR UPDATE
+            (SQLite ignores FOR UPDATE: writes are serialized per database)
+        """
+        return db.session.get(
+            self.model, place_id, options=[lazyload('*')], with_for_update=True
+        )
+
+    def _relation_options(self):
+        """
+        Loader options preloading owner/amenities/reviews (raiseload in debug).
+        The owner is many-to-one (one row per place), so it is joined into
+        the place query itself; the collections use one IN query each.
+        Only the columns Place.to_dict() embeds are loaded (load_only): no
+        password hash, amenity JSON cache or timestamps are fetched and
+        hydrated for the related objects.
+        """
+        options = [
+            joinedload(self.model.owner).load_only(
+                User.id, User.first_name, User.last_name, User.email
+            ),
+            selectinload(self.model.amenities).load_only(Amenity.id, Amenity.name),
+            selectinload(self.model.reviews).load_only(
+                Review.id, Review.text, Review.rating, Review.user_id
+            ),
+        ]
+        if current_app.debug:
+            options.append(raiseload('*'))
+        return options
+    
+    def get_with_relations(self, place_id):
+        """
+        Get one place with the relationships serialized by to_dict() preloaded.
+        
+        The owner is joined into the place query, amenities and reviews
+        use one IN query each, instead of one lazy load per relationship.
+        
+        Goes through Session.get(): a place already loaded (and not
+        expired) in this session is returned from the identity map
+        without any SQL.
+        
+        Args:
+            place_id (str): UUID of the place
+            
+        Returns:
+            Place: Place with owner, amenities and reviews loaded,
+                   or None if the place doesn't exist
+        
+        SQL equivalent:
+            SELECT * FROM places LEFT OUTER JOIN users ON users.id = places.owner_id
+            WHERE places.id = :place_id
+            (+ 2 selectinload queries for amenities, reviews)
+        """
+        return db.session.get(self.model, place_id, options=self._relation_options())
+    
+    def get_page(self, limit, after=None):
+        """
+        Get one page of place summaries, newest first, as plain rows.
+        
+        The list only serializes, so no Place/User/Amenity objects are
+        built (no identity map, no attribute instrumentation): the place
+        columns and its owner's columns come from one joined SELECT, the
+        amenities of the page from one IN query over the association table.
+        Reviews are not part of the list (see Place.summaries_from_rows()).
+        
+        Keyset pagination on (created_at, id): the next page starts
+        strictly after the last row of the previous one, so the cost of
+        a page does not grow with its position (no OFFSET scan) and rows
+        inserted meanwhile do not shift the pages.
+        
+        created_at is compared and returned as stored (type_coerce to
+        String, no CAST in SQL): SQLite stores DATETIME as text, and rows
+        inserted by setup_hbnb_db.sql have no microseconds, so a value
+        re-bound from a Python datetime would not compare equal to it.
+        
+        Args:
+            limit (int): Maximum number of places to return
+            after (tuple): (created_at, id) key of the last place of the
+                           previous page, or None for the first page
+            
+        Returns:
+            tuple: (rows, amenity_rows, next_key)
+                   - rows: place rows (place columns, owner_first_name,
+                     owner_last_name, owner_email)
+                   - amenity_rows: (place_id, id, name) rows for these places
+                   - next_key: (created_at, id) key to pass as 'after' for
+                     the next page, or None if this is the last page
+        
+        SQL equivalent:
+            SELECT places.<columns>, users.first_name, users.last_name, users.email
+            FROM places LEFT OUTER JOIN users ON users.id = places.owner_id
+            WHERE (places.created_at, places.id) < (:created_at, :id)
+            ORDER BY places.created_at DESC, places.id DESC
+            LIMIT :limit + 1
+            
+            SELECT place_amenity.place_id, amenities.id, amenities.name
+            FROM place_amenity JOIN amenities ON amenities.id = place_amenity.amenity_id
+            WHERE place_amenity.place_id IN (:place_ids)
+        """
+        created_at = type_coerce(self.model.created_at, String)
+        query = (
+            select(
+                self.model.id, self.model.title, self.model.description,
+                self.model.price, self.model.latitude, self.model.longitude,
+                self.model.owner_id, self.model.created_at, self.model.updated_at,
+                User.first_name.label('owner_first_name'),
+                User.last_name.label('owner_last_name'),
+                User.email.label('owner_email'),
+                created_at.label('key_created_at'),
+            )
+            .outerjoin(User, User.id == self.model.owner_id)
+            .order_by(created_at.desc(), self.model.id.desc())
+            # One extra row tells whether a next page exists
+            .limit(limit + 1)
+        )
+        if after is not None:
+            query = query.where(tuple_(created_at, self.model.id) < tuple_(*after))
+        rows = db.session.execute(query).all()
+        
+        next_key = None
+        if len(rows) > limit:
+            last_row = rows[limit - 1]
+            next_key = (str(last_row.key_created_at), last_row.id)
+            rows = rows[:limit]
+        
+        amenity_rows = []
+        if rows:
+            amenity_rows = db.session.execute(
+                _PAGE_AMENITIES_STMT, {'place_ids': [row.id for row in rows]}
+            ).all()
+        return rows, amenity_rows, next_key
+    
+    def delete_if_owner(self, place_id, owner_id=None):
+        """
+        Delete a place without loading it, if it belongs to owner_id.
+        
+        The ownership condition is part of the DELETE itself, so the
+        existence check, the authorization check and the deletion are a
+        single statement on places (no SELECT ... then DELETE).
+        Reviews and amenity links are removed first with the same
+        condition: these are the rows the ORM cascade would delete, and
+        Core statements bypass that cascade.
+        
+        Args:
+            place_id (str): UUID of the place
+            owner_id (str): Required owner UUID, or None to skip the
+                            ownership condition (admin)
+            
+        Returns:
+            bool: True if deleted, False if no place matched
+                  (not found, or not owned by owner_id)
+        
+        SQL equivalent:
+            DELETE FROM reviews WHERE place_id IN
+                (SELECT id FROM places WHERE id = :place_id AND owner_id = :owner_id)
+            DELETE FROM place_amenity WHERE place_id IN (...same subquery...)
+            DELETE FROM places WHERE id = :place_id AND owner_id = :owner_id
+        """
+        conditions = [self.model.id == place_id]
+        if owner_id is not None:
+            conditions.append(self.model.owner_id == owner_id)
+        target = select(self.model.id).where(*conditions)
+        
+        # synchronize_session=False: nothing to reconcile, the rows were
+        # never loaded into the session
+        db.session.execute(
+            delete(Review).where(Review.place_id.in_(target)),
+            execution_options={'synchronize_session': False}
+        )
+        db.session.execute(
+            delete(place_amenity).where(place_amenity.c.place_id.in_(target))
+        )
+        result = db.session.execute(
+            delete(self.model).where(*conditions),
+            execution_options={'synchronize_session': False}
+        )
+        db.session.commit()
+        return result.rowcount > 0
+    
+    def get_version(self, place_id):
+        """
+        Fingerprint of everything the response of one place depends on.
+        
+        A place response embeds its owner, amenities and reviews, so the
+        place's own updated_at is not enough: adding a review or renaming
+        an amenity changes the response without touching the place row.
+        Every ORM write bumps updated_at (onupdate), and deletions change
+        the counts, so the tuple changes whenever the response does.
+        All values come from one aggregate query on indexed columns
+        (no Place, User, Amenity or Review object is loaded).
+        
+        Args:
+            place_id (str): UUID of the place
+            
+        Returns:
+            tuple: (place, owner, reviews count, reviews max, amenities
+                   count, amenities max updated_at), or None if the place
+                   doesn't exist
+        """
+        place_id_col = self.model.id
+        query = (
+            select(
+                self.model.updated_at,
+                User.updated_at,
+                select(func.count(Review.id))
+                .where(Review.place_id == place_id_col).scalar_subquery(),
+                select(func.max(Review.updated_at))
+                .where(Review.place_id == place_id_col).scalar_subquery(),
+                select(func.count(place_amenity.c.amenity_id))
+                .where(place_amenity.c.place_id == place_id_col).scalar_subquery(),
+                select(func.max(Amenity.updated_at))
+                .join(place_amenity, place_amenity.c.amenity_id == Amenity.id)
+                .where(place_amenity.c.place_id == place_id_col).scalar_subquery(),
+            )
+            .join(User, User.id == self.model.owner_id)
+            .where(place_id_col == place_id)
+        )
+        row = db.session.execute(query).first()
+        return tuple(row) if row is not None else None
+    
+    def get_list_version(self):
+        """
+        Fingerprint of everything the place list depends on (see get_version()).
+        
+        The list embeds each place's columns, its owner's name/email and
+        its amenity names, so the fingerprint is the place count plus the
+        latest updated_at of places, users and amenities. Every updated_at
+        column read here is indexed: each max() is one index lookup (no
+        table scan), and the count reads the smallest index of places.
+        Reviews are not part of the list, so they do not invalidate it.
+        
+        Changes this covers: place created/deleted (count), place edited,
+        amenity links included (updated_at, see BaseModel.update()),
+        owner or amenity renamed (their updated_at), amenity deleted (the
+        places that had it are touched, see AmenityRepository.delete_by_id()).
+        Conservative: an update of a user without places changes it too.
+        
+        Returns:
+            tuple: (places count, places/users/amenities max updated_at)
+        
+        SQL equivalent:
+            SELECT (SELECT count(id) FROM places),
+                   (SELECT max(updated_at) FROM places),
+                   (SELECT max(updated_at) FROM users),
+                   (SELECT max(updated_at) FROM amenities)
+        """
+        query = select(
+            select(func.count(self.model.id)).scalar_subquery(),
+            select(func.max(self.model.updated_at)).scalar_subquery(),
+            select(func.max(User.updated_at)).scalar_subquery(),
+            select(func.max(Amenity.updated_at)).scalar_subquery(),
+        )
+        return tuple(db.session.execute(query).one())
\ No newline at end of file
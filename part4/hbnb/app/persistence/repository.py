@@ -20,6 +20,7 @@ All repositories implement the Repository interface:
 - update(obj_id, data): Update object by ID
 - delete(obj_id): Delete object by ID
 - get_by_attribute(attr_name, attr_value): Find by attribute
+- exists(obj_id): Check an ID exists without loading the object
 """
 
 from abc import ABC, abstractmethod
@@ -174,6 +175,14 @@ class InMemoryRepository(Repository):
             None
         )
 
+    def exists(self, obj_id):
+        """
+        Check whether an object with this ID is stored.
+        Args: obj_id (str): UUID of the object
+        Returns: bool: True if found
+        """
+        return obj_id in self._storage
+
 
 # ========== SQLAlchemy Repository (Production Implementation) ==========
 
@@ -243,8 +252,9 @@ class SQLAlchemyRepository(Repository):
             
         SQL equivalent:
             SELECT * FROM table WHERE id = obj_id LIMIT 1
+            (no SQL if the object is already in the session's identity map)
         """
-        return self.model.query.get(obj_id)
+        return db.session.get(self.model, obj_id)
     
     def get_all(self):
         """
@@ -324,4 +334,25 @@ class SQLAlchemyRepository(Repository):
             >>> user = repo.get_by_attribute('email', 'john@example.com')
             >>> amenity = repo.get_by_attribute('name', 'WiFi')
         """
-        return self.model.query.filter_by(**{attr_name: attr_value}).first()
\ No newline at end of file
+        return self.model.query.filter_by(**{attr_name: attr_value}).first()
+    
+    def exists(self, obj_id):
+        """
+        Check whether an object with this ID exists, without loading it.
+        
+        Used for existence validation (e.g. "does this user exist?") where
+        the object itself is not needed: no ORM instance is built and no
+        relationship is loaded.
+        
+        Args:
+            obj_id (str): UUID of the object
+            
+        Returns:
+            bool: True if a row with this ID exists
+            
+        SQL equivalent:
+            SELECT EXISTS (SELECT 1 FROM table WHERE id = :obj_id)
+        """
+        return db.session.query(
+            db.exists().where(self.model.id == obj_id)
+        ).scalar()
\ No newline at end of file
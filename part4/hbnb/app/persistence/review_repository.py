@@ -4,17 +4,46 @@ Review-specific repository for database operations.
 Extends SQLAlchemyRepository with review-specific queries:
 - get_reviews_by_place(): Find all reviews for a place
 - get_reviews_by_user(): Find all reviews by a user
+- get_create_context(): Everything review creation checks, in one query
+- get_list_rows(): Review list as plain rows (no ORM objects)
+- get_with_relations(): One review with author/place preloaded
+- delete_by_id(): Delete a review without loading it (returns its place)
+- update_if_author(): Update a review without loading it (returns its place)
+- insert_many(): Batch INSERT of queued reviews, duplicates skipped
 """
 
+from flask import current_app
+from sqlalchemy import delete, exists, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, lazyload, raiseload
+from app import db
+from app.models.place import Place
 from app.models.review import Review
+from app.models.user import User
 from app.persistence.repository import SQLAlchemyRepository
 
 
+# Review list projection, built once at import time: exactly the columns
+# of the list responses, author and place joined in (outer joins, so a
+# review whose author or place row is missing is still listed)
+_LIST_STMT = (
+    select(
+        Review.id, Review.text, Review.rating, Review.created_at, Review.updated_at,
+        Review.user_id, User.first_name, User.last_name,
+        Review.place_id, Place.title,
+    )
+    .outerjoin(User, User.id == Review.user_id)
+    .outerjoin(Place, Place.id == Review.place_id)
+)
+
+
 class ReviewRepository(SQLAlchemyRepository):
     """
     Repository for Review-specific database operations.
     Inherits: get(id), get_all(), add(), update(id, data), delete(id)
-    Review-specific: get_reviews_by_place(), get_reviews_by_user()
+    Review-specific: get_reviews_by_place(), get_reviews_by_user(), delete_by_id(),
+    get_create_context(), get_list_rows(), update_if_author(), get_with_relations()
     """
     
     def __init__(self):
@@ -37,4 +66,194 @@ class ReviewRepository(SQLAlchemyRepository):
         Returns: list: Review objects (empty list if none)
         Use cases: User profile, review history
         """
-        return self.model.query.filter_by(user_id=user_id).all()
\ No newline at end of file
+        return self.model.query.filter_by(user_id=user_id).all()
+    
+    def get_create_context(self, place_id, user_id):
+        """
+        Read everything creating a review checks in a single round-trip:
+        the place's owner (existence, own-place rule), whether the author
+        exists and whether they already reviewed the place.
+        Args: place_id (str): UUID of the place, user_id (str): UUID of the author
+        Returns: tuple: (owner_id, user_exists, already_reviewed),
+                 or None if the place doesn't exist
+        SQL equivalent:
+            SELECT places.owner_id,
+                   EXISTS (SELECT 1 FROM users WHERE id = :user_id),
+                   EXISTS (SELECT 1 FROM reviews WHERE user_id = :user_id
+                                                 AND place_id = :place_id)
+            FROM places WHERE places.id = :place_id
+        """
+        query = select(
+            Place.owner_id,
+            exists().where(User.id == user_id),
+            exists().where(self.model.user_id == user_id, self.model.place_id == Place.id),
+        ).where(Place.id == place_id)
+        row = db.session.execute(query).first()
+        return tuple(row) if row is not None else None
+    
+    def get_list_rows(self, place_id=None):
+        """
+        Get the review list as plain rows (see Review.responses_from_rows()).
+        One flat SELECT of the response columns: no Review/User/Place
+        objects, no identity map, no attribute instrumentation.
+        Args: place_id (str): Only the reviews of this place (None: all reviews)
+        Returns: list: Rows with columns id, text, rating, created_at,
+                 updated_at, user_id, first_name, last_name, place_id, title
+        SQL equivalent:
+            SELECT reviews.id, ..., users.first_name, users.last_name, ..., places.title
+            FROM reviews
+            LEFT OUTER JOIN users ON users.id = reviews.user_id
+            LEFT OUTER JOIN places ON places.id = reviews.place_id
+            [WHERE reviews.place_id = :place_id]
+        """
+        query = _LIST_STMT
+        if place_id is not None:
+            query = query.where(self.model.place_id == place_id)
+        return db.session.execute(query).all()
+
+    def get_with_relations(self, review_id):
+        """
+        Get one review with the author and place preloaded.
+        One query (user and place joined), through Session.get(): a review
+        already in the identity map costs no SQL.
+        Args: review_id (str): UUID of the review
+        Returns: Review: Review with user and place loaded, or None if not found
+        """
+        return db.session.get(self.model, review_id, options=self._relation_options())
+    
+    def _relation_options(self):
+        """
+        Loader options joining the user/place of each review.
+        In debug mode any other relationship raises on access (raiseload):
+        a serializer that starts reading one fails loudly instead of
+        silently emitting one query per review.
+        Only the columns Review.to_dict() embeds are loaded (load_only), and
+        the amenities of the joined place, eagerly loaded by default
+        (lazy='subquery'), are left unloaded: to_dict() does not embed them.
+        Built per call: loader options cannot reference the mappers at
+        import time (the models are not all configured yet).
+        """
+        options = [
+            joinedload(self.model.user).load_only(User.id, User.first_name, User.last_name),
+            joinedload(self.model.place).options(
+                lazyload(Place.amenities)
+            ).load_only(Place.id, Place.title),
+        ]
+        if current_app.debug:
+            options.append(raiseload('*'))
+        return options
+    
+    def delete_by_id(self, review_id, user_id=None):
+        """
+        Delete a review by ID without loading it first.
+        The authorship condition is part of the DELETE itself: existence
+        check, authorization check and deletion are a single statement.
+        Args: review_id (str): UUID of the review,
+              user_id (str): Required author UUID, or None to skip the
+                             authorship condition (admin)
+        Returns: str: UUID of the place of the deleted review (its cached
+                 review list is stale), or None if no review matched
+                 (not found, or not written by user_id)
+        SQL equivalent:
+            DELETE FROM reviews WHERE id = :review_id [AND user_id = :user_id]
+            RETURNING place_id
+        (the returned row replaces the preliminary SELECT; databases without
+        DELETE ... RETURNING read the place_id column first)
+        """
+        conditions = self._authored_by(review_id, user_id)
+        query = delete(self.model).where(*conditions)
+        dialect = db.session.get_bind().dialect
+        place_id = self._execute_returning_place(query, conditions, dialect.delete_returning)
+        db.session.commit()
+        return place_id
+    
+    def update_if_author(self, review_id, values, user_id=None):
+        """
+        Update a review without loading it, if it was written by user_id.
+        Same single-statement pattern as delete_by_id(). Core statements
+        bypass the model validators: values must already be checked.
+        Args: review_id (str): UUID of the review,
+              values (dict): Column values to set (updated_at included),
+              user_id (str): Required author UUID, or None (admin)
+        Returns: str: UUID of the place of the updated review, or None if
+                 no review matched (not found, or not written by user_id)
+        SQL equivalent:
+            UPDATE reviews SET ... WHERE id = :review_id [AND user_id = :user_id]
+            RETURNING place_id
+        """
+        conditions = self._authored_by(review_id, user_id)
+        # synchronize_session=False: the row was never loaded into the session
+        query = (
+            update(self.model).where(*conditions).values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        dialect = db.session.get_bind().dialect
+        place_id = self._execute_returning_place(query, conditions, dialect.update_returning)
+        db.session.commit()
+        return place_id
+    
+    def insert_many(self, rows):
+        """
+        Insert a batch of reviews in one executemany INSERT.
+        A row that conflicts with an existing review (same id, or same
+        place and author) is skipped. If the batch still fails (e.g. its
+        place or author was deleted meanwhile), the rows are retried one
+        by one and the failing ones are dropped.
+        Args: rows (list): Column dicts (id, text, rating, place_id,
+                           user_id, created_at, updated_at), already checked
+        Returns: list: The rows kept (conflicting duplicates are skipped by
+                 the database itself), minus the rows dropped on a retry
+        SQL equivalent (SQLite/PostgreSQL, INSERT IGNORE on MySQL):
+            INSERT INTO reviews (...) VALUES (...), ... ON CONFLICT DO NOTHING
+        """
+        if not rows:
+            return []
+        query = self._insert_ignoring_duplicates()
+        try:
+            db.session.execute(query, rows)
+            db.session.commit()
+            return rows
+        except IntegrityError:
+            db.session.rollback()
+        
+        inserted = []
+        for row in rows:
+            try:
+                db.session.execute(query, row)
+                db.session.commit()
+                inserted.append(row)
+            except IntegrityError:
+                db.session.rollback()
+        return inserted
+    
+    def _insert_ignoring_duplicates(self):
+        """INSERT statement of the current dialect that skips conflicting rows"""
+        dialect = db.session.get_bind().dialect.name
+        if dialect == 'sqlite':
+            return sqlite.insert(self.model).on_conflict_do_nothing()
+        if dialect == 'postgresql':
+            return postgresql.insert(self.model).on_conflict_do_nothing()
+        # MySQL/MariaDB (the production databases of this project)
+        return insert(self.model).prefix_with('IGNORE')
+    
+    def _authored_by(self, review_id, user_id):
+        """WHERE conditions of a guarded write (author condition skipped if user_id is None)"""
+        conditions = [self.model.id == review_id]
+        if user_id is not None:
+            conditions.append(self.model.user_id == user_id)
+        return conditions
+    
+    def _execute_returning_place(self, query, conditions, returning):
+        """
+        Run a guarded UPDATE/DELETE and return the place_id of the matched row.
+        With RETURNING support it is one statement; otherwise place_id is
+        read first and the write only runs if a row matched.
+        """
+        if returning:
+            return db.session.execute(query.returning(self.model.place_id)).scalar()
+        place_id = db.session.execute(
+            select(self.model.place_id).where(*conditions)
+        ).scalar()
+        if place_id is not None:
+            db.session.execute(query)
+        return place_id
\ No newline at end of file
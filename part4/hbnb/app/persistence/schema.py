@@ -0,0 +1,164 @@
+#!/usr/bin/python3
+"""
+Schema upgrade of an existing HBnB database (flask init-db).
+
+db.create_all() only creates missing tables: it never changes a table that
+already exists. upgrade_schema() brings the existing tables up to the
+models, so a database created by an older version keeps working:
+- Missing columns are added (then backfilled, see _BACKFILLS)
+- Named unique constraints are added or dropped to match the models
+- Columns declared NOT NULL by the models are made NOT NULL
+- Missing indexes are created, stale 'ix_*' indexes are dropped
+
+Every step is checked against the live schema first, so running it again
+is a no-op. SQLite cannot alter constraints in place: a table that needs
+one of these changes is rebuilt (new table, rows copied, old table
+dropped, new table renamed), the procedure recommended by SQLite.
+MySQL and PostgreSQL get the equivalent ALTER TABLE statements.
+"""
+
+from sqlalchemy import MetaData, inspect, select, update
+from sqlalchemy.schema import AddConstraint, CreateTable
+from app import db
+
+
+def _backfill_amenity_name_ci(conn, table):
+    """Fill amenities.name_ci (casefolded name) for rows created before the column"""
+    rows = conn.execute(select(table.c.id, table.c.name).where(table.c.name_ci.is_(None)))
+    for amenity_id, name in rows.all():
+        conn.execute(
+            update(table).where(table.c.id == amenity_id)
+            .values(name_ci=name.strip().casefold())
+        )
+
+
+# (table, column) -> function(conn, table) filling a column added to existing rows
+_BACKFILLS = {
+    ('amenities', 'name_ci'): _backfill_amenity_name_ci,
+}
+
+
+def upgrade_schema():
+    """
+    Upgrade the tables of the configured database to the current models.
+    Tables must exist already (run db.create_all() first).
+    Returns: list: Description of every change applied (empty if up to date)
+    """
+    changes = []
+    with db.engine.connect() as conn:
+        dialect = conn.dialect.name
+        if dialect == 'sqlite':
+            # Table rebuilds drop tables other tables refer to
+            foreign_keys = conn.exec_driver_sql('PRAGMA foreign_keys').scalar()
+            conn.exec_driver_sql('PRAGMA foreign_keys=OFF')
+        for table in db.metadata.sorted_tables:
+            changes.extend(_upgrade_table(conn, table, dialect))
+            conn.commit()
+        if dialect == 'sqlite':
+            conn.exec_driver_sql(f'PRAGMA foreign_keys={int(foreign_keys)}')
+    return changes
+
+
+def _upgrade_table(conn, table, dialect):
+    """
+    Upgrade one table (columns, unique constraints, NOT NULL, indexes).
+    Returns: list: Description of every change applied
+    """
+    insp = inspect(conn)
+    if not insp.has_table(table.name):
+        return []
+    changes = []
+
+    # ----- Columns -----
+    existing_columns = {column['name']: column for column in insp.get_columns(table.name)}
+    not_null = []
+    for column in table.columns:
+        if column.name in existing_columns:
+            if not column.nullable and existing_columns[column.name]['nullable']:
+                not_null.append(column)
+            continue
+        # Added as nullable: existing rows get their value from the backfill
+        conn.exec_driver_sql(
+            f'ALTER TABLE {table.name} ADD COLUMN {column.name} '
+            f'{column.type.compile(dialect=conn.dialect)}'
+        )
+        backfill = _BACKFILLS.get((table.name, column.name))
+        if backfill is not None:
+            backfill(conn, table)
+        changes.append(f'{table.name}: added column {column.name}')
+        if not column.nullable:
+            not_null.append(column)
+
+    # ----- Unique constraints -----
+    model_uniques = {c.name: c for c in table.constraints
+                     if c.__visit_name__ == 'unique_constraint' and c.name}
+    existing_uniques = {c['name'] for c in insp.get_unique_constraints(table.name) if c['name']}
+    missing_uniques = [c for name, c in model_uniques.items() if name not in existing_uniques]
+    stale_uniques = [name for name in existing_uniques if name not in model_uniques]
+
+    if dialect == 'sqlite':
+        if not_null or missing_uniques or stale_uniques:
+            _rebuild_sqlite_table(conn, table)
+            changes.append(f'{table.name}: rebuilt (constraints)')
+            insp = inspect(conn)
+    else:
+        for constraint in missing_uniques:
+            conn.execute(AddConstraint(constraint))
+            changes.append(f'{table.name}: added unique constraint {constraint.name}')
+        for name in stale_uniques:
+            drop = 'DROP INDEX' if dialect in ('mysql', 'mariadb') else 'DROP CONSTRAINT'
+            conn.exec_driver_sql(f'ALTER TABLE {table.name} {drop} {name}')
+            changes.append(f'{table.name}: dropped unique constraint {name}')
+        for column in not_null:
+            if dialect in ('mysql', 'mariadb'):
+                conn.exec_driver_sql(
+                    f'ALTER TABLE {table.name} MODIFY {column.name} '
+                    f'{column.type.compile(dialect=conn.dialect)} NOT NULL'
+                )
+            else:
+                conn.exec_driver_sql(
+                    f'ALTER TABLE {table.name} ALTER COLUMN {column.name} SET NOT NULL'
+                )
+            changes.append(f'{table.name}: {column.name} set NOT NULL')
+
+    # ----- Indexes -----
+    existing_indexes = {index['name'] for index in insp.get_indexes(table.name)}
+    for index in table.indexes:
+        if index.name not in existing_indexes:
+            index.create(conn)
+            changes.append(f'{table.name}: created index {index.name}')
+    model_indexes = {index.name for index in table.indexes}
+    for name in existing_indexes:
+        # Only indexes named like the models' ones: MySQL also lists the
+        # indexes backing foreign keys and unique constraints here
+        if name and name.startswith('ix_') and name not in model_indexes:
+            if dialect in ('mysql', 'mariadb'):
+                conn.exec_driver_sql(f'DROP INDEX {name} ON {table.name}')
+            else:
+                conn.exec_driver_sql(f'DROP INDEX {name}')
+            changes.append(f'{table.name}: dropped index {name}')
+    return changes
+
+
+def _rebuild_sqlite_table(conn, table):
+    """
+    Recreate a SQLite table with the model's definition, keeping its rows.
+    Foreign keys must be disabled (see upgrade_schema()).
+    """
+    # Copy of the whole schema, so the new table's foreign keys resolve
+    metadata = MetaData()
+    for model_table in db.metadata.sorted_tables:
+        model_table.to_metadata(metadata)
+    new_table = table.to_metadata(metadata, name=f'{table.name}__new')
+
+    columns = ', '.join(column.name for column in table.columns)
+    conn.execute(CreateTable(new_table))
+    conn.exec_driver_sql(
+        f'INSERT INTO {new_table.name} ({columns}) SELECT {columns} FROM {table.name}'
+    )
+    # Dropping the old table drops its indexes: the model's are created
+    # again on the renamed table (index names are global in SQLite)
+    conn.exec_driver_sql(f'DROP TABLE {table.name}')
+    conn.exec_driver_sql(f'ALTER TABLE {new_table.name} RENAME TO {table.name}')
+    for index in table.indexes:
+        index.create(conn)
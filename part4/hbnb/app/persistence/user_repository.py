@@ -4,8 +4,10 @@ User-specific repository for database operations.
 Extends SQLAlchemyRepository with user-specific queries:
 - get_user_by_email(): Find user by email (used for login/authentication)
 - get_user_by_attribute(): Find user by any attribute (backward compatibility)
+- get_is_admin(): Read only the is_admin flag of a user
 """
 
+from app import db
 from app.models.user import User
 from app.persistence.repository import SQLAlchemyRepository
 
@@ -14,7 +16,7 @@ class UserRepository(SQLAlchemyRepository):
     """
     Repository for User-specific database operations.
     Inherits: get(id), get_all(), add(), update(id, data), delete(id)
-    User-specific: get_user_by_email(), get_user_by_attribute()
+    User-specific: get_user_by_email(), get_user_by_attribute(), get_is_admin()
     """
     
     def __init__(self):
@@ -38,4 +40,13 @@ class UserRepository(SQLAlchemyRepository):
         Returns: User: User object if found, None otherwise
         Use cases: Generic search, backward compatibility with legacy code
         """
-        return self.model.query.filter_by(**{attr_name: attr_value}).first()
\ No newline at end of file
+        return self.model.query.filter_by(**{attr_name: attr_value}).first()
+    
+    def get_is_admin(self, user_id):
+        """
+        Get the admin flag of a user without loading the User object.
+        Args: user_id (str): UUID of the user
+        Returns: bool: is_admin value, or None if the user doesn't exist
+        SQL equivalent: SELECT is_admin FROM users WHERE id = :user_id
+        """
+        return db.session.query(self.model.is_admin).filter_by(id=user_id).scalar()
\ No newline at end of file
@@ -1,3 +1,4 @@
 from app.services.facade import HBnBFacade
 
-facade = HBnBFacade()
\ No newline at end of file
+# The facade singleton is created once in app/__init__.py (app.facade):
+# a second instance here would hold its own, diverging caches
\ No newline at end of file
@@ -0,0 +1,42 @@
+#!/usr/bin/python3
+"""
+Thread pool for bcrypt password checks in the HBnB application.
+
+bcrypt is CPU-bound C code (tens of milliseconds per check by design).
+Called inline, it blocks the whole gevent event loop of a worker, so
+concurrent logins are served one after another. Under gevent
+(monkey-patched), checks run on the hub's native threadpool instead, which
+yields to other greenlets while the hash is computed.
+
+Without gevent the check runs inline: the calling thread would block on
+the result anyway, so a pool would only add a thread handoff (and a cap
+on concurrent checks). bcrypt releases the GIL while hashing, so other
+request threads keep running.
+
+gevent is optional: it is only used when the gunicorn gevent worker
+(or any other caller) has monkey-patched the threading module.
+"""
+
+try:
+    import gevent
+    from gevent import monkey
+except ImportError:  # Optional dependency
+    gevent = None
+    monkey = None
+
+
+def _gevent_active():
+    """Return True if threading is monkey-patched by gevent"""
+    return monkey is not None and monkey.is_module_patched('threading')
+
+
+def run_in_pool(fn, *args):
+    """
+    Run a blocking call off the gevent event loop (inline without gevent).
+    Args: fn (callable): Function to run, *args: its arguments
+    Returns: Whatever fn returns (exceptions are re-raised)
+    """
+    if _gevent_active():
+        # Patched threads are greenlets: use gevent's native thread pool
+        return gevent.get_hub().threadpool.apply(fn, args)
+    return fn(*args)
\ No newline at end of file
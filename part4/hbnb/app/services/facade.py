@@ -13,7 +13,41 @@ from app.models.user import User
 from app.models.amenity import Amenity
 from app.models.place import Place
 from app.models.review import Review
+from app.services.json_provider import dumps_bytes
+from app.services.ttl_cache import TTLCache
+from app.services.redis_client import get_redis
+from app.services.response_cache import REDIS_ERRORS, body_etag, version_etag
+from app.services import review_queue
 from app import db
+from sqlalchemy.exc import IntegrityError
+import orjson
+import base64
+import hashlib
+import hmac
+import os
+import uuid
+from datetime import datetime
+
+
+# Shared place owner cache (Redis, when configured): 'place:owner:<place_id>'
+PLACE_OWNER_KEY_PREFIX = 'place:owner:'
+PLACE_OWNER_TTL = 3600
+
+# Shared admin role cache (Redis, when configured): 'user:admin:<user_id>'
+USER_ADMIN_KEY_PREFIX = 'user:admin:'
+USER_ADMIN_TTL = 60
+
+
+class AmenityValidationError(ValueError):
+    """Raised when amenity input is invalid (bad name or protected field)"""
+
+
+class DuplicateAmenityError(ValueError):
+    """Raised when an amenity name is already taken (case-insensitive)"""
+
+
+class DuplicateReviewError(ValueError):
+    """Raised when a user already reviewed the place (unique user/place constraint)"""
 
 
 class HBnBFacade:
@@ -28,6 +62,57 @@ class HBnBFacade:
         self.amenity_repo = AmenityRepository()
         self.place_repo = PlaceRepository()
         self.review_repo = ReviewRepository()
+        
+        # Amenity list cache (amenities only change through admin writes)
+        # _amenities_cache: 'list' -> (JSON array of all amenities, ETag).
+        # Dropped on every amenity write in this process; the TTL bounds
+        # staleness when other workers write amenities. Only used without
+        # Redis: with Redis, the list is cached there ('amenities:all'),
+        # where a write in any worker drops it for all of them.
+        # _amenities_version: bumped on every amenity write
+        self._amenities_cache = TTLCache(maxsize=1, ttl=60)
+        self._amenities_version = 0
+        
+        # Set of all amenity IDs, for place create/update validation without
+        # a query. Dropped on every amenity write in this process; an ID
+        # missing from it (created by another worker) triggers one reload
+        # (see get_existing_amenity_ids()).
+        self._amenity_ids_cache = TTLCache(maxsize=1, ttl=60)
+        
+        # place_id -> owner_id (owner_id never changes; entries are dropped
+        # when the place or its owner is deleted). Backed by Redis when it
+        # is configured, so a miss in this process is shared by all workers
+        # (see get_place_owner_id())
+        self._place_owner_cache = TTLCache(maxsize=10000, ttl=60)
+        
+        # place_id -> (etag, JSON bytes) of the place detail response. The
+        # ETag comes from the place's change fingerprint, which is read on
+        # every request anyway: an entry is only served while it matches,
+        # so writes from any process make it stale without invalidation.
+        self._place_json_cache = TTLCache(maxsize=1000, ttl=300)
+        
+        # user_id -> is_admin (the role is not carried in JWTs). Only used
+        # without Redis: entries are dropped when the user is updated or
+        # deleted in this process, other processes see the change within
+        # the TTL. With Redis the role is cached there instead, so a change
+        # is seen by every worker at once (see is_user_admin())
+        self._user_admin_cache = TTLCache(maxsize=10000, ttl=60)
+        
+        # HMAC(stored password hash, password) -> user_id of recent successful
+        # logins, so rapid repeat logins skip bcrypt. Only successes are
+        # cached. The user row is still read on every login and the key
+        # includes its current hash: once the password is changed (or the
+        # user deleted, or the email changed) in any worker, the old entries
+        # can no longer match. The HMAC key is random per process: keys are
+        # useless elsewhere.
+        self._login_cache = TTLCache(maxsize=10000, ttl=30)
+        self._login_cache_key = os.urandom(32)
+
+    def _invalidate_amenities_cache(self):
+        """Drop the cached amenity list after a create/update/delete"""
+        self._amenities_cache.clear()
+        self._amenities_version += 1
+        self._amenity_ids_cache.clear()
 
     # ======================
     # ===== USERS =====
@@ -59,6 +144,33 @@ class HBnBFacade:
         """Get user by email. Returns: User or None"""
         return self.user_repo.get_user_by_email(email)
 
+    def authenticate(self, email, password):
+        """
+        Check login credentials (bcrypt skipped for a recent identical success).
+        Args: email (str): User email, password (str): Plain text password
+        Returns: str: UUID of the authenticated user, or None if invalid
+        """
+        user = self.user_repo.get_user_by_email(email)
+        if not user:
+            return None
+        
+        # The plain password is never stored: it only enters the HMAC digest,
+        # next to the current stored hash (the password version)
+        cache_key = hmac.new(
+            self._login_cache_key,
+            user.password.encode('utf-8') + b'\0'
+            + hashlib.sha256(password.encode('utf-8')).digest(),
+            'sha256'
+        ).digest()
+        if self._login_cache.get(cache_key) == user.id:
+            return user.id
+        
+        if not user.verify_password(password):
+            # Failed attempts are never cached
+            return None
+        self._login_cache[cache_key] = user.id
+        return user.id
+
     def get_all_user(self):
         """Get all users. Returns: list of User objects"""
         return self.user_repo.get_all()
@@ -91,8 +203,53 @@ class HBnBFacade:
             data.pop('password')
         
         user.update(data)
+        self._forget_user_admin(user_id)
         return user
 
+    def is_user_admin(self, user_id):
+        """
+        Check whether a user has admin privileges, for authorization checks.
+        Served from Redis when it is configured (shared by all workers and
+        deleted on every role change, so no worker keeps a stale role),
+        otherwise from an in-process TTL LRU cache. On a miss only the
+        is_admin column is read (no User object is loaded). If Redis fails,
+        the column is read directly.
+        Args: user_id (str): User UUID
+        Returns: bool: True if the user exists and is an admin
+        """
+        redis_client = get_redis()
+        if redis_client is None:
+            is_admin = self._user_admin_cache.get(user_id)
+            if is_admin is None:
+                is_admin = bool(self.user_repo.get_is_admin(user_id))
+                self._user_admin_cache[user_id] = is_admin
+            return is_admin
+        
+        key = USER_ADMIN_KEY_PREFIX + user_id
+        try:
+            cached = redis_client.get(key)
+        except REDIS_ERRORS:
+            return bool(self.user_repo.get_is_admin(user_id))
+        if cached is not None:
+            return cached == b'1'
+        
+        is_admin = bool(self.user_repo.get_is_admin(user_id))
+        try:
+            redis_client.setex(key, USER_ADMIN_TTL, b'1' if is_admin else b'0')
+        except REDIS_ERRORS:
+            pass
+        return is_admin
+
+    def _forget_user_admin(self, user_id):
+        """Drop the cached role of an updated/deleted user (this process and Redis)"""
+        self._user_admin_cache.pop(user_id)
+        redis_client = get_redis()
+        if redis_client is not None:
+            try:
+                redis_client.delete(USER_ADMIN_KEY_PREFIX + user_id)
+            except REDIS_ERRORS:
+                pass
+
     def delete_user(self, user_id):
         """
         Delete user (cascade deletes places and reviews via SQLAlchemy).
@@ -103,8 +260,13 @@ class HBnBFacade:
         if not user:
             return False
         
+        # Places deleted by the cascade (their cached owners become stale)
+        place_ids = [place.id for place in user.places]
+        
         # SQLAlchemy cascade will handle deletion of related places and reviews
         self.user_repo.delete(user_id)
+        self._forget_place_owners(*place_ids)
+        self._forget_user_admin(user_id)
         return True
 
     # ======================
@@ -113,18 +275,30 @@ class HBnBFacade:
 
     def create_amenity(self, amenity_data):
         """
-        Create amenity with optional place/owner validation and association.
-        Args: amenity_data (dict): name (required), place_id (optional), owner_id (optional)
+        Create amenity (single INSERT, uniqueness enforced by the database).
+        Args: amenity_data (dict): name (required)
         Returns: Amenity: Created amenity object
-        Raises: ValueError: If name missing or place/owner not found
+        Raises: AmenityValidationError: If name missing or invalid
+                DuplicateAmenityError: If the name is already taken (unique name_ci index)
         """
         name = amenity_data.get("name")
         if not name:
-            raise ValueError("Amenity name is required")
+            raise AmenityValidationError("Amenity name is required")
         
-        amenity = Amenity(name=name)
+        try:
+            amenity = Amenity(name=name)
+        except ValueError as e:
+            raise AmenityValidationError(str(e)) from e
+        amenity.refresh_json_cache()
         
-        self.amenity_repo.add(amenity)
+        # No check-then-insert: the unique index rejects duplicates atomically,
+        # even when two requests create the same name concurrently
+        try:
+            self.amenity_repo.add(amenity)
+        except IntegrityError:
+            db.session.rollback()
+            raise DuplicateAmenityError(amenity.name)
+        self._invalidate_amenities_cache()
         
         return amenity
 
@@ -132,16 +306,99 @@ class HBnBFacade:
         """Get amenity by ID. Returns: Amenity or None"""
         return self.amenity_repo.get(amenity_id)
 
-    def get_all_amenities(self):
-        """Get all amenities. Returns: list of Amenity objects"""
-        return self.amenity_repo.get_all()
+    def get_amenity_id_set(self):
+        """
+        Get the IDs of all amenities, served from the in-memory cache.
+        On a miss the set is rebuilt with one id-only query.
+        Returns: frozenset: Every amenity ID
+        """
+        amenity_ids = self._amenity_ids_cache.get('ids')
+        if amenity_ids is None:
+            amenity_ids = frozenset(self.amenity_repo.get_all_ids())
+            self._amenity_ids_cache['ids'] = amenity_ids
+        return amenity_ids
+
+    def get_existing_amenity_ids(self, amenity_ids):
+        """
+        Check amenity IDs against the cached set of all amenity IDs
+        (no query while the cache is warm).
+        Args: amenity_ids (set or list): Amenity UUIDs
+        Returns: set: The IDs that exist (callers diff it against the request)
+        """
+        existing = self.get_amenity_id_set().intersection(amenity_ids)
+        if len(existing) < len(set(amenity_ids)):
+            # Possibly created by another worker since the set was cached
+            self._amenity_ids_cache.pop('ids')
+            existing = self.get_amenity_id_set().intersection(amenity_ids)
+        return existing
+
+    def _resolve_amenities(self, amenity_ids):
+        """
+        Load the amenities of a place in one query (instead of one per ID).
+        Args: amenity_ids (list): Amenity UUIDs
+        Returns: list of Amenity objects, in request order
+        Raises: ValueError: If an amenity ID doesn't exist
+        """
+        # Unknown IDs are rejected from the cached ID set, before any query
+        known = self.get_existing_amenity_ids(amenity_ids)
+        for a_id in amenity_ids:
+            if a_id not in known:
+                raise ValueError(f"Amenity ID '{a_id}' not found")
+        found = self.amenity_repo.get_by_ids(amenity_ids)
+        amenities = []
+        for a_id in amenity_ids:
+            if a_id not in found:
+                raise ValueError(f"Amenity ID '{a_id}' not found")
+            amenities.append(found[a_id])
+        return amenities
+
+    def get_cached_amenities_json(self):
+        """
+        Get the cached JSON array of all amenities and its ETag.
+        Returns: tuple: (json_array, etag), or (None, None) if not built,
+                 expired, or Redis is configured (the list is cached there)
+        """
+        if get_redis() is not None:
+            return None, None
+        return self._amenities_cache.get('list', (None, None))
+
+    def iter_all_amenities_json(self):
+        """
+        Generate the JSON array of all amenities chunk by chunk, as rows
+        arrive from the database cursor (for streamed responses).
+        Without Redis, the in-memory cache is filled once the array is
+        complete, unless an amenity write happened meanwhile.
+        Yields: str: '[', then one amenity payload per row, then ']'
+        """
+        version = self._amenities_version
+        items = []
+        yield '['
+        for row in self.list_amenities_rows():
+            item = row.json_cache or orjson.dumps({
+                'id': row.id,
+                'name': row.name,
+                'created_at': row.created_at.isoformat(),
+                'updated_at': row.updated_at.isoformat()
+            }).decode('utf-8')
+            yield ',' + item if items else item
+            items.append(item)
+        yield ']'
+        if version == self._amenities_version and get_redis() is None:
+            cache = '[' + ','.join(items) + ']'
+            # Hashed once per rebuild, not per request
+            self._amenities_cache['list'] = (cache, body_etag(cache))
+
+    def list_amenities_rows(self):
+        """Get id/name/timestamps/json_cache of all amenities as plain rows. Returns: iterator of Row"""
+        return self.amenity_repo.list_amenity_rows()
 
     def update_amenity(self, amenity_id, amenity_data):
         """
-        Update amenity and manage place associations if place_id changes.
+        Update amenity name (single SELECT + single UPDATE).
         Args: amenity_id (str): Amenity UUID, amenity_data (dict): Fields to update
         Returns: Updated Amenity or None if not found
-        Raises: ValueError: If trying to update protected fields
+        Raises: AmenityValidationError: If trying to update protected fields or name is invalid
+                DuplicateAmenityError: If another amenity already has the name
         """
         amenity = self.get_amenity(amenity_id)
         if not amenity:
@@ -149,51 +406,65 @@ class HBnBFacade:
         
         for field in ['id', 'created_at']:
             if field in amenity_data:
-                raise ValueError(f"Cannot update '{field}'")
+                raise AmenityValidationError(f"Cannot update '{field}'")
         
         if 'name' in amenity_data:
-            amenity.update({'name': amenity_data['name']})
+            # name, updated_at and json_cache are flushed in one UPDATE
+            # (BaseModel.update() would commit before json_cache is refreshed)
+            try:
+                amenity.name = amenity_data['name']
+            except ValueError as e:
+                raise AmenityValidationError(str(e)) from e
+            amenity.updated_at = datetime.utcnow()
+            amenity.refresh_json_cache()
+            try:
+                db.session.commit()
+            except IntegrityError:
+                db.session.rollback()
+                raise DuplicateAmenityError(amenity_data['name'].strip())
+            self._invalidate_amenities_cache()
         
         return amenity
 
     def delete_amenity(self, amenity_id):
         """
-        Delete amenity and remove from place associations.
+        Delete amenity and remove it from place associations.
+        Existence is reported by the DELETE row count (no preliminary SELECT).
         Args: amenity_id (str): Amenity UUID
         Returns: bool: True if deleted, False if not found
         """
-        amenity = self.amenity_repo.get(amenity_id)
-        if not amenity:
+        if not self.amenity_repo.delete_by_id(amenity_id):
             return False
         
-        # SQLAlchemy cascade will handle removal from place_amenity table
-        self.amenity_repo.delete(amenity_id)
+        self._invalidate_amenities_cache()
         return True
 
     # ======================
     # ===== PLACES =====
     # ======================
 
-    def create_place(self, place_data):
+    def create_place(self, place_data, with_payload=True):
         """
         Create place with owner validation and amenity associations.
-        Args: place_data (dict): title, price, latitude, longitude, owner_id, amenities (list of IDs)
-        Returns: Place: Created place object
+        The response payload is built from the objects already in memory
+        (owner, amenities, no reviews yet) before the transaction is committed:
+        the commit expires the place, and serializing it afterwards would
+        reload the place, its owner, amenities and reviews one by one.
+        Args: place_data (dict): title, price, latitude, longitude, owner_id, amenities (list of IDs),
+              with_payload (bool): Build the payload (False: the client wants no body)
+        Returns: tuple: (Place, dict) created place and its to_dict() payload (None if not built)
         Raises: ValueError: If owner not found or amenity ID invalid
         """
-        owner = self.user_repo.get(place_data.get("owner_id"))
-        if not owner:
+        owner_id = place_data.get("owner_id")
+        # The owner is loaded (not just checked for existence): it is
+        # embedded in the payload
+        owner = self.user_repo.get(owner_id) if owner_id else None
+        if owner is None:
             raise ValueError("Owner not found")
 
         # Retrieve amenity objects from IDs
         amenity_ids = place_data.get("amenities", [])
-        amenities = []
-        if amenity_ids:
-            for a_id in amenity_ids:
-                amenity = self.amenity_repo.get(a_id)
-                if not amenity:
-                    raise ValueError(f"Amenity ID '{a_id}' not found")
-                amenities.append(amenity)
+        amenities = self._resolve_amenities(amenity_ids) if amenity_ids else []
 
         place = Place(
             title=place_data["title"],
@@ -201,32 +472,196 @@ class HBnBFacade:
             price=place_data["price"],
             latitude=place_data["latitude"],
             longitude=place_data["longitude"],
-            owner_id=owner.id,
+            owner_id=owner_id,
             amenities=amenities
         )
+        place.owner = owner
+        # A new place has no reviews: set the collection so serializing
+        # it does not query for them
+        place.reviews = []
         
-        self.place_repo.add(place)
-        return place
+        db.session.add(place)
+        # INSERT first: the column defaults (id, timestamps) are set on the
+        # object by the flush, and nothing is expired until the commit
+        db.session.flush()
+        payload = place.to_dict() if with_payload else None
+        db.session.commit()
+        return place, payload
 
     def get_place(self, place_id):
-        """Get place by ID. Returns: Place or None"""
-        return self.place_repo.get(place_id)
+        """Get place by ID (owner/amenities/reviews preloaded). Returns: Place or None"""
+        return self.place_repo.get_with_relations(place_id)
 
-    def get_all_places(self):
-        """Get all places. Returns: list of Place objects"""
-        return self.place_repo.get_all()
+    def get_place_json(self, place_id, etag):
+        """
+        Get the serialized detail response of a place for a given version.
+        Served from the in-process cache while the cached ETag matches;
+        otherwise the place is loaded, serialized once and cached.
+        Args: place_id (str): Place UUID, etag (str): Current ETag (get_place_etag())
+        Returns: bytes: JSON of place.to_dict(), or None if the place doesn't exist
+        """
+        cached = self._place_json_cache.get(place_id)
+        if cached is not None and cached[0] == etag:
+            return cached[1]
+        place = self.place_repo.get_with_relations(place_id)
+        if place is None:
+            return None
+        body = dumps_bytes(place.to_dict())
+        self._place_json_cache[place_id] = (etag, body)
+        return body
 
-    def update_place(self, place_id, place_data):
+    def get_place_owner_id(self, place_id):
+        """
+        Get the owner UUID of a place, for authorization checks.
+        Served from an in-process TTL LRU cache, then from Redis (shared
+        by all workers, long TTL: ownership never changes); on a miss
+        only the owner_id column is read (no Place object is loaded).
+        Missing places are not cached.
+        Args: place_id (str): Place UUID
+        Returns: str: owner_id, or None if the place doesn't exist
         """
-        Update place with validation (cannot update id/owner_id/created_at).
-        Args: place_id (str): Place UUID, place_data (dict): Fields to update
+        owner_id = self._place_owner_cache.get(place_id)
+        if owner_id is not None:
+            return owner_id
+        
+        redis_client = get_redis()
+        if redis_client is not None:
+            try:
+                cached = redis_client.get(PLACE_OWNER_KEY_PREFIX + place_id)
+            except REDIS_ERRORS:
+                cached = None
+            if cached is not None:
+                owner_id = cached.decode('utf-8')
+                self._place_owner_cache[place_id] = owner_id
+                return owner_id
+        
+        owner_id = self.place_repo.get_owner_id(place_id)
+        if owner_id is not None:
+            self._remember_place_owner(place_id, owner_id)
+        return owner_id
+
+    def _remember_place_owner(self, place_id, owner_id):
+        """Cache the owner of a place in this process and in Redis (if configured)"""
+        self._place_owner_cache[place_id] = owner_id
+        redis_client = get_redis()
+        if redis_client is not None:
+            try:
+                redis_client.setex(PLACE_OWNER_KEY_PREFIX + place_id, PLACE_OWNER_TTL, owner_id)
+            except REDIS_ERRORS:
+                pass
+
+    def _forget_place_owners(self, *place_ids):
+        """Drop the cached owners of deleted places (this process and Redis)"""
+        for place_id in place_ids:
+            self._place_owner_cache.pop(place_id)
+        redis_client = get_redis()
+        if redis_client is not None and place_ids:
+            try:
+                redis_client.delete(*(PLACE_OWNER_KEY_PREFIX + place_id for place_id in place_ids))
+            except REDIS_ERRORS:
+                pass
+
+    def get_place_etag(self, place_id):
+        """
+        ETag of a place response, from its change fingerprint (one aggregate
+        query, the place itself is not loaded).
+        Args: place_id (str): Place UUID
+        Returns: str: ETag, or None if the place doesn't exist
+        """
+        version = self.place_repo.get_version(place_id)
+        return version_etag(version) if version is not None else None
+
+    def get_places_list_etag(self):
+        """ETag of the place list, from a table-wide change fingerprint. Returns: str"""
+        return version_etag(self.place_repo.get_list_version())
+
+    def parse_places_cursor(self, cursor):
+        """
+        Decode a place list cursor into its keyset key.
+        The cursor is opaque to clients: urlsafe base64 of the JSON
+        [created_at, id] key of the last place of the previous page.
+        Args: cursor (str): next_cursor of the previous page, or None
+        Returns: list: [created_at, id] key, or None for the first page
+        Raises: ValueError: If the cursor is malformed
+        """
+        if not cursor:
+            return None
+        try:
+            after = orjson.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            if (not isinstance(after, list) or len(after) != 2
+                    or not all(isinstance(part, str) for part in after)):
+                raise ValueError
+        except (ValueError, UnicodeEncodeError):
+            raise ValueError('Invalid cursor')
+        return after
+
+    def get_places_page(self, limit, after=None):
+        """
+        Get one page of places, newest first (keyset pagination).
+        Args: limit (int): Page size,
+              after (list): Key returned by parse_places_cursor(), or None
+        Returns: tuple: (list of place summary dicts, next_cursor str or None on the last page)
+        """
+        rows, amenity_rows, next_key = self.place_repo.get_page(limit, after)
+        # Summaries built straight from the rows (no ORM objects)
+        amenities_by_place = {}
+        for place_id, amenity_id, name in amenity_rows:
+            amenities_by_place.setdefault(place_id, []).append(
+                {'id': amenity_id, 'name': name}
+            )
+        places = Place.summaries_from_rows(rows, amenities_by_place)
+        
+        next_cursor = None
+        if next_key is not None:
+            next_cursor = base64.urlsafe_b64encode(orjson.dumps(next_key)).decode('ascii')
+        return places, next_cursor
+
+    def update_place_checked(self, place_id, place_data, user_id, is_admin, reload=True):
+        """
+        Update place if the caller is its owner or an admin.
+        The 404/403 decision only reads the (cached) owner_id column; the
+        place row is loaded and locked once authorization has succeeded.
+        The returned place is reloaded with its relationships eager-loaded
+        (as in get_place()), ready for the response payload.
+        Args: place_id (str): Place UUID, place_data (dict): Fields to update,
+              user_id (str): Caller UUID, is_admin (bool): Caller is admin,
+              reload (bool): Reload the place for the response (False: the
+                             updated, expired place is returned as is)
         Returns: Updated Place or None if not found
-        Raises: ValueError: If trying to update protected fields or invalid amenity ID
+        Raises: PermissionError: If the caller is neither owner nor admin
+                ValueError: If trying to update protected fields or invalid amenity ID
         """
-        place = self.place_repo.get(place_id)
+        self.check_place_owner(place_id, user_id, is_admin, 'update')
+        place = self.place_repo.get_for_update(place_id)
         if not place:
+            # Deleted since the owner lookup
+            db.session.rollback()
             return None
-        
+        try:
+            self._apply_place_update(place, place_data)
+        except ValueError:
+            db.session.rollback()
+            raise
+        if not reload:
+            return place
+        # Committed (attributes expired): one eager load for the response
+        # instead of a lazy load per relationship
+        return self.place_repo.get_with_relations(place_id)
+
+    def check_place_owner(self, place_id, user_id, is_admin, action):
+        """
+        Authorization check for place mutations, without loading the Place.
+        owner_id is immutable, so the cached value is safe to trust.
+        Returns: str: owner_id, or None if the place doesn't exist
+        Raises: PermissionError: If the caller is neither owner nor admin
+        """
+        owner_id = self.get_place_owner_id(place_id)
+        if owner_id is not None and owner_id != user_id and not is_admin:
+            raise PermissionError(f'You can only {action} your own places')
+        return owner_id
+
+    def _apply_place_update(self, place, place_data):
+        """Validate place_data and apply it to a loaded place (commits)"""
         # Prevent updating immutable fields
         for field in ['id', 'owner_id', 'created_at']:
             if field in place_data:
@@ -235,113 +670,186 @@ class HBnBFacade:
         update_data = {}
         for key, value in place_data.items():
             if key == "amenities":
-                # Validate and retrieve amenity objects
-                new_amenities = []
-                for a_id in value:
-                    amenity = self.amenity_repo.get(a_id)
-                    if not amenity:
-                        raise ValueError(f"Amenity ID '{a_id}' not found")
-                    new_amenities.append(amenity)
-                update_data["amenities"] = new_amenities
+                # Validate and retrieve amenity objects (one query)
+                update_data["amenities"] = self._resolve_amenities(value)
             elif hasattr(place, key):
                 update_data[key] = value
 
         place.update(update_data)
         return place
 
-    def delete_place(self, place_id):
+    def delete_place_checked(self, place_id, user_id, is_admin):
         """
-        Delete place (cascade deletes reviews via SQLAlchemy).
-        Args: place_id (str): Place UUID
+        Delete place if the caller is its owner or an admin.
+        The 404/403 decision only reads the (cached) owner_id column; the
+        deletion itself is one guarded DELETE (owner condition in the
+        WHERE clause), the place is never loaded.
+        Args: place_id (str): Place UUID, user_id (str): Caller UUID,
+              is_admin (bool): Caller is admin
         Returns: bool: True if deleted, False if not found
+        Raises: PermissionError: If the caller is neither owner nor admin
         """
-        place = self.place_repo.get(place_id)
-        if not place:
+        if self.check_place_owner(place_id, user_id, is_admin, 'delete') is None:
             return False
-        
-        # SQLAlchemy cascade will handle deletion of related reviews
-        self.place_repo.delete(place_id)
-        return True
+        deleted = self.place_repo.delete_if_owner(
+            place_id, owner_id=None if is_admin else user_id
+        )
+        # Either deleted now or since the owner lookup: drop the entry
+        self._forget_place_owners(place_id)
+        return deleted
 
     # ======================
     # ===== REVIEWS =====
     # ======================
     
-    def create_review(self, review_data):
+    def prepare_review_create(self, place_id, user_id):
+        """
+        Read what the review creation rules need in one query
+        (see ReviewRepository.get_create_context()).
+        Args: place_id (str): Place UUID, user_id (str): Author UUID
+        Returns: tuple: (owner_id, user_exists, already_reviewed),
+                 or None if the place doesn't exist
+        """
+        context = self.review_repo.get_create_context(place_id, user_id)
+        if context is not None:
+            self._place_owner_cache[place_id] = context[0]
+        return context
+
+    def create_review(self, review_data, checked=False):
         """
         Create review with user/place validation.
-        Args: review_data (dict): text, rating, user_id, place_id
+        Args: review_data (dict): text, rating, user_id, place_id,
+              checked (bool): user and place existence already verified
+                              by the caller (prepare_review_create())
         Returns: Review: Created review object
         Raises: ValueError: If user_id or place_id invalid/missing
+                DuplicateReviewError: If the user already reviewed the place
         """
         user_id = review_data.get('user_id')
         place_id = review_data.get('place_id')
 
-        if not user_id or not self.user_repo.get(user_id):
-            raise ValueError("Invalid or missing user_id")
-        if not place_id or not self.place_repo.get(place_id):
-            raise ValueError("Invalid or missing place_id")
+        if not checked:
+            # Existence checks only: EXISTS / cached owner_id, no ORM objects loaded
+            if not user_id or not self.user_repo.exists(user_id):
+                raise ValueError("Invalid or missing user_id")
+            if not place_id or self.get_place_owner_id(place_id) is None:
+                raise ValueError("Invalid or missing place_id")
 
         review = Review(**review_data)
-        self.review_repo.add(review)
+        # The unique (user_id, place_id) constraint settles concurrent
+        # creations that both passed the already-reviewed check
+        try:
+            self.review_repo.add(review)
+        except IntegrityError:
+            db.session.rollback()
+            raise DuplicateReviewError(place_id)
         return review
 
+    def queue_review(self, review_data):
+        """
+        Queue a review for batched insertion instead of inserting it
+        (see app.services.review_queue). The creation rules must already
+        be checked (prepare_review_create()).
+        Args: review_data (dict): text, rating, user_id, place_id
+        Returns: str: UUID generated for the review
+        Raises: ValueError: If text or rating is invalid (model validators)
+                DuplicateReviewError: If the user already has a queued review
+                                      of the place
+                redis.RedisError: Redis unavailable (nothing is queued)
+        """
+        now = datetime.utcnow()
+        # Built (not added to the session) so the model validators apply
+        review = Review(id=str(uuid.uuid4()), created_at=now, updated_at=now, **review_data)
+        row = {column.name: getattr(review, column.name) for column in Review.__table__.columns}
+        if not review_queue.enqueue_review(row):
+            raise DuplicateReviewError(review.place_id)
+        return review.id
+
+    def insert_queued_reviews(self, rows):
+        """
+        Insert a batch of queued reviews (see ReviewRepository.insert_many()).
+        Args: rows (list): Rows popped from the review write queue
+        Returns: list: The rows kept (see ReviewRepository.insert_many()),
+                 used to drop the cached lists of their places
+        """
+        return self.review_repo.insert_many(rows)
+
     def get_review(self, review_id):
         """Get review by ID. Returns: Review or None"""
         return self.review_repo.get(review_id)
 
-    def get_all_reviews(self):
-        """Get all reviews. Returns: list of Review objects"""
-        return self.review_repo.get_all()
-
-    def get_reviews_by_place(self, place_id):
+    def get_review_details(self, review_id):
         """
-        Get all reviews for a place.
-        Args: place_id (str): Place UUID
-        Returns: list of Review objects (empty if place not found)
+        Get review by ID for serialization (user/place preloaded).
+        get_review() stays a plain lookup for the authorship checks.
+        Returns: Review or None
         """
-        if not self.place_repo.get(place_id):
-            return []
-        return self.review_repo.get_reviews_by_place(place_id)
+        return self.review_repo.get_with_relations(review_id)
 
-    def user_has_reviewed_place(self, user_id, place_id):
+    def list_reviews_projection(self, place_id=None):
         """
-        Check if user has already reviewed a place.
-        Args: user_id (str): User UUID, place_id (str): Place UUID
-        Returns: bool: True if user has reviewed place
+        Get the review list responses straight from one projection query
+        (no ORM objects, see ReviewRepository.get_list_rows()).
+        Args: place_id (str): Only the reviews of this place (None: all reviews)
+        Returns: list of review response dicts (always a list, timestamps as
+                 datetime objects: see Review.responses_from_rows()),
+                 or None if the place doesn't exist
         """
-        reviews = self.get_reviews_by_place(place_id)
-        for review in reviews:
-            if review.user_id == user_id:
-                return True
-        return False
+        rows = self.review_repo.get_list_rows(place_id)
+        # Only an empty result can mean a missing place: the (cached) owner
+        # lookup tells them apart, places with reviews cost no extra query
+        if not rows and place_id is not None and self.get_place_owner_id(place_id) is None:
+            return None
+        return Review.responses_from_rows(rows)
 
-    def update_review(self, review_id, review_data):
+    def update_review_checked(self, review_id, review_data, user_id, is_admin):
         """
-        Update review (cannot update id/user_id/place_id/created_at).
-        Args: review_id (str): Review UUID, review_data (dict): Fields to update
-        Returns: Updated Review or None if not found
+        Update review if the caller is its author or an admin.
+        Authorization, existence check and update are one guarded UPDATE
+        (author condition in the WHERE clause), the review is never loaded
+        before it. review_data must have been checked by the caller (the
+        Core UPDATE bypasses the model validators); only text and rating
+        are written, text stripped like the model does.
+        Args: review_id (str): Review UUID, review_data (dict): Fields to update,
+              user_id (str): Caller UUID, is_admin (bool): Caller is admin
+        Returns: Review: Updated review (user/place preloaded), or None if not found
         Raises: ValueError: If trying to update protected fields
+                PermissionError: If the caller is neither author nor admin
         """
-        review = self.review_repo.get(review_id)
-        if not review:
-            return None
-
-        # Prevent updating immutable fields
         for field in ['id', 'user_id', 'place_id', 'created_at']:
             if field in review_data:
                 raise ValueError(f"Cannot update '{field}'")
         
-        review.update(review_data)
-        return review
+        values = {'updated_at': datetime.utcnow()}
+        if 'text' in review_data:
+            values['text'] = review_data['text'].strip()
+        if 'rating' in review_data:
+            values['rating'] = review_data['rating']
+        
+        updated = self.review_repo.update_if_author(
+            review_id, values, user_id=None if is_admin else user_id
+        )
+        if updated is None:
+            # No row matched: tell "not yours" from "not found"
+            if not is_admin and self.review_repo.exists(review_id):
+                raise PermissionError('You can only update your own reviews')
+            return None
+        return self.review_repo.get_with_relations(review_id)
 
-    def delete_review(self, review_id):
+    def delete_review_checked(self, review_id, user_id, is_admin):
         """
-        Delete review.
-        Args: review_id (str): Review UUID
-        Returns: bool: True if deleted, False if not found
+        Delete review if the caller is its author or an admin.
+        One guarded DELETE (author condition in the WHERE clause); the
+        review is only looked up again when nothing was deleted, to tell
+        403 from 404.
+        Args: review_id (str): Review UUID, user_id (str): Caller UUID,
+              is_admin (bool): Caller is admin
+        Returns: str: Place UUID of the deleted review, or None if not found
+        Raises: PermissionError: If the caller is neither author nor admin
         """
-        review = self.review_repo.get(review_id)
-        if not review:
-            return False
-        return self.review_repo.delete(review_id)
\ No newline at end of file
+        place_id = self.review_repo.delete_by_id(
+            review_id, user_id=None if is_admin else user_id
+        )
+        if place_id is None and not is_admin and self.review_repo.exists(review_id):
+            raise PermissionError('You can only delete your own reviews')
+        return place_id
@@ -0,0 +1,99 @@
+#!/usr/bin/python3
+"""
+orjson-based JSON serialization for the HBnB application.
+
+orjson serializes lists of dicts several times faster than the standard
+library json module and produces bytes directly (no str -> bytes step).
+
+Four entry points use it:
+- OrjsonProvider: Flask JSON provider (app.json), used by jsonify() and
+  request.get_json() (e.g. the JWT error handlers)
+- output_json(): Flask-RESTX representation for 'application/json',
+  used for every value returned by a Resource method
+  (Flask-RESTX does not go through app.json)
+- dumps_bytes(): same encoding for bodies built by hand (streamed responses)
+- json_response(): ready JSON Response for Resource methods that bypass
+  the Flask-RESTX representation layer
+
+Request bodies are decoded by OrjsonProvider.loads() as well:
+request.get_json() (and Flask-RESTX's Namespace.payload) go through app.json.
+
+Datetimes: models already convert them in to_dict() (isoformat(), no UTC
+offset), and that exact format is part of the API (web client, amenity
+json_cache). A raw datetime reaching orjson would be serialized natively
+with a '+00:00' offset (OPT_NAIVE_UTC), so to_dict() keeps the conversion.
+Bodies built from plain rows (review lists) can skip the isoformat() call
+per value instead: dumps_bytes(..., option=ISO_DATETIME_OPTIONS) writes
+naive datetimes exactly as isoformat() does, in C.
+"""
+
+import orjson
+from flask import current_app, make_response
+from flask.json.provider import DefaultJSONProvider
+
+
+# OPT_NON_STR_KEYS: accept int/UUID/... dict keys like the json module
+# OPT_NAIVE_UTC: naive datetimes are UTC in this app (datetime.utcnow)
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+# Same without OPT_NAIVE_UTC: naive datetimes come out as their isoformat()
+# string (no UTC offset, microseconds only when non-zero), the API format
+ISO_DATETIME_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+    
+    Types orjson does not handle natively (Decimal, objects with
+    __html__, ...) fall back to Flask's default conversion.
+    """
+    
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string"""
+        return orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes"""
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        """Build a JSON response from the serialized bytes (no str round-trip)"""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=ORJSON_OPTIONS),
+            mimetype=self.mimetype
+        )
+
+
+def dumps_bytes(obj, option=ORJSON_OPTIONS):
+    """
+    Serialize obj to JSON bytes with the API's orjson settings.
+    Args: obj: Value to serialize,
+          option (int): orjson options (ISO_DATETIME_OPTIONS: obj holds
+                        naive datetimes to write in the API format)
+    Returns: bytes: JSON document
+    """
+    return orjson.dumps(obj, default=DefaultJSONProvider.default, option=option)
+
+
+def json_response(obj, status=200, headers=None):
+    """
+    Build a JSON response directly from a value (no representation lookup).
+    Args: obj: Value to serialize, status (int): HTTP status, headers (dict): Extra headers
+    Returns: Response: JSON response
+    """
+    return current_app.response_class(
+        dumps_bytes(obj), status=status, headers=headers, mimetype='application/json'
+    )
+
+
+def output_json(data, code, headers=None):
+    """
+    Flask-RESTX representation for 'application/json' backed by orjson.
+    Args: data: Value returned by the resource, code (int): HTTP status, headers (dict): Extra headers
+    Returns: Response: JSON response
+    """
+    resp = make_response(dumps_bytes(data), code)
+    resp.headers.extend(headers or {})
+    return resp
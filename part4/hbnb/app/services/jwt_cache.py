@@ -0,0 +1,167 @@
+#!/usr/bin/python3
+"""
+Verified JWT claims cache for the HBnB application.
+
+Signature verification and claim parsing run on every protected request,
+even when the same token is replayed seconds apart (typical admin UI).
+This module keeps the claims of already-verified tokens in a bounded
+in-process LRU cache so repeated requests skip re-verification.
+
+Cache design:
+- Key: blake2b digest of the raw token (the token itself is never stored)
+- Value: (jwt_header, jwt_data, exp) of a token that passed verification
+- An entry is only served while its 'exp' claim is in the future
+- Failed verifications are never cached
+- Revoked tokens (logout) are re-checked on every hit
+
+CORS preflight (OPTIONS) requests are exempt, as in verify_jwt_in_request():
+no token hashing, no cache lookup and no signature verification. Flask
+answers OPTIONS itself (the views are not even called), this only keeps
+the decorators safe if a resource ever defines options() explicitly.
+
+Per request, the verified claims are also kept on flask.g, so decorators
+and handlers read them once:
+- g.jwt_claims: full decoded payload (see current_claims())
+- g.jwt_identity: 'sub' claim, the caller's user UUID
+- g.is_admin: caller's admin role, resolved at most once per request
+  (see current_is_admin())
+
+Protected views use @cached_jwt_required and read the caller from there
+(g.jwt_identity, current_is_admin()), never through get_jwt() or
+get_jwt_identity(): the token is decoded at most once per request, by the
+decorator, and not at all on a cache hit.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, g, request
+from flask_jwt_extended import verify_jwt_in_request
+from flask_jwt_extended.config import config as jwt_config
+from app import facade
+from app.services.token_blocklist import is_token_revoked
+
+
+# Maximum number of tokens kept in the cache (least recently used are evicted)
+MAX_ENTRIES = 4096
+
+# {token_hash: (jwt_header, jwt_data, exp)}
+_claims_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def _token_hash():
+    """
+    Hash the bearer token of the current request.
+    Returns: bytes: 16-byte blake2b digest, or None if no bearer token is present
+    """
+    auth_header = request.headers.get('Authorization', '')
+    if not auth_header.startswith('Bearer '):
+        return None
+    return hashlib.blake2b(auth_header[7:].strip().encode('utf-8'), digest_size=16).digest()
+
+
+def _get_cached(token_hash):
+    """Return cached (jwt_header, jwt_data) if present and not expired, else None"""
+    with _lock:
+        entry = _claims_cache.get(token_hash)
+        if entry is None:
+            return None
+        _claims_cache.move_to_end(token_hash)
+    
+    # The revocation check may be a Redis round-trip: it runs outside the
+    # lock so concurrent requests don't wait on each other's network call
+    if entry[2] <= time.time() or is_token_revoked(entry[1].get('jti', '')):
+        # Token expired or revoked since it was cached: force a full
+        # verification (which rejects it with the usual 401 response)
+        with _lock:
+            _claims_cache.pop(token_hash, None)
+        return None
+    return entry[0], entry[1]
+
+
+def _store(token_hash, jwt_header, jwt_data):
+    """Cache the claims of a successfully verified token"""
+    exp = jwt_data.get('exp')
+    if exp is None:
+        # Tokens without expiration are never cached
+        return
+    with _lock:
+        _claims_cache[token_hash] = (jwt_header, jwt_data, exp)
+        _claims_cache.move_to_end(token_hash)
+        while len(_claims_cache) > MAX_ENTRIES:
+            _claims_cache.popitem(last=False)
+
+
+def clear_jwt_cache():
+    """Drop every cached token (e.g. after a secret key rotation)"""
+    with _lock:
+        _claims_cache.clear()
+
+
+def verify_jwt_in_request_cached():
+    """
+    Cache-backed equivalent of verify_jwt_in_request().
+
+    Either way the claims end up on flask.g (g.jwt_claims, g.jwt_identity).
+    On a cache hit nothing else is set: Flask-JWT-Extended's own request
+    state is private, so get_jwt() and get_jwt_identity() are not
+    available after a hit (use current_claims() and g.jwt_identity).
+    On a miss, the token goes through the normal verify_jwt_in_request()
+    path (same error handlers) and is cached once verified.
+    Exempt methods (OPTIONS preflight) return immediately without a token.
+    """
+    if request.method in jwt_config.exempt_methods:
+        return
+    token_hash = _token_hash()
+    cached = _get_cached(token_hash) if token_hash else None
+
+    if cached:
+        _jwt_header, jwt_data = cached
+        g.jwt_claims = jwt_data
+        g.jwt_identity = jwt_data.get('sub')
+    else:
+        # Full verification (raises on missing/invalid/expired token)
+        verified = verify_jwt_in_request()
+        if verified:
+            g.jwt_claims = verified[1]
+            g.jwt_identity = verified[1].get('sub')
+            if token_hash:
+                _store(token_hash, *verified)
+
+
+def current_claims():
+    """
+    Claims of the JWT verified for the current request.
+    Only valid in views protected by @cached_jwt_required (which sets them).
+    Returns: dict: Decoded JWT payload (g.jwt_claims)
+    """
+    return g.jwt_claims
+
+
+def current_is_admin():
+    """
+    Admin role of the caller of the current (JWT-verified) request.
+    The role is not carried in the token: it is resolved server-side
+    (cached facade lookup) on first use, then kept on g.is_admin.
+    Returns: bool: True if the authenticated user is an admin
+    """
+    is_admin = g.get('is_admin')
+    if is_admin is None:
+        is_admin = g.is_admin = facade.is_user_admin(g.jwt_identity)
+    return is_admin
+
+
+def cached_jwt_required(fn):
+    """
+    Drop-in replacement for @jwt_required() backed by the claims cache
+    (see verify_jwt_in_request_cached()).
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        verify_jwt_in_request_cached()
+        return current_app.ensure_sync(fn)(*args, **kwargs)
+    return wrapper
+
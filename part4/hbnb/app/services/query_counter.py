@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+"""
+Development-time SQL query budget for the HBnB application.
+
+N+1 regressions (a relationship read once per row without eager loading)
+do not break any response: they only make an endpoint slower as the
+tables grow. This module counts the SQL statements of each request so
+such regressions fail loudly during development.
+
+- Every statement executed through a SQLAlchemy Engine increments a
+  counter on flask.g (g.sql_query_count), inside an app context
+- @query_budget(n) on a view raises AssertionError, in debug mode only,
+  when the view executed more than n statements
+- Outside debug mode the check is skipped (the listener only costs one
+  counter increment per statement)
+"""
+
+from functools import wraps
+from flask import current_app, g, has_app_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    """Count one executed statement for the current app context"""
+    if has_app_context():
+        g.sql_query_count = g.get('sql_query_count', 0) + 1
+
+
+def query_budget(max_queries):
+    """
+    Fail a view that executes more than max_queries SQL statements (debug only).
+    Args: max_queries (int): Statements allowed for one call of the view
+    Returns: function: Decorator
+    Raises: AssertionError: In debug mode, when the budget is exceeded
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not current_app.debug:
+                return fn(*args, **kwargs)
+            start = g.get('sql_query_count', 0)
+            result = fn(*args, **kwargs)
+            used = g.get('sql_query_count', 0) - start
+            if used > max_queries:
+                raise AssertionError(
+                    f'{fn.__qualname__} executed {used} SQL queries '
+                    f'(budget: {max_queries}): missing eager loading?'
+                )
+            return result
+        return wrapper
+    return decorator
\ No newline at end of file
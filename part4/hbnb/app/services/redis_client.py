@@ -0,0 +1,36 @@
+#!/usr/bin/python3
+"""
+Shared Redis connection for the HBnB application.
+
+Redis is optional: it is only used when REDIS_URL is configured and the
+'redis' package (listed in requirements.txt) is installed. Every feature built on it (JWT revocation
+list, HTTP response cache) falls back to in-process behavior otherwise,
+so callers must handle get_redis() returning None.
+"""
+
+try:
+    import redis
+except ImportError:  # Optional dependency
+    redis = None
+
+
+# Redis client (None when Redis is not configured/available)
+_client = None
+
+
+def init_redis(app):
+    """
+    Create the Redis client from the app configuration.
+    Args: app (Flask): Application (reads REDIS_URL)
+    """
+    global _client
+    redis_url = app.config.get('REDIS_URL')
+    if redis_url and redis is not None:
+        _client = redis.Redis.from_url(redis_url)
+    else:
+        _client = None
+
+
+def get_redis():
+    """Return the shared Redis client, or None if Redis is not in use"""
+    return _client
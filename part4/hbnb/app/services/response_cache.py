@@ -0,0 +1,137 @@
+#!/usr/bin/python3
+"""
+Redis-backed HTTP response cache for public GET endpoints.
+
+Public resources (same body for every user) are cached as serialized
+JSON bytes under an explicit key, so a hit is answered with one Redis GET:
+no database query and no serialization.
+
+Rules:
+- Only 200 responses are cached (a 404 is never cached)
+- Entries expire after `ttl` seconds and are deleted explicitly by the
+  endpoints that modify the resource (invalidate_responses())
+- Without Redis (see app.services.redis_client) the decorator is a no-op
+- Redis errors never fail the request: the view is served uncached
+
+Conditional requests: responses built with conditional_json_response()
+carry a strong ETag (hash of the body). A client sending a matching
+If-None-Match gets an empty 304. The ETag only depends on the body, so it
+is the same whether the body comes from Redis or from the view.
+
+Version-based ETags (version_etag() / not_modified()) are derived from a
+cheap change fingerprint of the data instead of the body, so a matching
+If-None-Match is answered before the resource is loaded or serialized.
+"""
+
+import hashlib
+from functools import wraps
+from flask import Response, request
+from app.services.redis_client import get_redis, redis
+
+
+# Errors raised by the Redis client (connection refused, timeout, ...)
+REDIS_ERRORS = (redis.RedisError,) if redis is not None else ()
+
+
+def cached_response(key_template, ttl=60):
+    """
+    Cache the JSON body of a GET view in Redis.
+    
+    Args:
+        key_template (str): Cache key, formatted with the view's URL
+                            parameters (e.g. 'amenities:{amenity_id}')
+        ttl (int): Time to live of the entry in seconds (default: 60)
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            client = get_redis()
+            if client is None:
+                return fn(*args, **kwargs)
+            
+            key = key_template.format(**kwargs)
+            try:
+                body = client.get(key)
+            except REDIS_ERRORS:
+                return fn(*args, **kwargs)
+            if body is not None:
+                return conditional_json_response(body)
+            
+            response = fn(*args, **kwargs)
+            # Streamed bodies are not cached: reading them here would buffer
+            # the whole stream before sending it
+            if (isinstance(response, Response) and response.status_code == 200
+                    and not response.is_streamed):
+                try:
+                    client.setex(key, ttl, response.get_data())
+                except REDIS_ERRORS:
+                    pass
+            return response
+        return wrapper
+    return decorator
+
+
+def invalidate_responses(*keys):
+    """
+    Delete cached responses after the underlying resource changed.
+    Args: *keys (str): Cache keys to delete
+    """
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        client.delete(*keys)
+    except REDIS_ERRORS:
+        pass
+
+
+def body_etag(body):
+    """
+    Compute the strong ETag of a response body.
+    Args: body (str or bytes): Serialized response body
+    Returns: str: 16-byte blake2b hex digest
+    """
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def conditional_json_response(body, etag=None):
+    """
+    Build a JSON response with an ETag, answering 304 Not Modified when
+    the request's If-None-Match matches it.
+    Args: body (str or bytes): Serialized JSON body,
+          etag (str): Precomputed ETag (computed from the body if None)
+    Returns: Response: 200 with the body, or 304 without it
+    """
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag or body_etag(body))
+    return response.make_conditional(request)
+
+
+def version_etag(version):
+    """
+    Compute an ETag from a data version fingerprint (instead of the body).
+    Args: version (tuple): Values that change whenever the response does
+    Returns: str: 16-byte blake2b hex digest
+    """
+    return hashlib.blake2b(repr(version).encode('utf-8'), digest_size=16).hexdigest()
+
+
+def not_modified(etag, weak=False, cache_control=None):
+    """
+    Answer a conditional GET from its ETag alone.
+    Args: etag (str): Current ETag of the resource, weak (bool): Weak validator,
+          cache_control (str): Cache-Control of the full response, repeated
+                               on the 304 (RFC 9110 15.4.5)
+    Returns: Response: Empty 304 if the request's If-None-Match matches
+             (weak comparison, as RFC 9110 requires for If-None-Match),
+             None otherwise (the view builds the full response)
+    """
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+        response.set_etag(etag, weak=weak)
+        if cache_control:
+            response.headers['Cache-Control'] = cache_control
+        return response
+    return None
\ No newline at end of file
@@ -0,0 +1,155 @@
+#!/usr/bin/python3
+"""
+Redis write queue for review creation (optional, for write spikes).
+
+With REVIEW_WRITE_QUEUE enabled and Redis configured, POST review requests
+still run every creation rule (one query), but the review is not inserted
+by the request: its row (id generated server-side) is pushed to a Redis
+list and the request answers 202 with the review id. A background process
+(flask --app run flush-review-queue) pops the queue and inserts the rows in
+batches (ReviewRepository.insert_many()), so a burst of reviews costs the
+web workers one Redis round-trip each instead of a database write.
+
+Keys:
+- 'reviews:write_queue': list of JSON review rows (LPUSH / BRPOP, FIFO)
+- 'reviews:user:<user_id>:places': set of the places a user has a queued
+  (not yet inserted) review for. SADD is the duplicate check of a queued
+  review: the database cannot see it yet. Members are removed once the
+  row is inserted; reviews already in the database are caught by the
+  regular already-reviewed check.
+
+Tradeoffs:
+- Eventual consistency: a queued review only appears in the lists (and
+  GET /<review_id> only finds it) after the next flush
+- A batch popped by a flusher that is killed before inserting it is lost
+
+Without Redis (or with the flag off) reviews are inserted synchronously.
+"""
+
+import time
+from datetime import datetime
+import orjson
+from flask import current_app
+from app.services.json_provider import dumps_bytes
+from app.services.redis_client import get_redis
+from app.services.response_cache import REDIS_ERRORS
+
+
+# Redis list holding the queued review rows
+QUEUE_KEY = 'reviews:write_queue'
+
+# Redis set prefix: places a user has a queued review for
+PENDING_KEY_PREFIX = 'reviews:user:'
+
+# Lifetime of a pending set without new reviews (seconds)
+PENDING_TTL = 3600
+
+# Flush batches: at most BATCH_SIZE rows, collected for at most BATCH_WAIT seconds
+BATCH_SIZE = 100
+BATCH_WAIT = 0.05
+
+
+def _pending_key(user_id):
+    """Redis key of the set of places user_id has a queued review for"""
+    return f'{PENDING_KEY_PREFIX}{user_id}:places'
+
+
+def _dump_row(row):
+    """Serialize a review row for the queue (datetimes as isoformat() strings)"""
+    return dumps_bytes(dict(
+        row,
+        created_at=row['created_at'].isoformat(),
+        updated_at=row['updated_at'].isoformat(),
+    ))
+
+
+def _load_row(item):
+    """Deserialize a queued review row (datetimes restored)"""
+    row = orjson.loads(item)
+    row['created_at'] = datetime.fromisoformat(row['created_at'])
+    row['updated_at'] = datetime.fromisoformat(row['updated_at'])
+    return row
+
+
+def queue_enabled():
+    """Return True if review creations go through the write queue"""
+    return bool(current_app.config.get('REVIEW_WRITE_QUEUE')) and get_redis() is not None
+
+
+def enqueue_review(row):
+    """
+    Queue a checked review row for insertion.
+    Args: row (dict): Column values (id, text, rating, place_id, user_id,
+                      created_at, updated_at as datetimes)
+    Returns: bool: True if queued, False if the user already has a queued
+             review of this place
+    Raises: redis.RedisError: Redis unavailable (nothing is queued)
+    """
+    client = get_redis()
+    key = _pending_key(row['user_id'])
+    pipe = client.pipeline()
+    pipe.sadd(key, row['place_id'])
+    pipe.expire(key, PENDING_TTL)
+    added = pipe.execute()[0]
+    if not added:
+        return False
+
+    try:
+        client.lpush(QUEUE_KEY, _dump_row(row))
+    except REDIS_ERRORS:
+        # Not queued: the place must not stay marked as reviewed
+        client.srem(key, row['place_id'])
+        raise
+    return True
+
+
+def pop_review_batch(batch_size=BATCH_SIZE, max_wait=BATCH_WAIT, timeout=1):
+    """
+    Pop the next batch of queued review rows.
+    Blocks up to `timeout` seconds for the first row, then collects more
+    rows for at most `max_wait` seconds, until batch_size rows are popped.
+    Args: batch_size (int): Maximum rows per batch,
+          max_wait (float): Collection window after the first row (seconds),
+          timeout (int): Wait for the first row (seconds)
+    Returns: list: Row dicts (datetimes restored), empty if the queue stayed empty
+    """
+    client = get_redis()
+    first = client.brpop(QUEUE_KEY, timeout=timeout)
+    if first is None:
+        return []
+
+    items = [first[1]]
+    deadline = time.monotonic() + max_wait
+    while len(items) < batch_size:
+        more = client.rpop(QUEUE_KEY, batch_size - len(items))
+        if more:
+            items.extend(more)
+        elif time.monotonic() >= deadline:
+            break
+        else:
+            time.sleep(0.005)
+
+    return [_load_row(item) for item in items]
+
+
+def requeue_reviews(rows):
+    """
+    Put a popped batch back at the head of the queue (insertion failed).
+    Args: rows (list): Rows returned by pop_review_batch()
+    """
+    if rows:
+        # RPUSH in reverse order: the oldest row is popped first again
+        get_redis().rpush(QUEUE_KEY, *[_dump_row(row) for row in reversed(rows)])
+
+
+def release_pending(rows):
+    """
+    Clear the queued markers of flushed rows (inserted or dropped).
+    Args: rows (list): Rows returned by pop_review_batch()
+    """
+    if not rows:
+        return
+    pipe = get_redis().pipeline()
+    for row in rows:
+        pipe.srem(_pending_key(row['user_id']), row['place_id'])
+    pipe.execute()
@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""
+JWT revocation list (blocklist) for the HBnB application.
+
+Revoked tokens are identified by their 'jti' claim and only need to be
+remembered until they expire anyway ('exp' claim), so every entry is
+stored with a TTL and disappears on its own.
+
+Storage backends:
+- Redis (shared client from app.services.redis_client):
+  one key per revoked token, 'jwt:revoked:<jti>', set with EXPIREAT at the
+  token's exp. The check is a single O(1) EXISTS, shared by all workers.
+- In-process dict: {jti: exp}, expired entries are purged lazily.
+  Every revocation is also recorded there, so the worker that served the
+  logout always rejects the token.
+
+Without Redis, a logout only revokes the token in the process that
+served it: other gunicorn workers keep accepting it until it expires.
+Multi-worker deployments must set REDIS_URL (gunicorn.conf.py warns at
+startup otherwise).
+
+Redis errors never fail a request:
+- is_token_revoked() falls back to the in-process dict (fail open:
+  during an outage, tokens revoked through other workers are accepted
+  again, instead of every request being rejected)
+- revoke_token() reports that the revocation is not shared, and the
+  logout endpoint answers 503 so the client retries
+
+The check runs on every protected request (token_in_blocklist_loader),
+so it never touches the SQL database.
+"""
+
+import threading
+import time
+from flask import current_app
+from app.services.redis_client import get_redis
+from app.services.response_cache import REDIS_ERRORS
+
+
+# Redis key prefix for revoked token ids
+REDIS_KEY_PREFIX = 'jwt:revoked:'
+
+# In-process store: {jti: exp}
+_revoked = {}
+_lock = threading.Lock()
+
+
+def revoke_token(jti, exp):
+    """
+    Add a token to the revocation list until it expires.
+    Args: jti (str): Token unique identifier, exp (int): Token expiration (Unix timestamp)
+    Returns: bool: False if Redis is configured but the revocation could not
+             be stored there (only this process rejects the token), else True
+    """
+    with _lock:
+        _revoked[jti] = exp
+        # Purge expired entries so the store stays bounded
+        now = time.time()
+        for expired_jti in [j for j, e in _revoked.items() if e <= now]:
+            del _revoked[expired_jti]
+    
+    redis_client = get_redis()
+    if redis_client is None:
+        return True
+    key = REDIS_KEY_PREFIX + jti
+    try:
+        pipe = redis_client.pipeline()
+        pipe.set(key, 1)
+        pipe.expireat(key, int(exp))
+        pipe.execute()
+    except REDIS_ERRORS:
+        current_app.logger.warning('Token revocation not stored in Redis (jti %s)', jti)
+        return False
+    return True
+
+
+def is_token_revoked(jti):
+    """
+    Check whether a token has been revoked.
+    Args: jti (str): Token unique identifier
+    Returns: bool: True if the token is in the revocation list
+    """
+    exp = _revoked.get(jti)
+    if exp is not None and exp > time.time():
+        return True
+    
+    redis_client = get_redis()
+    if redis_client is None:
+        return False
+    try:
+        return bool(redis_client.exists(REDIS_KEY_PREFIX + jti))
+    except REDIS_ERRORS:
+        # Fail open (see module docstring)
+        current_app.logger.warning('Token revocation list unavailable (Redis error)')
+        return False
@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+"""
+Small thread-safe TTL + LRU cache for the HBnB application.
+
+Entries expire `ttl` seconds after being stored, and the least recently
+used entries are evicted once `maxsize` is reached. Same interface subset
+as cachetools.TTLCache (get / [] assignment / pop / clear), without the
+extra dependency.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Bounded in-process cache with per-entry time to live.
+    
+    Attributes:
+        maxsize (int): Maximum number of entries (LRU eviction beyond)
+        ttl (float): Time to live of an entry in seconds
+    """
+    
+    def __init__(self, maxsize, ttl):
+        """Create an empty cache holding at most `maxsize` entries for `ttl` seconds"""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # {key: (value, expires_at)}
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if missing/expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[1] <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[0]
+    
+    def __setitem__(self, key, value):
+        """Store value for key (evicts the least recently used entry if full)"""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key, default=None):
+        """Remove key and return its value (or default)"""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+    
+    def clear(self):
+        """Remove every entry"""
+        with self._lock:
+            self._data.clear()
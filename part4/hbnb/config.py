@@ -23,9 +23,27 @@ class Config:
     # JWT token expiration time (30 days)
     JWT_ACCESS_TOKEN_EXPIRES = timedelta(days=30)
     
+    # Redis URL for the JWT revocation list, the shared caches, the GET
+    # response cache and the review write queue (requires the 'redis'
+    # package). If unset, revoked tokens are kept in process memory: a
+    # logout is then only seen by the worker that served it, so any
+    # multi-worker deployment (gunicorn) must set it
+    REDIS_URL = os.getenv('REDIS_URL')
+    
+    # Queue review creations in Redis (POST answers 202) and insert them in
+    # batches from `flask --app run flush-review-queue`. Requires REDIS_URL;
+    # ignored without Redis (reviews are then inserted by the request)
+    REVIEW_WRITE_QUEUE = os.getenv('REVIEW_WRITE_QUEUE', '').lower() in ('1', 'true', 'yes')
+    
     # Database URI (defaults to SQLite in development)
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///hbnb_dev.db')
     
+    # Bcrypt work factor for user passwords (2^12 rounds)
+    BCRYPT_LOG_ROUNDS = 12
+    
+    # Lower bcrypt work factor for short-lived tokens (see app.hash_token)
+    BCRYPT_TOKEN_LOG_ROUNDS = 6
+    
     # Disable SQLAlchemy event system (saves memory, prevents deprecation warnings)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
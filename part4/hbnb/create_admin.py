@@ -7,6 +7,9 @@ from app.models.user import User
 app = create_app()
 
 with app.app_context():
+    # Crée les tables si nécessaire (équivalent de `flask init-db`)
+    db.create_all()
+    
     # Vérifie si l'admin existe déjà
     existing_admin = User.query.filter_by(email="admin@hbnb.com").first()
     
@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+"""
+Gunicorn configuration for serving the HBnB API in production.
+
+Usage:
+    gunicorn -c gunicorn.conf.py run:app
+
+Worker model:
+- gevent workers: each process multiplexes many concurrent requests on
+  one event loop, so requests waiting on the database, Redis or the
+  network no longer hold a whole process (sync workers serve one
+  request at a time per process)
+- The gevent worker monkey-patches the standard library itself before
+  the application is imported: no patch_all() is needed in the app code
+- sync workers (WORKER_CLASS=sync) are the alternative for CPU-bound
+  traffic (JWT checks, serialization): one request per process at a
+  time, 2 * CPU + 1 processes so a worker blocked on the database does
+  not leave a core idle. Put a reverse proxy (nginx) in front: it keeps
+  client connections alive and buffers slow clients, sync workers only
+  see short local connections
+
+Environment overrides:
+- PORT: listening port (default 5000)
+- WORKER_CLASS: 'gevent' (default) or 'sync'
+- WEB_CONCURRENCY: number of worker processes
+  (default: CPU count for gevent, 2 * CPU count + 1 for sync)
+- WORKER_CONNECTIONS: concurrent requests per gevent worker (default 1000)
+
+REDIS_URL is required with more than one worker: without it, a logout
+only revokes the token in the worker that served it (see
+app.services.token_blocklist). A warning is logged at startup.
+"""
+
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+worker_class = os.getenv('WORKER_CLASS', 'gevent')
+if worker_class == 'sync':
+    default_workers = 2 * multiprocessing.cpu_count() + 1
+    threads = 1
+else:
+    default_workers = multiprocessing.cpu_count()
+    worker_connections = int(os.getenv('WORKER_CONNECTIONS', '1000'))
+workers = int(os.getenv('WEB_CONCURRENCY', default_workers))
+
+# Idle keep-alive connections are closed after 5 s; a request running
+# longer than 30 s gets its worker killed and restarted
+keepalive = 5
+timeout = 30
+
+def on_starting(server):
+    """Warn when several workers run without the shared revocation list"""
+    if workers > 1 and not os.getenv('REDIS_URL'):
+        server.log.warning(
+            'REDIS_URL is not set: with %d workers, a logout only revokes '
+            'the token in the worker that served it', workers
+        )
@@ -31,8 +31,11 @@ CREATE TABLE users (
 CREATE TABLE amenities (
     id VARCHAR(36) PRIMARY KEY,
     name VARCHAR(50) NOT NULL UNIQUE,
+    -- Casefolded name: case-insensitive uniqueness ("WiFi" and "wifi" are the same amenity)
+    name_ci VARCHAR(50) NOT NULL UNIQUE,
     created_at DATETIME NOT NULL,
-    updated_at DATETIME NOT NULL
+    updated_at DATETIME NOT NULL,
+    json_cache TEXT
 );
 
 ----------------------------------------------------
@@ -54,6 +57,9 @@ CREATE TABLE places (
     FOREIGN KEY(owner_id) REFERENCES users(id) ON DELETE CASCADE
 );
 
+-- Keyset pagination of the place list (ORDER BY created_at DESC, id DESC)
+CREATE INDEX ix_places_created_at_id ON places (created_at, id);
+
 ----------------------------------------------------
 -- 4. CREATE REVIEWS TABLE
 ----------------------------------------------------
@@ -66,9 +72,15 @@ CREATE TABLE reviews (
     created_at DATETIME NOT NULL,
     updated_at DATETIME NOT NULL,
     FOREIGN KEY(place_id) REFERENCES places(id) ON DELETE CASCADE,
-    FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
+    FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE,
+    -- One review per user per place; place_id leads so the index also
+    -- serves the reviews-of-a-place lookups
+    CONSTRAINT uq_reviews_place_user UNIQUE (place_id, user_id)
 );
 
+-- Reviews written by a user
+CREATE INDEX ix_reviews_user_id ON reviews (user_id);
+
 ----------------------------------------------------
 -- 5. CREATE PLACE_AMENITY ASSOCIATION TABLE (Many-to-Many)
 ----------------------------------------------------
@@ -92,7 +104,7 @@ INSERT INTO users (id, first_name, last_name, email, password, is_admin, created
 
 
 -- Insert Initial Amenities
-INSERT INTO amenities (id, name, created_at, updated_at) VALUES
-('a0f78c8d-195b-4e89-9a2c-9a4f6d3d9b4c', 'WiFi', DATETIME('now'), DATETIME('now')),
-('a1f78c8d-195b-4e89-9a2c-9a4f6d3d9b4c', 'Swimming Pool', DATETIME('now'), DATETIME('now')),
-('a3f78c8d-195b-4e89-9a2c-9a4f6d3d9b4c', 'Air Conditioning', DATETIME('now'), DATETIME('now')),
+INSERT INTO amenities (id, name, name_ci, created_at, updated_at) VALUES
+('a0f78c8d-195b-4e89-9a2c-9a4f6d3d9b4c', 'WiFi', 'wifi', DATETIME('now'), DATETIME('now')),
+('a1f78c8d-195b-4e89-9a2c-9a4f6d3d9b4c', 'Swimming Pool', 'swimming pool', DATETIME('now'), DATETIME('now')),
+('a3f78c8d-195b-4e89-9a2c-9a4f6d3d9b4c', 'Air Conditioning', 'air conditioning', DATETIME('now'), DATETIME('now')),
@@ -1,11 +1,74 @@
 import unittest
-from app import create_app
+from flask_jwt_extended import decode_token
+from sqlalchemy import event
+from app import create_app, db, facade
+from app.api.restx_patches import _build_validator, _compile_fast_check
+from app.api.v1.amenities import amenity_model
+from app.api.v1.auth import login_model
+from app.api.v1.places import place_model
+from app.api.v1.reviews import review_create_model, review_model, review_update_model
+from app.api.v1.users import admin_update_model, user_model, user_update_model
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from config import DevelopmentConfig
 
-class TestUserEndpoints(unittest.TestCase):
+
+class TestConfig(DevelopmentConfig):
+    """Private in-memory database per app, quiet SQL, cheap password hashes"""
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    SQLALCHEMY_ECHO = False
+    BCRYPT_LOG_ROUNDS = 4
+    BCRYPT_TOKEN_LOG_ROUNDS = 4
+    JWT_SECRET_KEY = 'test-jwt-secret-key-at-least-32-bytes'
+
+
+class DatabaseTestCase(unittest.TestCase):
+    """App on an empty in-memory database (the tables are created per test)"""
 
     def setUp(self):
-        self.app = create_app()
+        self.app = create_app(TestConfig)
         self.client = self.app.test_client()
+        # The facade outlives the app: start from empty in-process caches
+        facade.__init__()
+        with self.app.app_context():
+            db.create_all()
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    def create_user(self, email, password='password123'):
+        """Register a user through the API, return its id"""
+        response = self.client.post('/api/v1/users/', json={
+            "first_name": "Test",
+            "last_name": "User",
+            "email": email,
+            "password": password
+        })
+        self.assertEqual(response.status_code, 201)
+        return response.get_json()['id']
+
+    def create_admin(self, email, password='password123'):
+        """Insert an admin user directly (the API cannot create one), return its id"""
+        with self.app.app_context():
+            admin = User('Ada', 'Admin', email, password, is_admin=True)
+            db.session.add(admin)
+            db.session.commit()
+            return admin.id
+
+    def login(self, email, password='password123'):
+        """Log in through the API, return the Authorization header"""
+        response = self.client.post('/api/v1/auth/login', json={
+            "email": email,
+            "password": password
+        })
+        self.assertEqual(response.status_code, 200)
+        return {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+
+
+class TestUserEndpoints(DatabaseTestCase):
 
     def test_create_user(self):
         response = self.client.post('/api/v1/users/', json={
@@ -22,4 +85,431 @@ class TestUserEndpoints(unittest.TestCase):
             "last_name": "",
             "email": "invalid-email"
         })
-        self.assertEqual(response.status_code, 400)
\ No newline at end of file
+        self.assertEqual(response.status_code, 400)
+
+
+class TestAmenityEndpoints(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.create_admin('admin@example.com')
+        self.admin = self.login('admin@example.com')
+
+    def test_duplicate_name_ignores_case(self):
+        response = self.client.post('/api/v1/amenities/', json={"name": "WiFi"}, headers=self.admin)
+        self.assertEqual(response.status_code, 201)
+        response = self.client.post('/api/v1/amenities/', json={"name": " wifi "}, headers=self.admin)
+        self.assertEqual(response.status_code, 409)
+
+    def test_rename_to_existing_name(self):
+        self.client.post('/api/v1/amenities/', json={"name": "Pool"}, headers=self.admin)
+        response = self.client.post('/api/v1/amenities/', json={"name": "Sauna"}, headers=self.admin)
+        amenity_id = response.get_json()['id']
+        response = self.client.put(f'/api/v1/amenities/{amenity_id}', json={"name": "POOL"},
+                                   headers=self.admin)
+        self.assertEqual(response.status_code, 409)
+
+    def test_list_not_modified(self):
+        self.client.post('/api/v1/amenities/', json={"name": "WiFi"}, headers=self.admin)
+        # First read builds the cached list, the second one is served from it
+        response = self.client.get('/api/v1/amenities/')
+        self.assertEqual([a['name'] for a in response.get_json()], ['WiFi'])
+        response = self.client.get('/api/v1/amenities/')
+        etag = response.headers['ETag']
+        response = self.client.get('/api/v1/amenities/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+        # A write drops the cached list
+        self.client.post('/api/v1/amenities/', json={"name": "Pool"}, headers=self.admin)
+        response = self.client.get('/api/v1/amenities/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(sorted(a['name'] for a in response.get_json()), ['Pool', 'WiFi'])
+
+    def test_amenity_not_modified(self):
+        response = self.client.post('/api/v1/amenities/', json={"name": "Sauna"}, headers=self.admin)
+        amenity_id = response.get_json()['id']
+        response = self.client.get(f'/api/v1/amenities/{amenity_id}')
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get(f'/api/v1/amenities/{amenity_id}',
+                                   headers={'If-None-Match': response.headers['ETag']})
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get('/api/v1/amenities/missing-id')
+        self.assertEqual(response.status_code, 404)
+
+    def test_blank_name(self):
+        response = self.client.post('/api/v1/amenities/', json={"name": "   "}, headers=self.admin)
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/v1/amenities/', json={"name": "Spa"}, headers=self.admin)
+        amenity_id = response.get_json()['id']
+        response = self.client.put(f'/api/v1/amenities/{amenity_id}', json={"name": ""},
+                                   headers=self.admin)
+        self.assertEqual(response.status_code, 400)
+
+    def test_writes_require_admin(self):
+        self.create_user('user@example.com')
+        headers = self.login('user@example.com')
+        response = self.client.post('/api/v1/amenities/', json={"name": "Gym"}, headers=headers)
+        self.assertEqual(response.status_code, 403)
+        # The role is looked up server-side, not carried in the token
+        with self.app.app_context():
+            claims = decode_token(headers['Authorization'][len('Bearer '):])
+        self.assertNotIn('is_admin', claims)
+
+
+class TestAuthEndpoints(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.user_id = self.create_user('auth@example.com')
+        self.headers = self.login('auth@example.com')
+
+    def test_cached_token_identity(self):
+        # The second request is served from the verified claims cache
+        for _ in range(2):
+            response = self.client.get('/api/v1/auth/protected', headers=self.headers)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.get_json()['message'], f'Hello, user {self.user_id}')
+
+    def test_logout_revokes_token(self):
+        response = self.client.post('/api/v1/auth/logout', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        # Revoked even though its claims are in the verified claims cache
+        response = self.client.get('/api/v1/auth/protected', headers=self.headers)
+        self.assertEqual(response.status_code, 401)
+        response = self.client.post('/api/v1/auth/logout', headers=self.headers)
+        self.assertEqual(response.status_code, 401)
+
+    def test_logout_keeps_other_tokens(self):
+        other = self.login('auth@example.com')
+        self.client.post('/api/v1/auth/logout', headers=self.headers)
+        response = self.client.get('/api/v1/auth/protected', headers=other)
+        self.assertEqual(response.status_code, 200)
+
+    def test_login_after_password_change(self):
+        # The first login is cached: the change must still invalidate it
+        self.create_admin('admin@example.com')
+        admin = self.login('admin@example.com')
+        response = self.client.put(f'/api/v1/users/admin/{self.user_id}',
+                                   json={"password": "newpassword456"}, headers=admin)
+        self.assertEqual(response.status_code, 200)
+        response = self.client.post('/api/v1/auth/login', json={
+            "email": "auth@example.com",
+            "password": "password123"
+        })
+        self.assertEqual(response.status_code, 401)
+        self.login('auth@example.com', 'newpassword456')
+
+    def test_missing_token(self):
+        response = self.client.get('/api/v1/auth/protected')
+        self.assertEqual(response.status_code, 401)
+
+
+class TestPlaceEndpoints(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.owner_id = self.create_user('owner@example.com')
+        self.owner = self.login('owner@example.com')
+        self.other_id = self.create_user('other@example.com')
+        self.other = self.login('other@example.com')
+        self.place_id = self.create_place('Loft')
+
+    def create_place(self, title, **fields):
+        """Create a place owned by self.owner_id through the API, return its id"""
+        response = self.client.post('/api/v1/places/', json=dict({
+            "title": title,
+            "price": 100.0,
+            "latitude": 48.85,
+            "longitude": 2.35,
+            "owner_id": self.owner_id
+        }, **fields), headers=self.owner)
+        self.assertEqual(response.status_code, 201)
+        return response.get_json()['id']
+
+    def create_review(self, headers, place_id=None, text='Lovely stay, would come back'):
+        """Review a place through the API, return the response"""
+        return self.client.post(f'/api/v1/places/{place_id or self.place_id}/reviews',
+                                json={"text": text, "rating": 4}, headers=headers)
+
+    def test_list_pagination(self):
+        place_ids = {self.place_id, self.create_place('Cabin'), self.create_place('Villa')}
+        response = self.client.get('/api/v1/places/?limit=2')
+        self.assertEqual(response.status_code, 200)
+        first = response.get_json()
+        self.assertEqual(len(first['items']), 2)
+        self.assertIsNotNone(first['next_cursor'])
+
+        response = self.client.get(f"/api/v1/places/?limit=2&cursor={first['next_cursor']}")
+        self.assertEqual(response.status_code, 200)
+        second = response.get_json()
+        self.assertEqual(len(second['items']), 1)
+        self.assertIsNone(second['next_cursor'])
+        seen = [place['id'] for place in first['items'] + second['items']]
+        self.assertEqual(set(seen), place_ids)
+        self.assertEqual(len(seen), len(place_ids))
+
+    def test_list_limit_bounds(self):
+        for limit in ('0', '201', 'ten'):
+            with self.subTest(limit=limit):
+                response = self.client.get(f'/api/v1/places/?limit={limit}')
+                self.assertEqual(response.status_code, 400)
+        response = self.client.get('/api/v1/places/?limit=200')
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_malformed_cursor(self):
+        for cursor in ('not-base64!', 'e30=', 'WzEsMl0='):  # garbage, {}, [1,2]
+            with self.subTest(cursor=cursor):
+                response = self.client.get(f'/api/v1/places/?cursor={cursor}')
+                self.assertEqual(response.status_code, 400)
+
+    def test_list_not_modified(self):
+        response = self.client.get('/api/v1/places/')
+        etag = response.headers['ETag']
+        response.close()
+        response = self.client.get('/api/v1/places/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        # The cursor is validated before the ETag is compared
+        response = self.client.get('/api/v1/places/?cursor=e30=', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 400)
+
+        self.create_place('Cabin')
+        response = self.client.get('/api/v1/places/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.headers['ETag'], etag)
+        self.assertEqual(len(response.get_json()['items']), 2)
+
+    def test_list_etag_changes_on_amenity_delete(self):
+        self.create_admin('admin@example.com')
+        admin = self.login('admin@example.com')
+        response = self.client.post('/api/v1/amenities/', json={"name": "WiFi"}, headers=admin)
+        amenity_id = response.get_json()['id']
+        # Newer amenity: the deletion leaves the latest amenity updated_at as is
+        self.client.post('/api/v1/amenities/', json={"name": "Pool"}, headers=admin)
+        self.create_place('Cabin', amenities=[amenity_id])
+        response = self.client.get('/api/v1/places/')
+        etag = response.headers['ETag']
+        response.close()
+
+        response = self.client.delete(f'/api/v1/amenities/{amenity_id}', headers=admin)
+        self.assertEqual(response.status_code, 204)
+        response = self.client.get('/api/v1/places/', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        for place in response.get_json()['items']:
+            self.assertEqual(place['amenities'], [])
+
+    def test_place_not_modified(self):
+        response = self.client.get(f'/api/v1/places/{self.place_id}')
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers['ETag']
+        response = self.client.get(f'/api/v1/places/{self.place_id}',
+                                   headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        # A new review changes the place response
+        self.assertEqual(self.create_review(self.other).status_code, 201)
+        response = self.client.get(f'/api/v1/places/{self.place_id}',
+                                   headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()['reviews']), 1)
+
+    def test_create_review_checks(self):
+        # Own place, unknown place, then a second review of the same place
+        self.assertEqual(self.create_review(self.owner).status_code, 403)
+        self.assertEqual(self.create_review(self.other, place_id='missing-id').status_code, 404)
+        self.assertEqual(self.create_review(self.other).status_code, 201)
+        self.assertEqual(self.create_review(self.other).status_code, 409)
+        # Body validated before any database check
+        response = self.client.post(f'/api/v1/places/{self.place_id}/reviews',
+                                    json={"text": "Too short", "rating": 4}, headers=self.other)
+        self.assertEqual(response.status_code, 400)
+
+    def test_update_place_minimal(self):
+        response = self.client.put(f'/api/v1/places/{self.place_id}', json={"price": 80.0},
+                                   headers=dict(self.owner, Prefer='return=minimal'))
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response.data, b'')
+        self.assertEqual(response.headers['Preference-Applied'], 'return=minimal')
+        response = self.client.get(f'/api/v1/places/{self.place_id}')
+        self.assertEqual(response.get_json()['price'], 80.0)
+
+    def test_place_reviews_endpoint(self):
+        self.assertEqual(self.create_review(self.other).status_code, 201)
+        response = self.client.get('/api/v1/places/')
+        self.assertNotIn('reviews', response.get_json()['items'][0])
+        response = self.client.get(f'/api/v1/places/{self.place_id}/reviews')
+        self.assertEqual(response.status_code, 200)
+        reviews = response.get_json()
+        self.assertEqual(len(reviews), 1)
+        self.assertEqual(reviews[0]['text'], 'Lovely stay, would come back')
+        response = self.client.get('/api/v1/places/missing-id/reviews')
+        self.assertEqual(response.status_code, 404)
+
+    def test_preflight_without_token(self):
+        for path in ('/api/v1/places/', f'/api/v1/places/{self.place_id}'):
+            with self.subTest(path=path):
+                response = self.client.options(path, headers={
+                    'Origin': 'http://localhost:8000',
+                    'Access-Control-Request-Method': 'PUT'
+                })
+                self.assertEqual(response.status_code, 200)
+
+    def test_update_place_guarded(self):
+        response = self.client.put(f'/api/v1/places/{self.place_id}',
+                                   json={"title": "Mine now"}, headers=self.other)
+        self.assertEqual(response.status_code, 403)
+        response = self.client.put('/api/v1/places/missing-id',
+                                   json={"title": "Nowhere"}, headers=self.owner)
+        self.assertEqual(response.status_code, 404)
+        response = self.client.put(f'/api/v1/places/{self.place_id}',
+                                   json={"title": "Big loft"}, headers=self.owner)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['title'], 'Big loft')
+
+    def test_delete_place_guarded(self):
+        response = self.client.delete(f'/api/v1/places/{self.place_id}', headers=self.other)
+        self.assertEqual(response.status_code, 403)
+        response = self.client.delete(f'/api/v1/places/{self.place_id}', headers=self.owner)
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(response.data, b'')
+        response = self.client.delete(f'/api/v1/places/{self.place_id}', headers=self.owner)
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(f'/api/v1/places/{self.place_id}')
+        self.assertEqual(response.status_code, 404)
+
+    def test_review_update_and_delete_guarded(self):
+        review_id = self.create_review(self.other).get_json()['id']
+        response = self.client.put(f'/api/v1/{review_id}',
+                                   json={"text": "Not my review at all"}, headers=self.owner)
+        self.assertEqual(response.status_code, 403)
+        response = self.client.put('/api/v1/missing-id',
+                                   json={"text": "Nothing to update here"}, headers=self.other)
+        self.assertEqual(response.status_code, 404)
+        response = self.client.put(f'/api/v1/{review_id}',
+                                   json={"text": "Even better the second time"}, headers=self.other)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['text'], 'Even better the second time')
+
+        response = self.client.delete(f'/api/v1/{review_id}', headers=self.owner)
+        self.assertEqual(response.status_code, 403)
+        response = self.client.delete(f'/api/v1/{review_id}', headers=self.other)
+        self.assertEqual(response.status_code, 204)
+        response = self.client.delete(f'/api/v1/{review_id}', headers=self.other)
+        self.assertEqual(response.status_code, 404)
+
+
+class TestReviewEndpoints(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # One place reviewed by three users
+        with self.app.app_context():
+            owner = User('Olive', 'Owner', 'owner@example.com', 'password123')
+            db.session.add(owner)
+            db.session.flush()
+            place = Place('Loft', 'Bright loft', 100.0, 48.85, 2.35, owner.id)
+            db.session.add(place)
+            for index in range(3):
+                user = User('Rita', f'Reviewer{index}', f'rita{index}@example.com', 'password123')
+                db.session.add(user)
+                db.session.flush()
+                db.session.add(Review(place.id, user.id, 'Lovely stay, would come back', 4))
+            db.session.commit()
+
+    def test_list_reviews_query_count(self):
+        # User and place are joined in: the query count does not grow with
+        # the number of reviews, and raiseload (debug) rejects any lazy load
+        statements = []
+
+        def count(*args):
+            statements.append(args[2])
+
+        with self.app.app_context():
+            event.listen(db.engine, 'before_cursor_execute', count)
+            try:
+                response = self.client.get('/api/v1/')
+            finally:
+                event.remove(db.engine, 'before_cursor_execute', count)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.get_json(), list)
+        self.assertEqual(len(response.get_json()), 3)
+        self.assertLessEqual(len(statements), 3)
+
+
+class TestFastValidation(unittest.TestCase):
+    """The compiled fast check must agree with jsonschema on the request models"""
+
+    REQUEST_MODELS = (
+        user_model, user_update_model, admin_update_model, place_model,
+        review_model, review_update_model, review_create_model,
+        amenity_model, login_model,
+    )
+
+    def assertAgrees(self, model, payloads):
+        fast_check = _compile_fast_check(model.__schema__)
+        validator = _build_validator(model, None, None)
+        for payload in payloads:
+            with self.subTest(model=model.name, payload=payload):
+                expected = not any(validator.iter_errors(payload))
+                self.assertEqual(fast_check(payload), expected)
+
+    def test_request_models_compile(self):
+        for model in self.REQUEST_MODELS:
+            with self.subTest(model=model.name):
+                self.assertIsNotNone(_compile_fast_check(model.__schema__))
+
+    def test_integer_property(self):
+        valid = {'text': 'Lovely stay, really', 'rating': 5}
+        self.assertAgrees(review_create_model, [
+            valid,
+            dict(valid, rating=5.0),
+            dict(valid, rating=4.5),
+            dict(valid, rating=True),
+            dict(valid, rating='5'),
+            dict(valid, rating=0),
+            dict(valid, rating=6),
+            dict(valid, rating=None),
+        ])
+
+    def test_number_property(self):
+        valid = {'title': 'Loft', 'price': 100.0, 'latitude': 48.85,
+                 'longitude': 2.35, 'owner_id': 'abc'}
+        self.assertAgrees(place_model, [
+            valid,
+            dict(valid, price=100),
+            dict(valid, price=True),
+            dict(valid, latitude=False),
+            dict(valid, price='100'),
+            dict(valid, amenities=['a', 'b']),
+            dict(valid, amenities=['a', 1]),
+            dict(valid, amenities='a'),
+        ])
+        self.assertAgrees(review_model, [
+            {'text': 'Nice', 'rating': 4, 'user_id': 'u', 'place_id': 'p'},
+            {'text': 'Nice', 'rating': False, 'user_id': 'u', 'place_id': 'p'},
+        ])
+
+    def test_string_constraints(self):
+        self.assertAgrees(amenity_model, [
+            {'name': 'Wifi'},
+            {'name': ''},
+            {'name': '   '},
+            {'name': ' Pool '},
+            {'name': 1},
+        ])
+        self.assertAgrees(review_create_model, [
+            {'text': 'x' * 9, 'rating': 3},
+            {'text': 'x' * 10, 'rating': 3},
+            {'text': 'é' * 10, 'rating': 3},
+        ])
+
+    def test_required_keys(self):
+        self.assertAgrees(login_model, [
+            {'email': 'a@example.com', 'password': 'secret'},
+            {'email': 'a@example.com'},
+            {'password': 'secret'},
+            {},
+            {'email': 'a@example.com', 'password': 'secret', 'extra': 1},
+        ])
+        self.assertAgrees(admin_update_model, [{}, {'email': 1}])
+
+    def test_non_object_payload(self):
+        self.assertAgrees(user_model, [None, [], 'user', 1])
\ No newline at end of file
@@ -295,12 +295,23 @@ async function loadPlaces() {
     placesContainer.innerHTML = 'Loading places...';
 
     try {
-        const response = await fetch(`${API_BASE_URL}/places`);
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
-        }
+        // The API returns places page by page ({items, next_cursor}):
+        // follow next_cursor until the last page to get every place
+        const places = [];
+        let cursor = null;
+        do {
+            let url = `${API_BASE_URL}/places/?limit=200`;
+            if (cursor) url += `&cursor=${encodeURIComponent(cursor)}`;
+            const response = await fetch(url);
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            const page = await response.json();
+            places.push(...page.items);
+            cursor = page.next_cursor;
+        } while (cursor);
         
-        allPlaces = await response.json();
+        allPlaces = places;
         
         setupPriceFilter();
 